@@ -0,0 +1,85 @@
+"""
+Pool-wide dashboard analytics: recomputing skill, education and sentiment counts from
+every Resume row per request, against reading the incrementally maintained counters.
+Also reports the backfill (rebuild) time and the per-save maintenance cost.
+
+    python -m benchmarks.bench_analytics [--rows 200000]
+"""
+import argparse
+import random
+import time
+from collections import Counter
+
+from benchmarks.common import fill_resumes, measure, report, setup_test_database
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    setup_test_database()
+    from django.db.models.signals import post_delete, post_save, pre_save
+
+    from resume_screening import analytics
+    from resume_screening.models import Resume
+
+    started = time.perf_counter()
+    fill_resumes(args.rows)
+    print(f"{args.rows} resumes inserted in {time.perf_counter() - started:.1f} s")
+
+    def recompute():
+        # The dashboard's previous approach, applied to the whole pool instead of the top 10
+        skills, education, sentiments = Counter(), Counter(), Counter()
+        for row_education, row_sentiment, row_skills in Resume.objects.values_list(
+            "education", "sentiment", "skills"
+        ).iterator(chunk_size=2000):
+            skills.update(row_skills.split(", "))
+            education[row_education] += 1
+            sentiments[row_sentiment] += 1
+        return skills.most_common(10), education, sentiments
+
+    recompute_time = measure(recompute, repeat=2)
+    report("recompute from Resume rows", recompute_time)
+
+    started = time.perf_counter()
+    analytics.rebuild()
+    print(f"rebuild_analytics backfill: {time.perf_counter() - started:.1f} s")
+
+    report("read counters (analytics.summary)", measure(analytics.summary, repeat=5, number=100), baseline=recompute_time)
+
+    resume = Resume.objects.order_by("pk").first()
+    skill_sets = ["Python, SQL, Docker", "Java, Spring, Kubernetes, AWS", "Excel, Communication"]
+
+    def save_resume():
+        resume.skills = random.choice(skill_sets)
+        resume.sentiment = random.choice(analytics.SENTIMENTS)
+        resume.ranking_score = random.uniform(0, 100)
+        resume.save()
+
+    with_counters = measure(save_resume, repeat=5, number=50)
+    receivers = [
+        (signal, receiver) for signal, receiver in (
+            (pre_save, analytics.resume_pre_save), (post_save, analytics.resume_post_save),
+            (post_delete, analytics.resume_post_delete),
+        )
+    ]
+    for signal, receiver in receivers:
+        signal.disconnect(receiver, sender=Resume, dispatch_uid=f"analytics_{receiver.__name__}")
+    without_counters = measure(save_resume, repeat=5, number=50)
+    analytics.connect_signals()
+    analytics.rebuild()  # The disconnected saves were not counted
+    report("Resume.save() without counters", without_counters)
+    report("Resume.save() with counters", with_counters)
+
+    skills, education, sentiments = recompute()
+    pool = analytics.summary()
+    assert pool["total"] == args.rows
+    assert [count for _, count in pool["skills"]] == [count for _, count in skills]
+    assert pool["education"] == dict(education)
+    assert pool["sentiments"] == dict(sentiments)
+    print("counters match a full recomputation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Pickled RandomForestRegressor against the flattened, memory-mapped .npy forest and the
+score lookup table: load time, memory and prediction latency for one row and for a
+batch. Trains the same 100-tree model as m1_model.py in a temporary directory, so no
+checked-in artifact is needed.
+
+    python -m benchmarks.bench_forest
+"""
+import os
+import pickle
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from benchmarks.common import BASE_DIR, measure, report
+from resume_screening.forest import FlatForest
+from resume_screening.score_table import ScoreTable
+
+FEATURE_COLUMNS = ["education", "experience", "skills"]
+
+
+def load_cost(load):
+    elapsed = measure(load, repeat=5)
+    tracemalloc.start()
+    model = load()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return model, elapsed, peak
+
+
+def main():
+    df = pd.read_csv(os.path.join(BASE_DIR, "resume_ranking_dataset.csv"))
+    model = RandomForestRegressor(n_estimators=100, random_state=42).fit(df[FEATURE_COLUMNS], df["ranking_score"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, "model.pkl")
+        forest_path = os.path.join(tmp, "model.npy")
+        with open(pickle_path, "wb") as f:
+            pickle.dump(model, f)
+        FlatForest.from_sklearn(model).save(forest_path)
+
+        def load_pickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        pickled, pickle_time, pickle_peak = load_cost(load_pickle)
+        _, copy_time, copy_peak = load_cost(lambda: FlatForest.load(forest_path, mmap=False))
+        forest, forest_time, forest_peak = load_cost(lambda: FlatForest.load(forest_path))
+        print(f"pickle {os.path.getsize(pickle_path) / 2**20:.1f} MiB on disk, "
+              f"npy {os.path.getsize(forest_path) / 2**20:.1f} MiB on disk")
+        report(f"load pickle (peak {pickle_peak / 2**20:.1f} MiB)", pickle_time)
+        report(f"load npy, read (peak {copy_peak / 2**20:.1f} MiB)", copy_time, baseline=pickle_time)
+        report(f"load npy, mmap (peak {forest_peak / 2**20:.2f} MiB)", forest_time, baseline=pickle_time)
+
+    row = [2, 6.0, 5]
+    single = measure(lambda: pickled.predict(pd.DataFrame([row], columns=FEATURE_COLUMNS)), repeat=5, number=20)
+    report("predict 1 row, sklearn + DataFrame", single)
+    report("predict 1 row, flat forest", measure(lambda: forest.predict([row]), repeat=5, number=20), baseline=single)
+    table = ScoreTable.build(forest.predict, (3, 40, 60))
+    report("predict 1 row, score table", measure(lambda: table.predict([row], forest.predict), repeat=5, number=20),
+           baseline=single)
+
+    batch = df[FEATURE_COLUMNS].to_numpy(dtype=float)
+    frame = pd.DataFrame(batch, columns=FEATURE_COLUMNS)
+    sklearn_batch = measure(lambda: pickled.predict(frame), repeat=5)
+    report(f"predict {len(batch)} rows, sklearn", sklearn_batch)
+    report(f"predict {len(batch)} rows, flat forest", measure(lambda: forest.predict(batch), repeat=5),
+           baseline=sklearn_batch)
+    report(f"predict {len(batch)} rows, score table", measure(lambda: table.predict(batch, forest.predict), repeat=5),
+           baseline=sklearn_batch)
+
+    grid = np.array([[e, x, s] for e in range(4) for x in range(41) for s in range(31)], dtype=float)
+    for name, rows in (("dataset", batch), ("input grid", grid)):
+        expected = pickled.predict(pd.DataFrame(rows, columns=FEATURE_COLUMNS))
+        same = np.array_equal(expected, forest.predict(rows)) and np.array_equal(expected, table.predict(rows, forest.predict))
+        print(f"identical predictions on {name} ({len(rows)} rows): {same}")
+        assert same
+
+
+if __name__ == "__main__":
+    main()
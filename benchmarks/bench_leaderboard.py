@@ -0,0 +1,79 @@
+"""
+ranking_chart / analytics_dashboard data access on a large Resume table: the previous
+per-request ORDER BY queries without and with the new indexes, against the in-memory
+leaderboard. Builds a throwaway test database.
+
+    python -m benchmarks.bench_leaderboard [--rows 1000000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.common import fill_resumes, measure, report, setup_test_database
+
+EXCLUDED_NAMES = ["Unknown", "Candidate", "Not Provided", ""]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup_test_database()
+    from django.db import connection
+
+    from resume_screening import leaderboard
+    from resume_screening.models import Resume
+
+    started = time.perf_counter()
+    fill_resumes(args.rows)
+    print(f"{args.rows} resumes inserted in {time.perf_counter() - started:.1f} s")
+
+    def legacy_requests():
+        # What ranking_chart and analytics_dashboard queried on every request
+        list(Resume.objects.exclude(name__in=EXCLUDED_NAMES).order_by("-ranking_score")[:10])
+        Resume.objects.latest("uploaded_at")
+        list(Resume.objects.all().order_by("-ranking_score")[:10])
+
+    indexes = Resume._meta.indexes
+    with connection.schema_editor() as editor:
+        for index in indexes:
+            editor.remove_index(Resume, index)
+    unindexed = measure(legacy_requests, repeat=3)
+    report("per-request queries, no indexes", unindexed)
+
+    with connection.schema_editor() as editor:
+        for index in indexes:
+            editor.add_index(Resume, index)
+    indexed = measure(legacy_requests, repeat=5, number=10)
+    report("per-request queries, indexed", indexed, baseline=unindexed)
+
+    board = leaderboard.get_board()
+    reload_time = measure(board.load, repeat=5)
+    report("leaderboard reload (cold start)", reload_time, baseline=unindexed)
+
+    def cached_requests():
+        leaderboard.top(10, set(EXCLUDED_NAMES))
+        leaderboard.latest()
+        leaderboard.top(10)
+
+    cached_requests()
+    cached = measure(cached_requests, repeat=5, number=1000)
+    report("leaderboard, cached", cached, baseline=unindexed)
+
+    resume = Resume.objects.order_by("-ranking_score").first()
+
+    def save_with_update():
+        resume.ranking_score = random.uniform(90, 100)
+        resume.save()
+
+    report("Resume.save() incl. leaderboard update", measure(save_with_update, repeat=5, number=100))
+
+    expected = [row.id for row in Resume.objects.exclude(name__in=EXCLUDED_NAMES).order_by("-ranking_score", "-id")[:10]]
+    assert [entry["id"] for entry in leaderboard.top(10, set(EXCLUDED_NAMES))] == expected
+    assert leaderboard.latest()["id"] == Resume.objects.order_by("-uploaded_at", "-id").first().id
+    print("leaderboard matches the database")
+
+
+if __name__ == "__main__":
+    main()
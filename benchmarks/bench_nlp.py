@@ -0,0 +1,73 @@
+"""
+Startup and per-resume cost of the spaCy pipeline: the old eager double load against the
+lazy shared provider, and "full" against "fast" NLP mode.
+
+    python -m benchmarks.bench_nlp
+"""
+import os
+import subprocess
+import sys
+
+from benchmarks.common import BASE_DIR, measure, report, resume_texts
+
+SETUP = (
+    "import os, django; os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'resume_screening_system.settings'); "
+    "django.setup(); "
+)
+
+# What importing views used to cost: parser.py and skills.py each loaded the full pipeline
+EAGER = "import spacy; spacy.load('en_core_web_sm'); spacy.load('en_core_web_sm')"
+LAZY = SETUP + "import resume_screening.views"
+LAZY_FIRST_USE = LAZY + "; from resume_screening.nlp import get_nlp; get_nlp()"
+
+PROBE = (
+    "import resource, sys, time; start = time.perf_counter(); {code}; "
+    "sys.stdout.write('%f %d' % (time.perf_counter() - start, "
+    "resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))"
+)
+
+
+def probe(code):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code)], cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    seconds, max_rss_kb = result.stdout.split()[-2:]
+    return float(seconds), int(max_rss_kb)
+
+
+def main():
+    print("Startup (fresh interpreter)")
+    for label, code in (("eager: two spacy.load()", EAGER), ("lazy: import views", LAZY),
+                        ("lazy: import views + first NLP use", LAZY_FIRST_USE)):
+        measured = probe(code)
+        if measured is None:
+            print(f"  {label:<38} failed (is en_core_web_sm installed?)")
+            continue
+        seconds, max_rss_kb = measured
+        print(f"  {label:<38} {seconds * 1000:10.1f} ms {max_rss_kb / 1024:10.1f} MiB max RSS")
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_screening_system.settings")
+    import django
+    django.setup()
+    from django.test import override_settings
+    from resume_screening.parser import extract_features
+
+    texts = resume_texts()
+    print(f"Per-resume latency ({len(texts)} resumes)")
+    with override_settings(RESUME_SCREENING_NLP_MODE="fast"):
+        fast = measure(lambda: [extract_features(text) for text in texts], repeat=5) / len(texts)
+    try:
+        with override_settings(RESUME_SCREENING_NLP_MODE="full"):
+            full = measure(lambda: [extract_features(text) for text in texts], repeat=3) / len(texts)
+    except OSError as e:
+        print(f"  full mode unavailable: {e}")
+        report("  fast mode", fast)
+        return
+    report("  full mode", full)
+    report("  fast mode", fast, baseline=full)
+
+
+if __name__ == "__main__":
+    main()
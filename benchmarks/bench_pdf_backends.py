@@ -0,0 +1,57 @@
+"""
+Every PDF backend available here on the bundled resumes and a large synthetic PDF:
+time per document, plus how often the extracted fields (name, email, phone, skills)
+agree with the pdfminer reference.
+
+    python -m benchmarks.bench_pdf_backends
+"""
+import os
+import tempfile
+
+from benchmarks.common import measure, report, resume_paths, synthetic_pdf
+
+FIELDS = ("name", "email", "phone", "skills")
+
+
+def main():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_screening_system.settings")
+    import django
+    django.setup()
+
+    from resume_screening.parser import extract_features
+    from resume_screening.pdf_extract import available_backends, extract_pdf, get_backend
+
+    paths = resume_paths()
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(synthetic_pdf(50))
+        synthetic = f.name
+
+    def fields(path, backend):
+        features = extract_features(extract_pdf(path, backend=backend).text)
+        features["skills"] = sorted(features["skills"].split(", "))
+        return {field: features[field] for field in FIELDS}
+
+    reference = get_backend("pdfminer")
+    expected = [fields(path, reference) for path in paths]
+    print(f"auto selects: {get_backend('auto').name}; available: {', '.join(available_backends())}")
+
+    baseline = {}  # pdfminer timings, which the other backends are compared against
+    for name in sorted(available_backends(), key=lambda name: name != "pdfminer"):
+        backend = get_backend(name)
+        print(name)
+        for label, documents in ((f"{len(paths)} resumes, per document", paths), ("50-page synthetic PDF", [synthetic])):
+            seconds = measure(lambda: [extract_pdf(path, backend=backend) for path in documents], repeat=3)
+            seconds /= len(documents)
+            baseline.setdefault(label, seconds)
+            report(f"  {label}", seconds, baseline=baseline[label])
+
+        got = [fields(path, backend) for path in paths]
+        agreement = ", ".join(
+            f"{field} {sum(g[field] == e[field] for g, e in zip(got, expected))}/{len(paths)}" for field in FIELDS
+        )
+        print(f"  agreement with pdfminer: {agreement}")
+    os.unlink(synthetic)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Whole-document pdfminer extraction against the streaming, limit-bounded extractor on
+large synthetic PDFs: wall time, plus peak Python memory with --memory (tracemalloc
+slows pdfminer down several times, so timings and memory are measured in separate runs).
+
+    python -m benchmarks.bench_pdf_extract [--memory]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.common import report, synthetic_pdf
+
+FIRST_PAGE = ["Jane Doe", "jane.doe@example.com", "Phone: 9876543210", "Masters, 6 years experience",
+              "Skills: Python, SQL, Machine Learning, Docker"]
+
+
+def profile(func, memory=False):
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if memory else 0
+    if memory:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def describe(label, peak):
+    return f"{label}, peak {peak / 2**20:.1f} MiB" if peak else label
+
+
+def main():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_screening_system.settings")
+    from pdfminer.high_level import extract_text
+    from resume_screening.pdf_extract import extract_pdf, get_backend
+
+    memory = "--memory" in sys.argv
+    pdfminer = get_backend("pdfminer")  # Same engine as extract_text, so the outputs are comparable
+    for pages in (10, 100, 300):
+        pdf = synthetic_pdf(pages, first_page=FIRST_PAGE)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(pdf)
+            path = f.name
+        print(f"{pages} pages ({len(pdf) / 1024:.0f} KiB)")
+
+        # What upload_resume used to do: read the whole upload into memory, then parse every page
+        def legacy():
+            with open(path, "rb") as upload:
+                return extract_text(io.BytesIO(upload.read()))
+
+        text, legacy_time, legacy_peak = profile(legacy, memory)
+        report(describe("  extract_text (all pages)", legacy_peak), legacy_time)
+
+        for label, limits in (("streamed, no limits", {}),
+                              ("streamed, 5 pages", {"max_pages": 5}),
+                              ("streamed, 20k chars", {"max_chars": 20_000}),
+                              ("streamed, 0.2 s budget", {"time_budget": 0.2})):
+            result, elapsed, peak = profile(lambda: extract_pdf(path, backend=pdfminer, **limits), memory)
+            report(describe(f"  {label} [{result.status}, {result.pages}p]", peak), elapsed, baseline=legacy_time)
+            assert text.startswith(result.text)
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Result page, ranking chart and dashboard data through the test client: built with an
+empty response cache, served from the versioned cache, and answered 304 Not Modified for
+a client with a current copy (the per-request client and view overhead is included).
+
+    python -m benchmarks.bench_responses [--rows 10000]
+"""
+import argparse
+import tempfile
+import time
+
+from benchmarks.common import fill_resumes, measure, report, setup_test_database
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    setup_test_database()
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test import Client
+
+    from resume_screening import analytics
+    from resume_screening.models import JobDescription, Resume
+
+    settings.RESUME_SCREENING_VECTOR_INDEX = tempfile.mkdtemp()
+    started = time.perf_counter()
+    fill_resumes(args.rows)
+    analytics.rebuild()
+    JobDescription.objects.create(title="Data Engineer", description="Python, SQL, Spark and Airflow pipelines")
+    print(f"{args.rows} resumes inserted and indexed in {time.perf_counter() - started:.1f} s")
+
+    resume = Resume.objects.order_by("-ranking_score").first()
+    client = Client()
+    client.get(f"/result/{resume.pk}/")  # Materializes the skills gap of this bulk-inserted row
+
+    for label, url in (
+        ("result page", f"/result/{resume.pk}/"),
+        ("ranking chart", "/ranking_chart/"),
+        ("dashboard data", "/analytics_dashboard/"),
+    ):
+        print(label)
+
+        def uncached():
+            cache.clear()
+            assert client.get(url).status_code == 200
+
+        baseline = measure(uncached, repeat=3, number=20)
+        report("  response cache empty", baseline)
+        etag = client.get(url)["ETag"]
+        report("  cached", measure(lambda: client.get(url), repeat=3, number=50), baseline)
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        report("  304 Not Modified", measure(lambda: client.get(url, HTTP_IF_NONE_MATCH=etag), repeat=3, number=50),
+               baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Role recommendation at production-sized role catalogues: the previous per-role list
+loop against the sparse role matrix.
+
+    python -m benchmarks.bench_role_matrix
+"""
+import random
+
+from benchmarks.common import measure, report
+from resume_screening.role_matrix import RoleMatrix
+
+VOCABULARY_SIZE = 2000
+CANDIDATE_SKILLS = 12
+
+
+def legacy_recommend(job_roles, skills):
+    # The loop recommend_job_roles used before the role matrix
+    recommended_roles = []
+    missing_skills = {}
+    for role, required_skills in job_roles.items():
+        required_skills_lower = [skill.lower() for skill in required_skills]
+        matched_skills = [skill for skill in skills if skill in required_skills_lower]
+        if matched_skills:
+            recommended_roles.append(role)
+            missing = [skill for skill in required_skills_lower if skill not in skills]
+            if missing:
+                missing_skills[role] = missing
+    return recommended_roles, missing_skills
+
+
+def synthetic_roles(n_roles, rng):
+    return [rng.sample(range(VOCABULARY_SIZE), rng.randint(3, 15)) for _ in range(n_roles)]
+
+
+def main():
+    rng = random.Random(42)
+    vocabulary = [f"skill{i}" for i in range(VOCABULARY_SIZE)]
+    candidate_ids = rng.sample(range(VOCABULARY_SIZE), CANDIDATE_SKILLS)
+    candidate_names = [vocabulary[i] for i in candidate_ids]
+
+    for n_roles in (1_000, 10_000, 100_000):
+        role_skill_ids = synthetic_roles(n_roles, rng)
+        roles = [f"role{i}" for i in range(n_roles)]
+        job_roles = {role: [vocabulary[i] for i in ids] for role, ids in zip(roles, role_skill_ids)}
+
+        print(f"{n_roles} roles x {VOCABULARY_SIZE} skills")
+        build = measure(lambda: RoleMatrix(roles, role_skill_ids, VOCABULARY_SIZE), repeat=3)
+        report("  matrix build (once per taxonomy)", build)
+        matrix = RoleMatrix(roles, role_skill_ids, VOCABULARY_SIZE)
+
+        legacy = measure(lambda: legacy_recommend(job_roles, candidate_names), repeat=3)
+        report("  legacy loop", legacy)
+        vectorized = measure(lambda: matrix.top_roles(candidate_ids, k=5), repeat=5, number=10)
+        report("  role matrix top-5", vectorized, baseline=legacy)
+
+        batch = [matrix.encode(rng.sample(range(VOCABULARY_SIZE), CANDIDATE_SKILLS)) for _ in range(100)]
+        batched = measure(lambda: matrix.coverage(batch), repeat=3)
+        report("  role matrix, 100 candidates batched", batched / 100, baseline=legacy)
+
+
+if __name__ == "__main__":
+    main()
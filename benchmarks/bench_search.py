@@ -0,0 +1,71 @@
+"""
+Skill search ("has all of these skills, none of those", best ranked first, paginated):
+scanning and parsing every Resume.skills string against the ResumeSkill posting lists.
+
+    python -m benchmarks.bench_search [--rows 100000]
+"""
+import argparse
+import time
+
+from benchmarks.common import fill_resumes, measure, report, setup_test_database
+
+PER_PAGE = 20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup_test_database()
+    from resume_screening import analytics, search
+    from resume_screening.models import AnalyticsCounter, Resume
+
+    started = time.perf_counter()
+    fill_resumes(args.rows)
+    analytics.rebuild()
+    print(f"{args.rows} resumes inserted and indexed in {time.perf_counter() - started:.1f} s")
+
+    by_popularity = list(
+        AnalyticsCounter.objects.filter(dimension=AnalyticsCounter.SKILL).order_by("-count").values_list("value", flat=True)
+    )
+    common, second, third = (name.lower() for name in by_popularity[:3])
+    rare = by_popularity[len(by_popularity) // 2].lower()
+    queries = [
+        ("2 common skills", [common, second], [], 1),
+        ("2 common skills, 1 excluded", [common, second], [third], 1),
+        ("2 common skills, page 50", [common, second], [], 50),
+        ("rare + common skill", [rare, common], [], 1),
+        ("exclusions only", [], [common, second], 1),
+    ]
+
+    def scan(required, excluded, page):
+        # Without the relation: read every row, parse the skills string, sort the matches
+        matches = []
+        for resume_id, score, skills in Resume.objects.values_list("id", "ranking_score", "skills").iterator(
+            chunk_size=5000
+        ):
+            names = {name.strip().lower() for name in (skills or "").split(",")}
+            if all(name in names for name in required) and not any(name in names for name in excluded):
+                matches.append((score is None, -(score or 0.0), -resume_id, resume_id))
+        matches.sort()
+        return [match[-1] for match in matches[(page - 1) * PER_PAGE:page * PER_PAGE]], len(matches)
+
+    for label, required, excluded, page in queries:
+        expected, total = scan(required, excluded, page)
+        result = search.search(required, excluded, page=page, per_page=PER_PAGE)
+        assert [row["id"] for row in result["results"]] == expected and result["total"] == total, label
+        print(f"{label}: {total} matches")
+        baseline = measure(lambda: scan(required, excluded, page), repeat=2)
+        report("  scan + parse Resume.skills", baseline)
+        report("  posting lists, page + count",
+               measure(lambda: search.search(required, excluded, page=page, per_page=PER_PAGE), repeat=5, number=5),
+               baseline=baseline)
+        report("  posting lists, page only",
+               measure(lambda: list(search.matching_ids(required, excluded)[(page - 1) * PER_PAGE:page * PER_PAGE]),
+                       repeat=5, number=5),
+               baseline=baseline)
+
+
+if __name__ == "__main__":
+    main()
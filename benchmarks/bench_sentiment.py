@@ -0,0 +1,50 @@
+"""
+Compares the lexicon sentiment scorer against TextBlob: time per resume, and how often
+the Positive/Neutral/Negative label agrees (whole resumes and their individual lines).
+
+    python -m benchmarks.bench_sentiment
+"""
+import os
+import sys
+
+from benchmarks.common import measure, report, resume_texts
+
+# Minimum share of labels that must match TextBlob's
+AGREEMENT_THRESHOLD = 0.9
+
+
+def main():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_screening_system.settings")
+    from textblob import TextBlob
+    from resume_screening.sentiment import SentimentLexicon, default_lexicon_path, label, sentiment_labels
+    from resume_screening.skill_matcher import tokenize
+
+    texts = resume_texts()
+    lines = [line for text in texts for line in text.split("\n") if len(line.split()) > 3]
+    token_lists = [tokenize(text) for text in texts]
+    print(f"{len(texts)} resumes, {len(lines)} lines of 4+ words")
+
+    report("lexicon load (once per process)", measure(lambda: SentimentLexicon.from_xml(default_lexicon_path()), repeat=3))
+    textblob = measure(lambda: [TextBlob(text).sentiment.polarity for text in texts], repeat=3) / len(texts)
+    report("TextBlob, per resume", textblob)
+    lexicon = measure(lambda: sentiment_labels(token_lists), repeat=5, number=10) / len(texts)
+    report("lexicon on parser tokens, per resume", lexicon, baseline=textblob)
+    tokenized = measure(lambda: sentiment_labels([tokenize(text) for text in texts]), repeat=5, number=10) / len(texts)
+    report("lexicon including tokenization", tokenized, baseline=textblob)
+
+    failed = False
+    for name, corpus in (("resumes", texts), ("lines", lines)):
+        expected = [label(TextBlob(text).sentiment.polarity) for text in corpus]
+        got = sentiment_labels([tokenize(text) for text in corpus])
+        agreement = sum(a == b for a, b in zip(got, expected)) / len(corpus)
+        print(f"label agreement with TextBlob ({name}): {agreement:.1%}")
+        for text, a, b in zip(corpus, got, expected):
+            if a != b:
+                print(f"  lexicon {a}, TextBlob {b}: {text[:60]!r}")
+        failed |= agreement < AGREEMENT_THRESHOLD
+    if failed:
+        sys.exit(f"agreement below {AGREEMENT_THRESHOLD:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares the compiled skill matcher against the previous per-token list scan.
+
+    python -m benchmarks.bench_skill_matcher
+"""
+import spacy
+
+from benchmarks.common import measure, report, resume_texts
+from resume_screening.skill_matcher import SkillMatcher
+from resume_screening.taxonomy import DEFAULT_TAXONOMY_PATH, load_taxonomy
+
+
+def legacy_extract(doc, predefined_skills):
+    # The loop extract_features used before the matcher: rebuilds the lowercase list per token
+    extracted_skills = set()
+    for token in doc:
+        if token.text.lower() in [skill.lower() for skill in predefined_skills]:
+            extracted_skills.add(token.text.lower())
+    return extracted_skills
+
+
+def main():
+    texts = resume_texts()
+    # A blank English pipeline tokenizes exactly like en_core_web_sm without loading weights
+    tokenizer = spacy.blank("en")
+    docs = [tokenizer(text) for text in texts]
+    taxonomy = load_taxonomy(DEFAULT_TAXONOMY_PATH)
+    skills, aliases = taxonomy.skills, taxonomy.aliases
+    matcher = taxonomy.matcher
+
+    print(f"{len(texts)} resumes, {sum(len(doc) for doc in docs)} tokens, {len(skills)} skills")
+
+    build = measure(lambda: SkillMatcher(skills, aliases), repeat=5, number=10)
+    report("matcher build (once per process)", build)
+
+    legacy = measure(lambda: [legacy_extract(doc, skills) for doc in docs], repeat=3)
+    report("legacy per-token list scan", legacy)
+
+    compiled = measure(lambda: [matcher.extract(text) for text in texts], repeat=5, number=10)
+    report("compiled matcher (raw text)", compiled, baseline=legacy)
+
+    for text, doc in zip(texts, docs):
+        old = legacy_extract(doc, skills)
+        new = matcher.extract(text)
+        if old != new:
+            print(f"  only legacy: {sorted(old - new)}  only matcher: {sorted(new - old)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Job description -> resume matching over the memory-mapped vector store: brute-force
+top-k against the IVF index (latency and recall@k), plus the cost of adding vectors.
+Resumes and job descriptions are synthetic skill-heavy texts, embedded for real.
+
+    python -m benchmarks.bench_vectors [--rows 200000] [--queries 50]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import measure, report
+
+K = 10
+FILLER = ("experience team project delivered managed developed designed built led improved "
+          "responsible support customers business data systems production").split()
+
+
+def synthetic_texts(count, skills, rnd, words=(8, 25)):
+    weights = [1.0 / (rank + 1) ** 0.7 for rank in range(len(skills))]
+    for _ in range(count):
+        picked = rnd.choices(skills, weights, k=rnd.randint(4, 14))
+        yield " ".join(picked + rnd.choices(FILLER, k=rnd.randint(*words)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_screening_system.settings")
+    import django
+    django.setup()
+    from resume_screening import embeddings
+    from resume_screening.taxonomy import get_taxonomy
+    from resume_screening.vector_index import VectorStore
+
+    rnd = random.Random(0)
+    skills = list(get_taxonomy().skills)
+    started = time.perf_counter()
+    vectors = np.stack([embeddings.embed_text(text) for text in synthetic_texts(args.rows, skills, rnd)])
+    print(f"{args.rows} resumes embedded in {time.perf_counter() - started:.1f} s "
+          f"({vectors.nbytes / 2**20:.0f} MB of float32 at {embeddings.dimension()} dimensions)")
+    queries = [embeddings.embed_text(text) for text in synthetic_texts(args.queries, skills, rnd, words=(20, 40))]
+
+    with tempfile.TemporaryDirectory() as path:
+        store = VectorStore(path, embeddings.dimension())
+        started = time.perf_counter()
+        for start in range(0, args.rows, 10_000):
+            store.add(np.arange(start, min(start + 10_000, args.rows)), vectors[start:start + 10_000])
+        print(f"bulk add: {(time.perf_counter() - started) / args.rows * 1e6:.1f} us per vector")
+        store.refresh()
+
+        def brute():
+            return [store.search(query, k=K, exact=True) for query in queries]
+
+        exact_results = brute()
+        brute_time = measure(brute, repeat=3) / len(queries)
+        report("brute-force top-10 per query", brute_time)
+
+        started = time.perf_counter()
+        lists = store.build_ivf()
+        print(f"IVF build: {lists} lists in {time.perf_counter() - started:.1f} s")
+        for nprobe in (4, 16, 64):
+            def approximate():
+                return [store.search(query, k=K, nprobe=nprobe) for query in queries]
+
+            recall = np.mean([
+                len({i for i, _ in got} & {i for i, _ in want}) / K
+                for got, want in zip(approximate(), exact_results)
+            ])
+            report(f"IVF nprobe={nprobe} (recall@{K} {recall:.2f})", measure(approximate, repeat=3) / len(queries),
+                   baseline=brute_time)
+
+        # Incremental update on upload: one append, picked up by the next search's refresh
+        next_id = [args.rows]
+
+        def add_one():
+            store.add([next_id[0]], vectors[:1])
+            next_id[0] += 1
+            store.refresh()
+
+        report("add one vector + refresh", measure(add_one, repeat=5, number=20))
+
+
+if __name__ == "__main__":
+    main()
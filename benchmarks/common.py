@@ -0,0 +1,143 @@
+import glob
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESUMES_DIR = os.path.join(BASE_DIR, "resumes")
+
+
+def resume_paths():
+    """
+    Returns the bundled sample resume PDFs.
+    """
+    return sorted(glob.glob(os.path.join(RESUMES_DIR, "*.pdf")))
+
+
+def resume_texts():
+    """
+    Extracts the text of every bundled sample resume once, so benchmarks can reuse it.
+    """
+    from pdfminer.high_level import extract_text
+    return [extract_text(path) for path in resume_paths()]
+
+
+def timings(func, repeat=5, number=1):
+    """
+    Runs func `number` times per round for `repeat` rounds and returns the per-call time
+    in seconds of each round.
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return rounds
+
+
+def measure(func, repeat=5, number=1):
+    """
+    The best per-call time in seconds over `repeat` rounds of `number` calls.
+    """
+    return min(timings(func, repeat, number))
+
+
+def report(label, seconds, baseline=None):
+    """
+    Prints one benchmark line, with the speedup relative to a baseline when given.
+    """
+    line = f"{label:<40} {seconds * 1000:10.3f} ms"
+    if baseline:
+        line += f"   x{baseline / seconds:.1f}"
+    print(line)
+
+
+def setup_test_database():
+    """
+    Configures Django and creates a throwaway test database (in memory for SQLite), for
+    benchmarks that need a populated Resume table.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resume_screening_system.settings")
+    import django
+    django.setup()
+    from django.db import connection
+    from django.test.utils import setup_databases, setup_test_environment
+    if connection.vendor == "sqlite":
+        connection.settings_dict["TEST"]["NAME"] = None  # Not the on-disk file the threaded tests use
+    setup_test_environment()
+    setup_databases(verbosity=0, interactive=False)
+
+
+def fill_resumes(rows, seed=0, skills=None, skills_per_resume=(3, 12)):
+    """
+    Inserts `rows` random resumes with raw SQL (no model signals or save(), so derived
+    tables and the materialized skills gap are left for the benchmark to build). Skills are drawn from `skills`, by default the
+    taxonomy's skill names, with a skewed popularity like real resumes.
+    """
+    from django.db import connection
+
+    if skills is None:
+        from resume_screening.taxonomy import get_taxonomy
+        skills = list(get_taxonomy().skills)
+    weights = [1.0 / (rank + 1) for rank in range(len(skills))]
+    rnd = random.Random(seed)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    names = ["Unknown"] + [f"Candidate {i}" for i in range(1000)]
+    educations = ["Diploma", "Bachelors", "Masters", "PhD", "Unknown"]
+    sentiments = ["Positive", "Neutral", "Negative"]
+    with connection.cursor() as cursor:
+        for offset in range(0, rows, 50_000):
+            batch = []
+            for _ in range(min(50_000, rows - offset)):
+                picked = dict.fromkeys(rnd.choices(skills, weights, k=rnd.randint(*skills_per_resume)))
+                uploaded_at = start + timedelta(seconds=rnd.randrange(10**8))
+                batch.append((
+                    rnd.choice(names), rnd.choice(educations), rnd.randint(0, 20), ", ".join(picked),
+                    uploaded_at, uploaded_at, rnd.uniform(0, 100), "", rnd.choice(sentiments), "{}", "{}", "",
+                ))
+            cursor.executemany(
+                "INSERT INTO resume_screening_resume (name, education, experience, skills, uploaded_at, "
+                "updated_at, ranking_score, recommended_roles, sentiment, missing_skills, skills_gap, content_version) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                batch,
+            )
+
+
+def synthetic_pdf(pages, lines_per_page=45, first_page=None):
+    """
+    Builds a minimal multi-page text PDF in memory (no PDF library needed). `first_page`
+    optionally replaces the filler lines of page 1, e.g. with resume-like content.
+    """
+    def escape(line):
+        return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for number in range(pages):
+        if number == 0 and first_page:
+            lines = first_page
+        else:
+            lines = [f"Page {number + 1} line {i}: experience with Python, SQL and project delivery."
+                     for i in range(lines_per_page)]
+        stream = "BT /F1 10 Tf 12 TL 40 800 Td " + " ".join(f"({escape(line)}) '" for line in lines) + " ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream.encode("latin-1")))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
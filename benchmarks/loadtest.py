@@ -0,0 +1,137 @@
+"""
+Mixed-traffic load test: concurrent uploads alongside ranking_chart and
+analytics_dashboard polling, reporting p50/p99 latency per endpoint.
+
+Start the same project under each server, then point the script at both:
+
+    gunicorn resume_screening_system.wsgi -w 1 --threads 8 -b 127.0.0.1:8001
+    uvicorn resume_screening_system.asgi:application --workers 1 --port 8002
+
+    python -m benchmarks.loadtest --target wsgi=http://127.0.0.1:8001 --target asgi=http://127.0.0.1:8002
+
+Measured with DEBUG off, 1 CPU, SQLite, 16 clients for 30 s, one server at a time on a
+fresh copy of the database (uvicorn with --no-access-log):
+
+    server                  requests  errors  p50 ms  p99 ms  upload p50/p99 ms
+    gunicorn gthread x8         4484       0    91.5   409.5       135 / 942
+    uvicorn                     2085       0   226.5   384.7       244 / 421
+
+The async views cap upload tail latency but halve throughput on one core; most sync
+middleware in MIDDLEWARE is adapted per request under ASGI.
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+import urllib.request
+import uuid
+from collections import defaultdict
+from http.cookiejar import CookieJar
+
+from benchmarks.common import resume_paths
+
+# Share of requests per endpoint; the rest of the mix is chart/dashboard polling
+UPLOAD_SHARE = 0.2
+
+
+def percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class Client:
+    """
+    Minimal cookie-aware HTTP client that can pass Django's CSRF check on uploads.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+        self.opener.open(self.base_url + "/").read()  # Sets the csrftoken cookie
+        self.csrf_token = next((c.value for c in self.cookies if c.name == "csrftoken"), "")
+
+    def get(self, path):
+        with self.opener.open(self.base_url + path) as response:
+            response.read()
+
+    def upload(self, path):
+        boundary = uuid.uuid4().hex
+        with open(path, "rb") as f:
+            pdf = f.read()
+        body = (
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"resume\"; filename=\"{uuid.uuid4().hex}.pdf\"\r\n"
+            f"Content-Type: application/pdf\r\n\r\n"
+        ).encode() + pdf + f"\r\n--{boundary}--\r\n".encode()
+        request = urllib.request.Request(self.base_url + "/", data=body, method="POST", headers={
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Accept": "application/json",
+            "X-CSRFToken": self.csrf_token,
+            "Referer": self.base_url + "/",
+        })
+        with self.opener.open(request) as response:
+            response.read()
+
+
+def run(base_url, concurrency, duration, pdfs):
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = Client(base_url)
+        while time.monotonic() < deadline:
+            if rng.random() < UPLOAD_SHARE:
+                endpoint, call = "upload", lambda: client.upload(rng.choice(pdfs))
+            elif rng.random() < 0.5:
+                endpoint, call = "ranking_chart", lambda: client.get("/ranking_chart/")
+            else:
+                endpoint, call = "analytics_dashboard", lambda: client.get("/analytics_dashboard/")
+            start = time.perf_counter()
+            try:
+                call()
+            except Exception:
+                with lock:
+                    errors[endpoint] += 1
+                time.sleep(0.05)  # Don't spin if the server is refusing connections
+                continue
+            with lock:
+                latencies[endpoint].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", required=True, help="label=base_url, repeatable")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per target")
+    args = parser.parse_args()
+
+    pdfs = resume_paths()
+    print(f"{'target':<8} {'endpoint':<22} {'requests':>8} {'errors':>6} {'p50 ms':>9} {'p99 ms':>9}")
+    for target in args.target:
+        label, base_url = target.split("=", 1)
+        latencies, errors = run(base_url, args.concurrency, args.duration, pdfs)
+        for endpoint in sorted(set(latencies) | set(errors)):
+            values = latencies[endpoint]
+            print(f"{label:<8} {endpoint:<22} {len(values):>8} {errors[endpoint]:>6} "
+                  f"{percentile(values, 50) * 1000:>9.1f} {percentile(values, 99) * 1000:>9.1f}")
+        if latencies:
+            overall = [v for values in latencies.values() for v in values]
+            print(f"{label:<8} {'(all)':<22} {len(overall):>8} {sum(errors.values()):>6} "
+                  f"{statistics.median(overall) * 1000:>9.1f} {percentile(overall, 99) * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
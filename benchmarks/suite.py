@@ -0,0 +1,332 @@
+"""
+Regression suite: times the screening functions (text extraction, features, sentiment,
+role recommendation, model predict) on the bundled resumes and on synthetic inputs of
+several sizes, then upload_resume, ranking_chart and analytics_dashboard end to end
+through the test client. Runs offline against a throwaway database; the ranking model
+is trained from resume_ranking_dataset.csv into a temporary registry.
+
+    python -m benchmarks.suite run --output benchmarks/baseline.json   # store a baseline
+    python -m benchmarks.suite run --output current.json [--quick] [--filter predict]
+    python -m benchmarks.suite compare benchmarks/baseline.json current.json [--threshold 0.15]
+
+compare exits with status 1 when a case is slower than the baseline by more than the
+threshold. Timings are only comparable between runs on the same machine (both files
+record it). The committed benchmarks/baseline.json is the reference run on the machine
+named in its "machine" block; elsewhere, store your own baseline from the commit you are
+comparing against before measuring a change. Cases taking a millisecond or so (cached views)
+can drift by about the default threshold between runs.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.common import (
+    BASE_DIR, fill_resumes, report, resume_paths, resume_texts, setup_test_database, synthetic_pdf, timings,
+)
+
+# Results file layout; compare refuses files of another format
+FORMAT = 1
+
+# Slowdown (as a fraction of the baseline time) reported as a regression
+DEFAULT_THRESHOLD = 0.15
+
+# Pages of the synthetic PDFs, characters of the synthetic resume texts, skills listed for
+# role recommendation, rows scored per predict call and resumes in the pool behind the views
+PDF_PAGES = (1, 5, 20)
+TEXT_CHARS = (2_000, 10_000, 50_000)
+SKILL_COUNTS = (5, 20, 100)
+PREDICT_ROWS = (1, 100, 1000)
+POOL_SIZES = (100, 10_000)
+
+
+def machine_info():
+    import django
+    import numpy
+    import sklearn
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "node": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "numpy": numpy.__version__,
+        "scikit-learn": sklearn.__version__,
+        "git_commit": commit,
+    }
+
+
+class Suite:
+    def __init__(self, quick=False, pattern=None):
+        self.scale = 0.2 if quick else 1.0
+        self.pattern = pattern
+        self.results = {}
+
+    def wanted(self, name):
+        return not self.pattern or self.pattern in name
+
+    def time(self, name, func, repeat=5, number=1, per=1, setup=None):
+        """
+        Records the per-call time of func (divided by `per` when one call covers several
+        items); `setup` runs untimed before every call.
+        """
+        if not self.wanted(name):
+            return
+        repeat = max(3, round(repeat * self.scale))
+        if setup:
+            def call():
+                setup()
+                started = time.perf_counter()
+                func()
+                return time.perf_counter() - started
+
+            func()  # Warm up
+            rounds = [sum(call() for _ in range(number)) / number / per for _ in range(repeat)]
+        else:
+            func()
+            rounds = [seconds / per for seconds in timings(func, repeat, number)]
+        self.results[name] = {
+            "best": min(rounds),
+            "median": statistics.median(rounds),
+            "rounds": len(rounds),
+            "number": number,
+        }
+        report(name, min(rounds))
+
+
+def synthetic_text(texts, chars):
+    corpus = "\n".join(texts)
+    return (corpus * (chars // len(corpus) + 1))[:chars]
+
+
+def bench_parser(suite, texts):
+    from resume_screening.parser import analyze_sentiment, extract_features, extract_text_from_pdf
+
+    paths = resume_paths()
+    suite.time("extract_text_from_pdf[resumes]", lambda: [extract_text_from_pdf(path) for path in paths],
+               per=len(paths))
+    first_page = texts[0].splitlines()[:45]
+    for pages in PDF_PAGES:
+        pdf = synthetic_pdf(pages, first_page=first_page)
+        suite.time(f"extract_text_from_pdf[{pages}p]", lambda pdf=pdf: extract_text_from_pdf(io.BytesIO(pdf)))
+
+    inputs = [("resumes", texts)] + [(f"{chars}c", [synthetic_text(texts, chars)]) for chars in TEXT_CHARS]
+    for label, corpus in inputs:
+        suite.time(f"extract_features[{label}]", lambda corpus=corpus: [extract_features(text) for text in corpus],
+                   per=len(corpus))
+    for label, corpus in inputs:
+        suite.time(f"analyze_sentiment[{label}]", lambda corpus=corpus: [analyze_sentiment(text) for text in corpus],
+                   per=len(corpus))
+
+
+def bench_recommendation(suite, texts):
+    from resume_screening.parser import extract_features
+    from resume_screening.screening import recommend_job_roles
+    from resume_screening.taxonomy import get_taxonomy
+
+    resume_skills = [
+        [skill.strip() for skill in features["skills"].split(",") if skill.strip()]
+        for features in map(extract_features, texts)
+    ]
+    suite.time("recommend_job_roles[resumes]",
+               lambda: [recommend_job_roles(skills, 3.0) for skills in resume_skills], number=10,
+               per=len(resume_skills))
+    skills = get_taxonomy().skills
+    for count in SKILL_COUNTS:
+        picked = [skills[i * len(skills) // count] for i in range(count)]
+        suite.time(f"recommend_job_roles[{count} skills]", lambda picked=picked: recommend_job_roles(picked, 3.0),
+                   number=20)
+
+
+def train_model():
+    """
+    Trains the m1_model.py ranking model and publishes it to a temporary registry, which
+    scoring then loads. Returns the sklearn model.
+    """
+    import pandas as pd
+    from django.conf import settings
+    from sklearn.ensemble import RandomForestRegressor
+
+    from resume_screening import model_registry, scoring
+
+    df = pd.read_csv(os.path.join(BASE_DIR, "resume_ranking_dataset.csv"))
+    columns = scoring.FEATURE_COLUMNS
+    model = RandomForestRegressor(n_estimators=100, random_state=42).fit(df[columns], df["ranking_score"])
+    settings.RESUME_SCREENING_MODEL_REGISTRY = tempfile.mkdtemp()
+    model_registry.publish(model, {"source": "benchmarks.suite"})
+    scoring.reload_model()
+    return model
+
+
+def bench_predict(suite, model):
+    import numpy as np
+    import pandas as pd
+
+    from resume_screening import scoring
+
+    rng = np.random.default_rng(0)
+    for count in PREDICT_ROWS:
+        # Whole years of experience, as extract_features reports them
+        rows = np.column_stack(
+            [rng.integers(0, 4, count), rng.integers(0, 20, count), rng.integers(0, 30, count)]
+        ).astype(float)
+        frame = pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS)
+        label = f"{count} row" if count == 1 else f"{count} rows"
+        suite.time(f"model.predict[{label}]", lambda frame=frame: model.predict(frame), number=5)
+        # What screening calls: the flattened forest behind the score lookup table
+        suite.time(f"predict_scores[{label}]", lambda rows=rows: scoring.predict_scores(rows), number=5)
+
+
+def bench_views(suite):
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.test import Client
+
+    from resume_screening import analytics, jobs
+    from resume_screening.models import Resume
+
+    # Screen in the calling thread (no worker threads or process pool), so each timed
+    # upload covers the whole pipeline and nothing is left running between cases
+    settings.RESUME_SCREENING_JOB_WORKERS = 0
+    settings.RESUME_SCREENING_CPU_WORKERS = 0
+    settings.MEDIA_ROOT = tempfile.mkdtemp()
+    settings.RESUME_SCREENING_VECTOR_INDEX = tempfile.mkdtemp()
+    client = Client()
+
+    pdfs = []
+    for path in resume_paths():
+        with open(path, "rb") as f:
+            pdfs.append((os.path.basename(path), f.read()))
+    uploads = iter(range(10**9))
+
+    def upload(screen):
+        # A different trailing comment each time, so the parse cache never answers
+        number = next(uploads)
+        name, data = pdfs[number % len(pdfs)]
+        pdf = SimpleUploadedFile(name, data + b"\n%% %d\n" % number, content_type="application/pdf")
+        response = client.post("/", {"resume": pdf}, HTTP_ACCEPT="application/json")
+        assert response.status_code == 202, response.status_code
+        if screen:
+            assert jobs.run_pending() == 1
+
+    suite.time("upload_resume[enqueue]", lambda: upload(False), number=len(pdfs))
+    jobs.run_pending()
+    suite.time("upload_resume[screened]", lambda: upload(True), number=len(pdfs))
+
+    for size in POOL_SIZES:
+        if not any(suite.wanted(f"{view}[{size} resumes{state}]")
+                   for view in ("ranking_chart", "analytics_dashboard") for state in ("", ", cached")):
+            continue
+        Resume.objects.all().delete()
+        fill_resumes(size)
+        analytics.rebuild()
+        for view, url in (("ranking_chart", "/ranking_chart/"), ("analytics_dashboard", "/analytics_dashboard/")):
+            def get(url=url):
+                assert client.get(url).status_code == 200
+
+            suite.time(f"{view}[{size} resumes]", get, number=5, setup=cache.clear)
+            suite.time(f"{view}[{size} resumes, cached]", get, number=20)
+
+
+def run(args):
+    setup_test_database()
+    texts = resume_texts()
+    suite = Suite(quick=args.quick, pattern=args.filter)
+    started = time.perf_counter()
+
+    bench_parser(suite, texts)
+    bench_recommendation(suite, texts)
+    model = train_model()
+    bench_predict(suite, model)
+    bench_views(suite)
+
+    output = {
+        "format": FORMAT,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "quick": args.quick,
+        "unit": "seconds per call",
+        "results": suite.results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(output, f, indent=2)
+    print(f"{len(suite.results)} cases in {time.perf_counter() - started:.0f} s, written to {args.output}")
+
+
+def load(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("format") != FORMAT:
+        sys.exit(f"{path}: not a benchmark results file (format {FORMAT})")
+    return data
+
+
+def compare(args):
+    baseline, current = load(args.baseline), load(args.current)
+    for key in ("node", "platform", "processor", "python"):
+        if baseline["machine"].get(key) != current["machine"].get(key):
+            print(f"warning: {key} differs ({baseline['machine'].get(key)} vs {current['machine'].get(key)}), "
+                  f"timings may not be comparable")
+
+    regressions = []
+    print(f"{'case':<45} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<45} {'-':>12} {result[args.stat] * 1000:12.3f}      new")
+            continue
+        change = result[args.stat] / before[args.stat] - 1
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = "  faster"
+        print(f"{name:<45} {before[args.stat] * 1000:12.3f} {result[args.stat] * 1000:12.3f} {change:+8.1%}{flag}")
+    for name in baseline["results"].keys() - current["results"].keys():
+        print(f"{name:<45} missing from {args.current}")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} case(s) more than {args.threshold:.0%} slower than {args.baseline}")
+    print(f"no case more than {args.threshold:.0%} slower than {args.baseline}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite and write the results as JSON")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.add_argument("--quick", action="store_true", help="fewer rounds per case")
+    run_parser.add_argument("--filter", help="only cases whose name contains this text")
+    compare_parser = commands.add_parser("compare", help="flag cases slower than a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="allowed slowdown as a fraction (default %(default)s)")
+    compare_parser.add_argument("--stat", choices=("best", "median"), default="best")
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Resume
+from .models import JobDescription, Resume, ParseCache
 
 @admin.register(Resume)
 class ResumeAdmin(admin.ModelAdmin):
@@ -7,6 +7,16 @@ class ResumeAdmin(admin.ModelAdmin):
     search_fields = ('name', 'email', 'skills')
     list_filter = ('sentiment', 'education')
 
+@admin.register(ParseCache)
+class ParseCacheAdmin(admin.ModelAdmin):
+    list_display = ('key', 'version', 'hits', 'last_used_at')
+
+@admin.register(JobDescription)
+class JobDescriptionAdmin(admin.ModelAdmin):
+    list_display = ('title', 'created_at')
+    search_fields = ('title', 'description')
+    readonly_fields = ('skills',)
+
 admin.site.site_header = "Resume Screening Admin"
 admin.site.site_title = "Resume Screening Admin Portal"
 admin.site.index_title = "Welcome to the Resume Screening System"
@@ -0,0 +1,270 @@
+from collections import Counter, defaultdict
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .models import AnalyticsCounter, Resume, ResumeSkill, Skill
+
+# Resume fields the counters and skill links are derived from
+TRACKED_FIELDS = ("education", "sentiment", "ranking_score", "skills")
+
+SCORE_BUCKET_WIDTH = 10
+SENTIMENTS = ("Positive", "Neutral", "Negative")
+
+# Rows per IN (...) clause, well below SQLite's bound-parameter limit
+CHUNK_SIZE = 500
+
+MAX_VALUE_LENGTH = 255
+
+
+def _chunks(items, size=CHUNK_SIZE):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def split_skills(skills):
+    """
+    The distinct skill names of a Resume.skills string ("Python, SQL, ..."), in order.
+    """
+    names = (name.strip()[:MAX_VALUE_LENGTH] for name in (skills or "").split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def score_bucket(score):
+    """
+    Lower bound of the histogram bucket a ranking score falls in (scores are 0-100).
+    """
+    if score is None:
+        return None
+    upper = 100 - SCORE_BUCKET_WIDTH
+    return max(0, min(int(score // SCORE_BUCKET_WIDTH) * SCORE_BUCKET_WIDTH, upper))
+
+
+def contribution(row):
+    """
+    What one resume adds to the counters, as a Counter of (dimension, value) keys. `row`
+    holds the TRACKED_FIELDS values, or is None for a resume that does not exist.
+    """
+    counts = Counter()
+    if row is None:
+        return counts
+    education, sentiment, ranking_score, skills = row
+    counts[(AnalyticsCounter.TOTAL, "")] += 1
+    counts[(AnalyticsCounter.EDUCATION, (education or "Unknown")[:MAX_VALUE_LENGTH])] += 1
+    counts[(AnalyticsCounter.SENTIMENT, sentiment or "Neutral")] += 1
+    bucket = score_bucket(ranking_score)
+    if bucket is not None:
+        counts[(AnalyticsCounter.SCORE, str(bucket))] += 1
+    for name in split_skills(skills):
+        counts[(AnalyticsCounter.SKILL, name)] += 1
+    return counts
+
+
+def tracked_row(resume):
+    return tuple(getattr(resume, field) for field in TRACKED_FIELDS)
+
+
+def skill_ids(names):
+    """
+    Maps skill names to Skill ids, creating the missing Skill rows.
+    """
+    ids = {}
+    for chunk in _chunks(set(names)):
+        found = dict(Skill.objects.filter(name__in=chunk).values_list("name", "id"))
+        missing = [name for name in chunk if name not in found]
+        if missing:
+            Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+            found.update(Skill.objects.filter(name__in=missing).values_list("name", "id"))
+        ids.update(found)
+    return ids
+
+
+def _table(model):
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def apply_delta(delta):
+    """
+    Adds a Counter of (dimension, value) -> change to the stored counters. Uses a single
+    batched INSERT ... ON CONFLICT DO UPDATE where the database supports it, otherwise one
+    UPDATE ... SET count = count + n per (change, dimension) group.
+    """
+    delta = {key: amount for key, amount in delta.items() if amount}
+    if not delta:
+        return
+    if connection.features.supports_update_conflicts_with_target:
+        table = _table(AnalyticsCounter)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {table} (dimension, value, count) VALUES (%s, %s, %s) "
+                f"ON CONFLICT (dimension, value) DO UPDATE SET count = {table}.count + excluded.count",
+                [(dimension, value, amount) for (dimension, value), amount in delta.items()],
+            )
+        return
+
+    AnalyticsCounter.objects.bulk_create(
+        [AnalyticsCounter(dimension=dimension, value=value) for (dimension, value), amount in delta.items() if amount > 0],
+        batch_size=CHUNK_SIZE, ignore_conflicts=True,
+    )
+    groups = defaultdict(list)
+    for (dimension, value), amount in delta.items():
+        groups[(amount, dimension)].append(value)
+    for (amount, dimension), values in groups.items():
+        for chunk in _chunks(values):
+            AnalyticsCounter.objects.filter(dimension=dimension, value__in=chunk).update(count=F("count") + amount)
+
+
+def _insert_links(links):
+    # Plain executemany: bulk_create's per-object overhead dominates for millions of links
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {_table(ResumeSkill)} (resume_id, skill_id, ranking_score) VALUES (%s, %s, %s)", links
+        )
+
+
+def resumes_changed(changes):
+    """
+    Applies a batch of resume changes to the counters and ResumeSkill links. Each change is
+    (resume id, previous row, current row), with rows as in contribution(); a None previous
+    row means the resume was created, a None current row that it was deleted.
+    """
+    delta = Counter()
+    links_added = []  # (resume id, skill name, ranking score)
+    links_removed = defaultdict(list)  # resume id -> skill names
+    rescored = []  # (resume id, new ranking score) of resumes keeping some of their links
+    for resume_id, previous, current in changes:
+        delta.update(contribution(current))
+        delta.subtract(contribution(previous))
+        if current is None:
+            continue  # ResumeSkill rows go with the resume (on_delete=CASCADE)
+        score = current[2]
+        old_skills = set(split_skills(previous[3])) if previous else set()
+        new_skills = split_skills(current[3])
+        links_added.extend((resume_id, name, score) for name in new_skills if name not in old_skills)
+        links_removed[resume_id].extend(old_skills.difference(new_skills))
+        if previous and previous[2] != score and old_skills.intersection(new_skills):
+            rescored.append((resume_id, score))
+
+    with transaction.atomic():
+        apply_delta(delta)
+        for resume_id, score in rescored:
+            ResumeSkill.objects.filter(resume_id=resume_id).update(ranking_score=score)
+        removed = [name for names in links_removed.values() for name in names]
+        if not (links_added or removed):
+            return
+        ids = skill_ids([name for _, name, _ in links_added] + removed)
+        for resume_id, names in links_removed.items():
+            if names:
+                ResumeSkill.objects.filter(resume_id=resume_id, skill_id__in=[ids[name] for name in names]).delete()
+        if links_added:
+            ResumeSkill.objects.bulk_create(
+                [ResumeSkill(resume_id=resume_id, skill_id=ids[name], ranking_score=score)
+                 for resume_id, name, score in links_added],
+                batch_size=CHUNK_SIZE, ignore_conflicts=True,
+            )
+
+
+def resume_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Remember the stored values so post_save can apply the difference
+    instance._analytics_previous = None
+    if raw or (update_fields is not None and not set(update_fields) & set(TRACKED_FIELDS)):
+        instance._analytics_skip = True
+        return
+    instance._analytics_skip = False
+    if instance.pk is not None:
+        instance._analytics_previous = Resume.objects.filter(pk=instance.pk).values_list(*TRACKED_FIELDS).first()
+
+
+def resume_post_save(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw or instance.__dict__.pop("_analytics_skip", True):
+        return
+    previous = instance.__dict__.pop("_analytics_previous", None)
+    current = tracked_row(instance)
+    if previous is not None and update_fields is not None:
+        # Fields left out of update_fields keep their stored values
+        current = tuple(new if field in update_fields else old
+                        for field, old, new in zip(TRACKED_FIELDS, previous, current))
+    resumes_changed([(instance.pk, previous, current)])
+
+
+def resume_post_delete(sender, instance, **kwargs):
+    resumes_changed([(instance.pk, tracked_row(instance), None)])
+
+
+def connect_signals():
+    pre_save.connect(resume_pre_save, sender=Resume, dispatch_uid="analytics_resume_pre_save")
+    post_save.connect(resume_post_save, sender=Resume, dispatch_uid="analytics_resume_post_save")
+    post_delete.connect(resume_post_delete, sender=Resume, dispatch_uid="analytics_resume_post_delete")
+
+
+def rebuild(batch_size=2000):
+    """
+    Recomputes every counter and ResumeSkill link from the Resume table (after bulk
+    writes that bypassed resumes_changed, or to repair drift). Returns the resume count.
+    """
+    counts = Counter()
+    resumes = 0
+    with transaction.atomic():
+        AnalyticsCounter.objects.all().delete()
+        ResumeSkill.objects.all().delete()
+        ids = dict(Skill.objects.values_list("name", "id"))
+        rows = Resume.objects.order_by("pk").values_list("pk", *TRACKED_FIELDS)
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) == batch_size:
+                resumes += _rebuild_batch(batch, counts, ids)
+                batch = []
+        resumes += _rebuild_batch(batch, counts, ids)
+        AnalyticsCounter.objects.bulk_create(
+            [AnalyticsCounter(dimension=dimension, value=value, count=count) for (dimension, value), count in counts.items()],
+            batch_size=CHUNK_SIZE,
+        )
+    return resumes
+
+
+def _rebuild_batch(batch, counts, ids):
+    links = []
+    for resume_id, *row in batch:
+        counts.update(contribution(row))
+        links.extend((resume_id, name, row[2]) for name in split_skills(row[3]))
+    missing = {name for _, name, _ in links if name not in ids}
+    if missing:
+        ids.update(skill_ids(missing))
+    _insert_links([(resume_id, ids[name], score) for resume_id, name, score in links])
+    return len(batch)
+
+
+def summary(top_skills=10):
+    """
+    Pool-wide dashboard figures read from the counters: two small indexed queries,
+    whatever the number of resumes.
+    """
+    result = {
+        "total": 0,
+        "skills": [],
+        "education": {},
+        "sentiments": dict.fromkeys(SENTIMENTS, 0),
+        "scores": {},
+    }
+    counters = (
+        AnalyticsCounter.objects.filter(count__gt=0).exclude(dimension=AnalyticsCounter.SKILL)
+        .order_by("dimension", "-count", "value").values_list("dimension", "value", "count")
+    )
+    for dimension, value, count in counters:
+        if dimension == AnalyticsCounter.TOTAL:
+            result["total"] = count
+        elif dimension == AnalyticsCounter.EDUCATION:
+            result["education"][value] = count
+        elif dimension == AnalyticsCounter.SENTIMENT:
+            result["sentiments"][value] = count
+        elif dimension == AnalyticsCounter.SCORE:
+            result["scores"][int(value)] = count
+    result["scores"] = dict(sorted(result["scores"].items()))
+    result["skills"] = list(
+        AnalyticsCounter.objects.filter(dimension=AnalyticsCounter.SKILL, count__gt=0)
+        .order_by("-count", "value").values_list("value", "count")[:top_skills]
+    )
+    return result
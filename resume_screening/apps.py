@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class ResumeScreeningConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'resume_screening'
+
+    def ready(self):
+        # Build the skill taxonomy indexes once per process, before the first request
+        from .taxonomy import get_taxonomy
+        get_taxonomy()
+
+        # Keep the in-memory leaderboard in step with Resume saves and deletes
+        from . import leaderboard
+        leaderboard.connect_signals()
+
+        # Keep the analytics counters and skill links in step with Resume changes
+        from . import analytics
+        analytics.connect_signals()
+
+        # Keep job description vectors current and drop the vectors of deleted resumes
+        from . import matching
+        matching.connect_signals()
+
+        # Move the version that cached responses (dashboard, ranking chart) are keyed by
+        from . import http_cache
+        http_cache.connect_signals()
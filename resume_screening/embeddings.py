@@ -0,0 +1,82 @@
+import math
+import zlib
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+from django.conf import settings
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from .skill_matcher import tokenize
+from .taxonomy import get_taxonomy
+
+# Bump when the features or weights below change: stored vectors become incomparable
+EMBEDDING_VERSION = "1"
+
+# A recognized skill counts this much more than an ordinary word
+SKILL_WEIGHT = 3.0
+
+
+def dimension():
+    return getattr(settings, "RESUME_SCREENING_EMBEDDING_DIM", 512)
+
+
+def signature():
+    """
+    Identifies the embedding space; vectors with different signatures can't be compared.
+    """
+    return f"{EMBEDDING_VERSION}x{dimension()}"
+
+
+@lru_cache(maxsize=65536)
+def _slot(feature, dim):
+    # Stable across processes and runs, unlike hash(); the top bit picks the sign so
+    # colliding features tend to cancel out rather than add up
+    h = zlib.crc32(feature.encode())
+    return h % dim, 1.0 if h & 0x80000000 else -1.0
+
+
+def features(tokens):
+    """
+    Weighted features of a token list: sublinear counts of the non-stop words, plus one
+    "skill:<name>" feature per taxonomy skill found.
+    """
+    counts = Counter(token for token in tokens if len(token) > 1 and token not in ENGLISH_STOP_WORDS)
+    weights = {token: 1.0 + math.log(count) for token, count in counts.items()}
+    for skill, _, _ in get_taxonomy().matcher.find_tokens(tokens):
+        weights["skill:" + skill] = SKILL_WEIGHT
+    return weights
+
+
+def sparse(tokens, dim=None):
+    """
+    Unit-length hashed embedding of a token list in sparse, JSON-friendly form
+    ({"indices": [...], "values": [...]}), small enough for the parse cache.
+    """
+    dim = dim or dimension()
+    slots = {}
+    for feature, weight in features(tokens).items():
+        index, sign = _slot(feature, dim)
+        slots[index] = slots.get(index, 0.0) + sign * weight
+    norm = math.sqrt(sum(value * value for value in slots.values()))
+    if not norm:
+        return {"indices": [], "values": []}
+    indices = sorted(slots)
+    return {"indices": indices, "values": [round(slots[i] / norm, 6) for i in indices]}
+
+
+def dense(vector, dim=None):
+    """
+    The float32 array form of a sparse() embedding.
+    """
+    out = np.zeros(dim or dimension(), dtype=np.float32)
+    if vector and vector["indices"]:
+        out[vector["indices"]] = vector["values"]
+    return out
+
+
+def embed_text(text):
+    """
+    Dense embedding of a raw text (a job description, or a resume without a cached one).
+    """
+    return dense(sparse(tokenize(text)))
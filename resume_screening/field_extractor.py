@@ -0,0 +1,31 @@
+import re
+
+# Canonical degree names, in the order extract_features has always preferred them
+DEGREES = ["Diploma", "Engineering", "Bachelors", "Masters", "PhD", "B.Sc", "BEng", "M.Sc"]
+_DEGREE_KEYS = [(degree, degree.lower()) for degree in DEGREES]
+
+PHONE_PATTERN = r"(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{4,5}[-.\s]?\d{5}"
+
+EMAIL_REGEX = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+PHONE_REGEX = re.compile(PHONE_PATTERN)
+EXPERIENCE_REGEX = re.compile(r"(\d+)\s+(?:years|yrs|year)", re.IGNORECASE)
+
+
+def first_fields(text):
+    """
+    The email, phone, education and experience values extract_features reports: the first
+    email, phone number and years-of-experience mention (email and phone are the key
+    resumes are deduplicated on), and the highest priority degree named anywhere in the
+    text. Same results as the original searches; the text is lowercased once instead of
+    once per degree.
+    """
+    email = EMAIL_REGEX.search(text)
+    phone = PHONE_REGEX.search(text)
+    experience = EXPERIENCE_REGEX.search(text)
+    lowered = text.lower()
+    return {
+        "email": email.group() if email else "Not Provided",
+        "phone": phone.group() if phone else "Not Provided",
+        "education": next((degree for degree, key in _DEGREE_KEYS if key in lowered), "Unknown"),
+        "experience": int(experience.group(1)) if experience else 0,
+    }
@@ -0,0 +1,121 @@
+import numpy as np
+
+# Bump when the array layout below changes
+FOREST_FORMAT = 1
+
+
+class FlatForest:
+    """
+    A tree ensemble (e.g. the ranking RandomForestRegressor) flattened into parallel node
+    arrays, so it loads in well under a millisecond and predicts with a few NumPy
+    operations instead of going through sklearn's input validation.
+
+    All trees share one node numbering; `roots[t]` is the first node of tree t. Both
+    children of node n are interleaved, right then left, so the next node is
+    `children[2 * n + went_left]`. Leaves point to themselves with an infinite threshold,
+    so every row simply takes `depth` steps and ends up on its leaf without branching.
+    """
+
+    def __init__(self, feature, threshold, children, value, roots, depth, n_features):
+        # Pointer-sized indexes, so gathers never convert them (a no-op on 64-bit builds)
+        self.feature = np.asarray(feature).astype(np.intp, copy=False)
+        self.threshold = np.asarray(threshold)
+        self.children = np.asarray(children).astype(np.intp, copy=False)
+        self.value = np.asarray(value)
+        self.roots = np.asarray(roots).astype(np.intp, copy=False)
+        self.depth = int(depth)
+        self.n_features = int(n_features)
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """
+        Flattens a fitted single-output sklearn forest or tree regressor.
+        """
+        estimators = getattr(model, "estimators_", [model])
+        features, thresholds, children, values, roots = [], [], [], [], []
+        offset = 0
+        depth = 0
+        for estimator in estimators:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left == -1
+
+            features.append(np.where(leaf, 0, tree.feature))
+            thresholds.append(np.where(leaf, np.inf, tree.threshold))
+            right = np.where(leaf, nodes, tree.children_right) + offset
+            left = np.where(leaf, nodes, tree.children_left) + offset
+            children.append(np.stack([right, left], axis=1).ravel())
+            values.append(tree.value[:, 0, 0])
+            roots.append(offset)
+            offset += tree.node_count
+            depth = max(depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            children=np.concatenate(children),
+            value=np.concatenate(values),
+            roots=np.asarray(roots),
+            depth=depth,
+            n_features=model.n_features_in_,
+        )
+
+    def _record_dtype(self):
+        nodes = len(self.value)
+        return np.dtype([
+            ("format", "<i8"), ("depth", "<i8"), ("n_features", "<i8"),
+            ("roots", "<i8", (len(self.roots),)), ("feature", "<i8", (nodes,)), ("threshold", "<f8", (nodes,)),
+            ("children", "<i8", (2 * nodes,)), ("value", "<f8", (nodes,)),
+        ])
+
+    def save(self, path):
+        """
+        Writes the forest as a single-record .npy file, which load() can memory-map.
+        """
+        record = np.zeros(1, dtype=self._record_dtype())
+        record["format"] = FOREST_FORMAT
+        for name in ("depth", "n_features", "roots", "feature", "threshold", "children", "value"):
+            record[name] = getattr(self, name)
+        np.save(path, record, allow_pickle=False)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Opens a forest written by save(). Memory-mapped by default: nothing is read until
+        used, and processes scoring with the same file share its pages.
+        """
+        record = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        if record.dtype.names is None or "format" not in record.dtype.names:
+            raise ValueError(f"{path} is not a flattened forest")
+        if int(record["format"][0]) != FOREST_FORMAT:
+            raise ValueError(f"{path} has forest format {int(record['format'][0])}, expected {FOREST_FORMAT}")
+        return cls(**{name: record[name][0] for name in record.dtype.names if name != "format"})
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.feature, self.threshold, self.children, self.value, self.roots))
+
+    def predict(self, rows):
+        """
+        Scores a batch of rows (anything 2-D array-like, one row per candidate). Matches
+        sklearn's predict exactly: inputs are compared as float32 like sklearn's trees do,
+        and tree outputs are summed in tree order before dividing.
+        """
+        X = np.asarray(rows, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected rows of {self.n_features} features, got shape {X.shape}")
+
+        n_rows = X.shape[0]
+        columns = np.ascontiguousarray(X.T).ravel()  # Feature-major, so X[row, f] is columns[f * n_rows + row]
+        # One cursor per (tree, row) pair, all advanced together
+        nodes = np.repeat(self.roots, n_rows)
+        row_index = np.tile(np.arange(n_rows), len(self.roots))
+        for _ in range(self.depth):
+            go_left = columns[self.feature[nodes] * n_rows + row_index] <= self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_left]
+
+        leaf_values = self.value[nodes].reshape(len(self.roots), n_rows)
+        total = np.zeros(n_rows)
+        for tree_values in leaf_values:
+            total += tree_values
+        return total / len(self.roots)
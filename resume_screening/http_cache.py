@@ -0,0 +1,95 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from . import metrics
+from .models import JobDescription, Resume
+
+# Moves (after commit) whenever resumes or job descriptions change; cached responses
+# derived from them are keyed by it, so a change makes them unreachable
+VERSION_KEY = "resume_screening:responses:version"
+
+
+def timeout():
+    """
+    Seconds a cached response is kept, which also bounds how stale it can be in a process
+    that missed a change (local-memory caches are per process).
+    """
+    return getattr(settings, "RESUME_SCREENING_RESPONSE_CACHE_TIMEOUT", 300)
+
+
+def data_version():
+    # Starts from the clock, so a version key evicted from the cache can't come back as a
+    # value that older entries were stored under
+    cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+    return cache.get(VERSION_KEY, 0)
+
+
+def bump():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def changed(sender, **kwargs):
+    # Readers must not cache pre-commit data under the new version
+    transaction.on_commit(bump)
+
+
+def connect_signals():
+    for model in (Resume, JobDescription):
+        post_save.connect(changed, sender=model, dispatch_uid=f"http_cache_{model.__name__}_saved")
+        post_delete.connect(changed, sender=model, dispatch_uid=f"http_cache_{model.__name__}_deleted")
+
+
+def etag(*parts):
+    """
+    A strong ETag derived from JSON-serializable parts.
+    """
+    return quote_etag(hashlib.sha256(json.dumps(parts, cls=DjangoJSONEncoder).encode()).hexdigest()[:24])
+
+
+def conditional(request, etag, last_modified, respond):
+    """
+    Answers 304 Not Modified when the request's If-None-Match / If-Modified-Since show the
+    client's copy is current, otherwise calls respond() for the full response. Both carry
+    the validators and ask clients to revalidate before reusing their copy. Pass None as
+    last_modified when no timestamp moves with every change; only the ETag is used then.
+    """
+    if last_modified is not None:
+        last_modified = int(last_modified)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified) or respond()
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+async def json_response(request, name, build):
+    """
+    A JSON response from `build` (an async callable returning the data), cached until
+    resumes or job descriptions next change. The ETag is a hash of the body and
+    Last-Modified the time it was built.
+    """
+    key = f"resume_screening:response:{name}:{data_version()}"
+    entry = cache.get(key)
+    metrics.RESPONSE_CACHE_LOOKUPS.inc(response=name, result="miss" if entry is None else "hit")
+    if entry is None:
+        body = json.dumps(await build(), cls=DjangoJSONEncoder).encode()
+        entry = {"body": body, "etag": quote_etag(hashlib.sha256(body).hexdigest()[:24]), "built_at": time.time()}
+        cache.set(key, entry, timeout())
+    return conditional(
+        request, entry["etag"], entry["built_at"],
+        lambda: HttpResponse(entry["body"], content_type="application/json"),
+    )
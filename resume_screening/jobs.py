@@ -0,0 +1,253 @@
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, F
+from django.urls import reverse
+from django.utils import timezone
+
+from . import matching, metrics, parse_cache, pdf_store
+from .models import ScreeningJob
+from .pdf_extract import ExtractionFailed
+from .screening import parse_pdf, screen_parsed, save_resume
+
+
+def concurrency():
+    """
+    Number of in-process worker threads; 0 leaves jobs to `manage.py run_screening_worker`.
+    """
+    return getattr(settings, "RESUME_SCREENING_JOB_WORKERS", 2)
+
+
+def max_attempts():
+    return getattr(settings, "RESUME_SCREENING_JOB_MAX_ATTEMPTS", 3)
+
+
+def job_timeout():
+    """
+    Seconds after which a running job whose worker died is handed to another worker.
+    """
+    return getattr(settings, "RESUME_SCREENING_JOB_TIMEOUT", 300)
+
+
+def enqueue(uploaded_file):
+    """
+    Persists an uploaded PDF (content-addressed, see pdf_store) and queues it for
+    screening. Returns the job.
+    """
+    job = ScreeningJob(
+        original_name=uploaded_file.name[:255],
+        size=uploaded_file.size or 0,
+        content_hash=parse_cache.content_hash(uploaded_file.chunks()),
+    )
+    job.file.name = pdf_store.store(uploaded_file, job.content_hash)
+    job.save()
+    metrics.UPLOAD_BYTES.observe(job.size)
+
+    pool = get_pool()
+    if pool:
+        pool.notify()
+    return job
+
+
+def claim_next():
+    """
+    Atomically moves the oldest queued job to "running" and returns it, or None.
+    A conditional UPDATE makes the claim safe across threads and processes without row locks.
+    """
+    while True:
+        job_id = (
+            ScreeningJob.objects.filter(status=ScreeningJob.QUEUED)
+            .order_by("enqueued_at").values_list("pk", flat=True).first()
+        )
+        if job_id is None:
+            return None
+        claimed = ScreeningJob.objects.filter(pk=job_id, status=ScreeningJob.QUEUED).update(
+            status=ScreeningJob.RUNNING, stage="starting", started_at=timezone.now(), attempts=F("attempts") + 1
+        )
+        if claimed:
+            return ScreeningJob.objects.get(pk=job_id)
+
+
+def requeue_stale():
+    """
+    Puts jobs stuck in "running" past the timeout back in the queue (or fails them once
+    they have used all their attempts).
+    """
+    cutoff = timezone.now() - timedelta(seconds=job_timeout())
+    stale = ScreeningJob.objects.filter(status=ScreeningJob.RUNNING, started_at__lt=cutoff)
+    stale.filter(attempts__gte=max_attempts()).update(
+        status=ScreeningJob.FAILED, stage=ScreeningJob.FAILED, error="Timed out", finished_at=timezone.now()
+    )
+    return stale.update(status=ScreeningJob.QUEUED, stage=ScreeningJob.QUEUED)
+
+
+def set_stage(job, stage):
+    job.stage = stage
+    ScreeningJob.objects.filter(pk=job.pk).update(stage=stage)
+
+
+def run_job(job):
+    """
+    Screens one claimed job. Failures are retried until max_attempts is reached.
+    """
+    try:
+        set_stage(job, "parsing")
+        parsed = parse_pdf(job.file.path, key=job.content_hash or None)
+
+        set_stage(job, "scoring")
+        fields = screen_parsed(parsed)
+
+        set_stage(job, "saving")
+        fields["file"] = job.file.name
+        with metrics.timed("persist"):
+            resume = save_resume(fields)
+            matching.index_resumes({resume.id: parsed.get("embedding")})
+    except ExtractionFailed as e:
+        metrics.PARSE_FAILURES.inc(reason=e.result.status)
+        # Unreadable PDFs fail the same way every time, so don't retry them
+        ScreeningJob.objects.filter(pk=job.pk).update(
+            status=ScreeningJob.FAILED, stage=ScreeningJob.FAILED,
+            error=f"Could not read PDF ({e})", finished_at=timezone.now(),
+        )
+        return False
+    except Exception as e:
+        metrics.PARSE_FAILURES.inc(reason="error")
+        retry = job.attempts < max_attempts()
+        ScreeningJob.objects.filter(pk=job.pk).update(
+            status=ScreeningJob.QUEUED if retry else ScreeningJob.FAILED,
+            stage=ScreeningJob.QUEUED if retry else ScreeningJob.FAILED,
+            error=f"{type(e).__name__}: {e}",
+            finished_at=None if retry else timezone.now(),
+        )
+        return False
+
+    ScreeningJob.objects.filter(pk=job.pk).update(
+        status=ScreeningJob.DONE, stage=ScreeningJob.DONE, resume=resume, error="", finished_at=timezone.now()
+    )
+    metrics.SCREENED.inc()
+    return True
+
+
+def run_pending(limit=None):
+    """
+    Processes queued jobs in the calling thread until the queue is empty (or `limit` jobs
+    have run). Returns the number of jobs processed.
+    """
+    processed = 0
+    while limit is None or processed < limit:
+        job = claim_next()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
+
+
+class WorkerPool:
+    """
+    Fixed number of daemon threads pulling jobs from the ScreeningJob table. The thread
+    count is the concurrency limit; idle workers sleep until notified or polled.
+    """
+
+    def __init__(self, size, poll_interval=1.0):
+        self.size = size
+        self.poll_interval = poll_interval
+        self._wakeup = threading.Semaphore(0)
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for i in range(self.size):
+            thread = threading.Thread(target=self._run, name=f"screening-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def notify(self):
+        self._wakeup.release()
+
+    def stop(self):
+        self._stopping.set()
+        for _ in self._threads:
+            self._wakeup.release()
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            close_old_connections()
+            try:
+                job = claim_next()
+                if job is None:
+                    requeue_stale()
+            except Exception:
+                job = None  # Database briefly unavailable or locked; try again after the poll interval
+            if job is None:
+                self._wakeup.acquire(timeout=self.poll_interval)
+                continue
+            run_job(job)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Returns the in-process worker pool, starting it on first use (None when disabled).
+    """
+    global _pool
+    if _pool is None and concurrency() > 0:
+        with _pool_lock:
+            if _pool is None:
+                pool = WorkerPool(concurrency())
+                pool.start()
+                _pool = pool
+    return _pool
+
+
+def job_status(job):
+    """
+    JSON-serializable progress report for the status endpoint.
+    """
+    return {
+        "id": job.pk,
+        "status": job.status,
+        "stage": job.stage,
+        "attempts": job.attempts,
+        "error": job.error,
+        "resume_id": job.resume_id,
+        "result_url": reverse("resume_result", args=[job.resume_id]) if job.resume_id else None,
+        "queue_wait": job.queue_wait(),
+        "processing_time": job.processing_time(),
+    }
+
+
+def queue_counts():
+    """
+    Number of jobs in each status.
+    """
+    counts = {status: 0 for status, _ in ScreeningJob.STATUS_CHOICES}
+    for row in ScreeningJob.objects.values("status").annotate(n=Count("pk")):
+        counts[row["status"]] = row["n"]
+    return counts
+
+
+def queue_stats(recent=100):
+    """
+    Queue depth per status plus average queue wait and processing time of recent jobs.
+    """
+    counts = queue_counts()
+    finished = ScreeningJob.objects.filter(status=ScreeningJob.DONE).order_by("-finished_at")[:recent]
+    waits = [job.queue_wait() for job in finished]
+    processing = [job.processing_time() for job in finished]
+    return {
+        "counts": counts,
+        "workers": concurrency(),
+        "avg_queue_wait": sum(waits) / len(waits) if waits else None,
+        "avg_processing_time": sum(processing) / len(processing) if processing else None,
+    }
+
+
+metrics.gauge("resume_screening_jobs", "Screening jobs by status.", queue_counts, label="status")
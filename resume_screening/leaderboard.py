@@ -0,0 +1,184 @@
+import bisect
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .models import Resume
+
+# Bumped on every Resume change; processes sharing a cache backend reload when it moves
+GENERATION_KEY = "resume_screening:leaderboard:generation"
+
+FIELDS = ("id", "name", "ranking_score", "uploaded_at", "education", "skills", "sentiment")
+
+
+def board_size():
+    return getattr(settings, "RESUME_SCREENING_LEADERBOARD_SIZE", 100)
+
+
+def rank_key(entry):
+    """
+    Ascending sort key for "best first" order, matching order_by("-ranking_score", "-id")
+    on SQLite (rows without a score come last).
+    """
+    score = entry["ranking_score"]
+    return (score is None, -(score or 0.0), -entry["id"])
+
+
+def recency_key(entry):
+    return (entry["uploaded_at"], entry["id"])
+
+
+class Leaderboard:
+    """
+    The best-ranked resumes plus the most recent upload, kept in memory and updated from
+    Resume save/delete signals instead of being queried on every request.
+
+    Up to 2 x size entries are kept so a few deletions or score drops do not force a
+    reload; the board is reloaded from the (indexed) database only once fewer than `size`
+    known-best entries remain, or after another process changed resumes.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.capacity = 2 * size
+        self.keys = []          # rank_key of each entry, ascending (best first)
+        self.entries = []       # entry dicts, same order
+        self.latest = None
+        self.complete = False   # True when the board holds every resume in the table
+        self.stale = True
+        self.generation = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        rows = list(Resume.objects.order_by("-ranking_score", "-id").values(*FIELDS)[:self.capacity])
+        rows.sort(key=rank_key)  # Same order as the query; makes the bisect invariants explicit
+        self.keys = [rank_key(row) for row in rows]
+        self.entries = rows
+        self.complete = len(rows) < self.capacity
+        self.latest = Resume.objects.order_by("-uploaded_at", "-id").values(*FIELDS).first()
+        self.stale = False
+
+    def _remove(self, resume_id):
+        for i, entry in enumerate(self.entries):
+            if entry["id"] == resume_id:
+                del self.entries[i]
+                del self.keys[i]
+                return True
+        return False
+
+    def saved(self, entry):
+        was_ranked = self._remove(entry["id"])
+        key = rank_key(entry)
+        if self.complete or (self.keys and key < self.keys[-1]):
+            i = bisect.bisect_left(self.keys, key)
+            self.keys.insert(i, key)
+            self.entries.insert(i, entry)
+            if len(self.entries) > self.capacity:
+                self.keys.pop()
+                self.entries.pop()
+                self.complete = False
+        elif was_ranked and not self.complete and len(self.entries) < self.size:
+            self.stale = True  # Rows just below the board are unknown
+
+        if self.latest is None or self.latest["id"] == entry["id"] or recency_key(entry) >= recency_key(self.latest):
+            self.latest = entry
+
+    def deleted(self, resume_id):
+        if self._remove(resume_id) and not self.complete and len(self.entries) < self.size:
+            self.stale = True
+        if self.latest is not None and self.latest["id"] == resume_id:
+            self.stale = True  # The next most recent upload is unknown
+
+    def snapshot(self, generation):
+        """
+        Returns (best entries, latest entry, complete), reloading first if needed.
+        """
+        with self.lock:
+            if self.stale or generation != self.generation:
+                self.load()
+                self.generation = generation
+            return self.entries[:self.size], self.latest, self.complete
+
+
+_board = None
+_board_lock = threading.Lock()
+
+
+def get_board():
+    global _board
+    if _board is None:
+        with _board_lock:
+            if _board is None:
+                _board = Leaderboard(board_size())
+    return _board
+
+
+def _bump_generation(board):
+    # Our own change is applied directly; any other jump means another process wrote too
+    try:
+        generation = cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, 0, timeout=None)
+        generation = cache.incr(GENERATION_KEY)
+    if board.generation is not None and generation == board.generation + 1:
+        board.generation = generation
+    else:
+        board.stale = True
+
+
+def _apply(change):
+    board = get_board()
+    with board.lock:
+        change(board)
+        _bump_generation(board)
+
+
+def resume_saved(sender, instance, **kwargs):
+    entry = {field: getattr(instance, field) for field in FIELDS}
+    # Only once committed: a rolled-back save must not leave a phantom entry on the board
+    transaction.on_commit(lambda: _apply(lambda board: board.saved(entry)))
+
+
+def resume_deleted(sender, instance, **kwargs):
+    resume_id = instance.pk  # Cleared on the instance once the delete finishes
+    transaction.on_commit(lambda: _apply(lambda board: board.deleted(resume_id)))
+
+
+def invalidate():
+    """
+    Forces a reload after changes that bypass signals (bulk_create, bulk_update, update()).
+    """
+    board = get_board()
+    with board.lock:
+        board.stale = True
+        _bump_generation(board)
+
+
+def connect_signals():
+    post_save.connect(resume_saved, sender=Resume, dispatch_uid="leaderboard_resume_saved")
+    post_delete.connect(resume_deleted, sender=Resume, dispatch_uid="leaderboard_resume_deleted")
+
+
+def top(n=10, exclude_names=()):
+    """
+    The n best-ranked resumes (as dicts of FIELDS), skipping the given names.
+    """
+    entries, _, complete = get_board().snapshot(cache.get(GENERATION_KEY, 0))
+    if exclude_names:
+        entries = [entry for entry in entries if entry["name"] not in exclude_names]
+    if len(entries) >= n or complete:
+        return entries[:n]
+    # Too many excluded names on the board: ask the database directly
+    return list(
+        Resume.objects.exclude(name__in=list(exclude_names)).order_by("-ranking_score", "-id").values(*FIELDS)[:n]
+    )
+
+
+def latest():
+    """
+    The most recently uploaded resume (as a dict of FIELDS), or None.
+    """
+    return get_board().snapshot(cache.get(GENERATION_KEY, 0))[1]
@@ -1,10 +1,16 @@
+import os
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor
 import pickle
 
+# Paths relative to this file (`manage.py train_ranker` is the registry-based replacement)
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_PATH = os.path.join(os.path.dirname(APP_DIR), "resume_ranking_dataset.csv")
+MODEL_PATH = os.path.join(APP_DIR, "resume_ranking_model.pkl")  # Where scoring.py looks for it
+
 # Load dataset
-df = pd.read_csv("D:/resume_screening_system/resume_ranking_dataset.csv")
+df = pd.read_csv(DATASET_PATH)
 
 # Train-test split
 X = df[["education", "experience", "skills"]]
@@ -12,11 +18,12 @@ y = df["ranking_score"]
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
 # Train Random Forest Model
-model = RandomForestRegressor(n_estimators=100, random_state=42)
+model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
 model.fit(X_train, y_train)
 
 # Save model to a file
-with open("resume_ranking_model.pkl", "wb") as f:
+model.set_params(n_jobs=None)
+with open(MODEL_PATH, "wb") as f:
     pickle.dump(model, f)
 
 print("Model trained and saved successfully!")
\ No newline at end of file
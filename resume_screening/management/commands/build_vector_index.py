@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_screening import matching
+
+
+class Command(BaseCommand):
+    help = "Maintain the resume / job description vector stores used for job matching."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--backfill", action="store_true",
+                            help="Embed resumes and job descriptions that have no vector yet")
+        parser.add_argument("--compact", action="store_true",
+                            help="Rewrite the stores without superseded and deleted vectors (drops IVF indexes)")
+        parser.add_argument("--ivf", action="store_true",
+                            help="Build the approximate (IVF) resume index used by job description ranking")
+        parser.add_argument("--lists", type=int, help="IVF lists (default: square root of the resume count)")
+
+    def handle(self, *args, **options):
+        if not (options["backfill"] or options["compact"] or options["ivf"]):
+            raise CommandError("Pass --backfill, --compact and/or --ivf")
+
+        if options["backfill"]:
+            resumes, job_descriptions = matching.backfill()
+            self.stdout.write(f"Embedded {resumes} resumes and {job_descriptions} job descriptions")
+
+        if options["compact"]:
+            for kind in (matching.RESUMES, matching.JOB_DESCRIPTIONS):
+                kept = matching.get_store(kind).compact()
+                self.stdout.write(f"Compacted {kind}: {kept} vectors kept")
+
+        if options["ivf"]:
+            store = matching.get_store(matching.RESUMES)
+            started = time.perf_counter()
+            try:
+                lists = store.build_ivf(n_lists=options["lists"])
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(
+                f"IVF index over {len(store)} resumes: {lists} lists, built in {time.perf_counter() - started:.1f} s"
+            ))
@@ -0,0 +1,45 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_screening.forest import FlatForest
+from resume_screening.scoring import FEATURE_COLUMNS, FOREST_PATH, MODEL_PATH
+
+
+class Command(BaseCommand):
+    help = "Convert the pickled ranking forest into the flat, memory-mappable .npy artifact used for scoring."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", default=MODEL_PATH, help="Pickled sklearn model to export")
+        parser.add_argument("--output", default=FOREST_PATH, help="Where to write the .npy artifact")
+        parser.add_argument(
+            "--dataset", default=os.path.join(settings.BASE_DIR, "resume_ranking_dataset.csv"),
+            help="CSV whose feature rows are used to check the export against model.predict",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["model"], "rb") as f:
+                model = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            raise CommandError(f"Could not load {options['model']}: {e}")
+
+        forest = FlatForest.from_sklearn(model)
+        rows = pd.read_csv(options["dataset"])[FEATURE_COLUMNS]
+        expected = model.predict(rows)
+        got = forest.predict(rows.to_numpy())
+        if not np.array_equal(expected, got):
+            raise CommandError(
+                f"Flattened forest disagrees with model.predict (max difference {np.abs(expected - got).max()})"
+            )
+
+        forest.save(options["output"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {options['output']}: {len(forest.roots)} trees, {len(forest.value)} nodes, "
+            f"depth {forest.depth}, {os.path.getsize(options['output']) / 1024:.0f} KiB; "
+            f"identical to model.predict on {len(rows)} rows"
+        ))
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from resume_screening import retention
+
+
+class Command(BaseCommand):
+    help = "Move resumes beyond the live set size or age limit to the compressed archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--max-resumes", type=int,
+                            help="Live set size (default: RESUME_SCREENING_MAX_RESUMES)")
+        parser.add_argument("--max-age-days", type=float,
+                            help="Archive resumes older than this (default: RESUME_SCREENING_MAX_RESUME_AGE_DAYS)")
+        parser.add_argument("--batch-size", type=int, help="Resumes archived per transaction")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many resumes are due")
+        parser.add_argument("--every", type=float,
+                            help="Keep running, purging every this many seconds (instead of from cron)")
+
+    def handle(self, *args, **options):
+        limit = options["max_resumes"] if options["max_resumes"] is not None else retention.max_resumes()
+        age_days = options["max_age_days"] if options["max_age_days"] is not None else retention.max_age_days()
+        batch_size = max(1, options["batch_size"] or retention.batch_size())
+
+        while True:
+            started = time.perf_counter()
+            count = retention.purge(limit, age_days, batch_size=batch_size, dry_run=options["dry_run"])
+            if options["dry_run"]:
+                self.stdout.write(f"{count} resumes due for archiving")
+            else:
+                self.stdout.write(self.style.SUCCESS(
+                    f"{count} resumes archived to {retention.archive_dir()} in {time.perf_counter() - started:.2f} s"
+                ))
+            if not options["every"] or options["dry_run"]:
+                return
+            try:
+                time.sleep(options["every"])
+            except KeyboardInterrupt:
+                return
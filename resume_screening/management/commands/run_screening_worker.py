@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from resume_screening import jobs
+
+
+class Command(BaseCommand):
+    help = "Process queued resume screening jobs (for deployments with in-process workers disabled)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=2, help="Worker threads")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between queue polls")
+        parser.add_argument("--once", action="store_true", help="Drain the queue in this thread and exit")
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            jobs.requeue_stale()
+            processed = jobs.run_pending()
+            self.stdout.write(self.style.SUCCESS(f"{processed} jobs processed"))
+            self.stdout.write(str(jobs.queue_stats()))
+            return
+
+        pool = jobs.WorkerPool(options["concurrency"], poll_interval=options["poll_interval"])
+        pool.start()
+        self.stdout.write(f"Screening worker running with {options['concurrency']} threads (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            pool.stop()
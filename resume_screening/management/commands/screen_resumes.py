@@ -0,0 +1,202 @@
+import glob
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from resume_screening import analytics, embeddings, http_cache, leaderboard, matching, pdf_store, skills_gap
+from resume_screening.models import Resume
+from resume_screening.nlp import get_nlp
+from resume_screening.parser import extract_text_from_pdf, extract_features, needs_nlp
+from resume_screening.scoring import model_input, predict_scores
+from resume_screening.screening import candidate_fields
+from resume_screening.sentiment import sentiment_labels
+from resume_screening.skill_matcher import tokenize
+
+STAGES = ["extract", "nlp", "features", "score", "persist"]
+
+
+class Command(BaseCommand):
+    help = "Screen a folder (or glob) of PDF resumes in batches and store the results."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Directories, PDF files or glob patterns")
+        parser.add_argument("--chunk-size", type=int, default=200,
+                            help="Resumes per pipeline chunk; progress is checkpointed after each chunk")
+        parser.add_argument("--batch-size", type=int, default=32, help="spaCy nlp.pipe batch size")
+        parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                            help="Processes used for PDF text extraction")
+        parser.add_argument("--nlp-processes", type=int, default=1, help="spaCy nlp.pipe n_process")
+        parser.add_argument("--checkpoint", help="Checkpoint file (default: .screen_resumes.json in the first directory)")
+        parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+
+    def handle(self, *args, **options):
+        paths = self.discover(options["paths"])
+        if not paths:
+            raise CommandError("No PDF files found.")
+
+        checkpoint_path = options["checkpoint"] or self.default_checkpoint(options["paths"])
+        done = {} if options["restart"] else self.load_checkpoint(checkpoint_path)
+        pending = [path for path in paths if done.get(path) != self.file_key(path)]
+        self.stdout.write(f"{len(paths)} PDFs found, {len(paths) - len(pending)} already screened, {len(pending)} to go")
+        if not pending:
+            return
+
+        timings = OrderedDict((stage, 0.0) for stage in STAGES)
+        chunk_size = max(1, options["chunk_size"])
+        created = updated = 0
+
+        with ProcessPoolExecutor(max_workers=options["workers"]) as pool:
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start:start + chunk_size]
+                chunk_created, chunk_updated = self.screen_chunk(chunk, pool, options, timings)
+                created += chunk_created
+                updated += chunk_updated
+
+                for path in chunk:
+                    done[path] = self.file_key(path)
+                self.save_checkpoint(checkpoint_path, done)
+                self.stdout.write(f"  {min(start + chunk_size, len(pending))}/{len(pending)} screened")
+
+        self.stdout.write(self.style.SUCCESS(f"{created} resumes created, {updated} updated"))
+        for stage, seconds in timings.items():
+            rate = len(pending) / seconds if seconds else float("inf")
+            self.stdout.write(f"  {stage:<10} {seconds:8.2f} s {rate:10.1f} resumes/s")
+
+    def screen_chunk(self, paths, pool, options, timings):
+        # Stage 1: PDF text extraction, in parallel processes
+        started = time.perf_counter()
+        texts = list(pool.map(extract_text_from_pdf, paths))
+        timings["extract"] += time.perf_counter() - started
+
+        # Stage 2: spaCy, batched, only for the resumes that actually need it
+        started = time.perf_counter()
+        docs = [None] * len(texts)
+        nlp_indexes = [i for i, text in enumerate(texts) if needs_nlp(text)]
+        if nlp_indexes:
+            piped = get_nlp().pipe(
+                (texts[i] for i in nlp_indexes), batch_size=options["batch_size"], n_process=options["nlp_processes"]
+            )
+            for i, doc in zip(nlp_indexes, piped):
+                docs[i] = doc
+        timings["nlp"] += time.perf_counter() - started
+
+        # Stage 3: field extraction, role recommendation and sentiment
+        started = time.perf_counter()
+        results = []
+        rows = []
+        token_lists = [tokenize(text) for text in texts]
+        for text, doc, tokens, sentiment in zip(texts, docs, token_lists, sentiment_labels(token_lists)):
+            features = extract_features(text, doc=doc, tokens=tokens)
+            fields = candidate_fields(features)
+            fields["sentiment"] = sentiment
+            fields["embedding"] = embeddings.sparse(tokens)
+            results.append(fields)
+            rows.append(model_input(features))
+        timings["features"] += time.perf_counter() - started
+
+        # Stage 4: one vectorized predict for the whole chunk
+        started = time.perf_counter()
+        for fields, score in zip(results, predict_scores(rows)):
+            fields["ranking_score"] = score
+        timings["score"] += time.perf_counter() - started
+
+        # Stage 5: bulk upsert keyed on (email, phone), with the PDFs copied to pdf_store
+        started = time.perf_counter()
+        for path, fields in zip(paths, results):
+            fields["file"] = pdf_store.store(path)
+        created, updated = self.persist(results)
+        matching.index_resumes({fields["resume_id"]: fields["embedding"] for fields in results if "resume_id" in fields})
+        timings["persist"] += time.perf_counter() - started
+        return created, updated
+
+    def persist(self, results):
+        with transaction.atomic():
+            by_key = OrderedDict(((fields["email"], fields["phone"]), fields) for fields in results)
+            existing = {
+                (resume.email, resume.phone): resume
+                for resume in Resume.objects.filter(email__in={email for email, _ in by_key})
+                if (resume.email, resume.phone) in by_key
+            }
+
+            resumes = []
+            previous = {}
+            for key, fields in by_key.items():
+                resume = Resume(
+                    name=fields["name"],
+                    email=fields["email"],
+                    phone=fields["phone"],
+                    education=fields["education"],
+                    experience=fields["experience"],
+                    skills=fields["skills"],
+                    ranking_score=fields["ranking_score"],
+                    sentiment=fields["sentiment"],
+                    recommended_roles=", ".join(fields["recommended_roles"]),
+                    missing_skills=fields["missing_skills"],
+                    file=fields["file"],
+                )
+                if key in existing:
+                    stored = existing[key]
+                    previous[stored.pk] = analytics.tracked_row(stored)
+                    # Not in update_fields below, so the stored values still stand
+                    resume.name, resume.education, resume.experience, resume.skills = (
+                        stored.name, stored.education, stored.experience, stored.skills
+                    )
+                skills_gap.materialize(resume)  # bulk_create doesn't call save()
+                resumes.append(resume)
+
+            # One upsert on the (email, phone) key: re-screened candidates only get new scores
+            Resume.objects.bulk_create(
+                resumes, batch_size=500, update_conflicts=True, unique_fields=["email", "phone"],
+                update_fields=["ranking_score", "sentiment", "recommended_roles", "missing_skills", "file",
+                               "skills_gap", "content_version", "updated_at"],
+            )
+            for resume in resumes:
+                by_key[(resume.email, resume.phone)]["resume_id"] = resume.pk
+            to_update = [resume for resume in resumes if resume.pk in previous]
+            to_create = [resume for resume in resumes if resume.pk not in previous]
+
+            # Bulk writes send no signals
+            transaction.on_commit(leaderboard.invalidate)
+            transaction.on_commit(http_cache.bump)
+            analytics.resumes_changed(
+                [(resume.pk, None, analytics.tracked_row(resume)) for resume in to_create]
+                + [(resume.pk, previous[resume.pk], analytics.tracked_row(resume)) for resume in to_update]
+            )
+            return len(to_create), len(to_update)
+
+    def discover(self, patterns):
+        paths = []
+        for pattern in patterns:
+            if os.path.isdir(pattern):
+                pattern = os.path.join(pattern, "*.pdf")
+            paths.extend(path for path in glob.glob(pattern) if path.lower().endswith(".pdf"))
+        return sorted({os.path.abspath(path) for path in paths})
+
+    def default_checkpoint(self, patterns):
+        first = patterns[0]
+        directory = first if os.path.isdir(first) else os.path.dirname(first) or "."
+        return os.path.join(directory, ".screen_resumes.json")
+
+    def file_key(self, path):
+        # A changed file (size or mtime) is screened again on the next run
+        stat = os.stat(path)
+        return f"{stat.st_size}:{int(stat.st_mtime)}"
+
+    def load_checkpoint(self, path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_checkpoint(self, path, done):
+        # Written to a temporary file and renamed so an interruption never leaves it half-written
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(done, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,123 @@
+import os
+import time
+
+import pandas as pd
+import sklearn
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from resume_screening import model_registry
+from resume_screening.models import Resume
+from resume_screening.scoring import EDU_MAPPING, FEATURE_COLUMNS
+
+
+def resume_rows():
+    """
+    Training rows from screened resumes that have a ranking score.
+    """
+    rows = []
+    for education, experience, skills, score in Resume.objects.filter(ranking_score__isnull=False).values_list(
+        "education", "experience", "skills", "ranking_score"
+    ):
+        skills_count = len([skill for skill in (skills or "").split(",") if skill.strip()])
+        rows.append((EDU_MAPPING.get(education, 1), experience or 0, skills_count, score))
+    return pd.DataFrame(rows, columns=FEATURE_COLUMNS + ["ranking_score"])
+
+
+class Command(BaseCommand):
+    help = "Train the ranking model on all cores and publish it to the model registry."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dataset", default=os.path.join(settings.BASE_DIR, "resume_ranking_dataset.csv"),
+            help="CSV with education, experience, skills and ranking_score columns ('' to skip)",
+        )
+        parser.add_argument("--from-resumes", action="store_true", help="Also train on screened Resume rows")
+        parser.add_argument("--n-estimators", type=int, default=100, help="Trees in a fresh model")
+        parser.add_argument(
+            "--warm-start", type=int, metavar="TREES",
+            help="Add this many trees, fitted on the new data, to the current registry model instead of retraining",
+        )
+        parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel training jobs (-1 = all cores)")
+        parser.add_argument("--test-size", type=float, default=0.2, help="Held-out share for metrics")
+        parser.add_argument("--random-state", type=int, default=42)
+        parser.add_argument("--no-activate", action="store_true", help="Publish without making it the current version")
+        parser.add_argument("--activate", metavar="VERSION", help="Only switch the current version (e.g. to roll back)")
+        parser.add_argument("--list", action="store_true", help="Only list published versions")
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            current = model_registry.current_version()
+            for metadata in model_registry.list_versions():
+                marker = "*" if metadata["version"] == current else " "
+                self.stdout.write(
+                    f"{marker} {metadata['version']}  {metadata['n_estimators']} trees  "
+                    f"R² {metadata['metrics']['r2']:.3f}  MAE {metadata['metrics']['mae']:.2f}"
+                )
+            return
+        if options["activate"]:
+            try:
+                model_registry.activate_version(options["activate"])
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(f"{options['activate']} is now the current version"))
+            return
+
+        frames = []
+        if options["dataset"]:
+            frames.append(pd.read_csv(options["dataset"])[FEATURE_COLUMNS + ["ranking_score"]])
+        if options["from_resumes"]:
+            frames.append(resume_rows())
+        data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        if len(data) < 2:
+            raise CommandError("Not enough training rows")
+
+        X, y = data[FEATURE_COLUMNS], data["ranking_score"]
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=options["test_size"], random_state=options["random_state"]
+        )
+
+        parent = None
+        if options["warm_start"]:
+            parent = model_registry.current_version()
+            if parent is None:
+                raise CommandError("--warm-start needs a current model in the registry")
+            model = model_registry.load_sklearn(parent)
+            model.set_params(warm_start=True, n_estimators=model.n_estimators + options["warm_start"],
+                             n_jobs=options["n_jobs"])
+        else:
+            model = RandomForestRegressor(
+                n_estimators=options["n_estimators"], n_jobs=options["n_jobs"], random_state=options["random_state"]
+            )
+
+        started = time.perf_counter()
+        model.fit(X_train, y_train)
+        train_time = time.perf_counter() - started
+        predictions = model.predict(X_test)
+
+        metadata = {
+            "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "parent": parent,
+            "n_estimators": model.n_estimators,
+            "n_jobs": options["n_jobs"],
+            "random_state": options["random_state"],
+            "sklearn": sklearn.__version__,
+            "rows": {"train": len(X_train), "test": len(X_test)},
+            "sources": {"dataset": options["dataset"] or None, "resumes": options["from_resumes"]},
+            "metrics": {
+                "r2": float(r2_score(y_test, predictions)),
+                "mae": float(mean_absolute_error(y_test, predictions)),
+            },
+            "train_seconds": round(train_time, 3),
+        }
+        model.set_params(n_jobs=None, warm_start=False)  # Scoring processes should not fan out
+        version = model_registry.publish(model, metadata, activate=not options["no_activate"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Published {version}{'' if options['no_activate'] else ' (active)'}: {model.n_estimators} trees, "
+            f"{len(X_train)} training rows in {train_time:.2f} s, "
+            f"R² {metadata['metrics']['r2']:.3f}, MAE {metadata['metrics']['mae']:.2f}"
+        ))
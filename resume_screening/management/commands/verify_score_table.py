@@ -0,0 +1,54 @@
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_screening import scoring
+
+
+class Command(BaseCommand):
+    help = "Check every cell of the score lookup table against the pickled sklearn model's predictions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bounds", type=int, nargs=3, metavar=("EDUCATION", "EXPERIENCE", "SKILLS"),
+            help="Table bounds to build and check (default: RESUME_SCREENING_SCORE_TABLE_BOUNDS)",
+        )
+
+    def handle(self, *args, **options):
+        version, model, table = scoring.get_state()
+        if model is None:
+            raise CommandError("No ranking model to check against")
+        # The served model is usually the flattened forest, so check against the original
+        try:
+            reference = scoring.load_reference_model(version)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            raise CommandError(f"Could not load the sklearn model of version {version}: {e}")
+        if reference is None:
+            raise CommandError("No pickled sklearn model to check against")
+
+        def expected(rows):
+            return np.asarray(reference.predict(pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS)), dtype=np.float64)
+
+        if options["bounds"]:
+            started = time.perf_counter()
+            table = scoring.build_table(model, options["bounds"])
+            self.stdout.write(f"Built in {(time.perf_counter() - started) * 1000:.0f} ms")
+        elif table is None:  # Otherwise check the table predict_scores is actually using
+            raise CommandError("The score table is disabled; pass --bounds to check one anyway")
+
+        grid = np.indices(table.scores.shape).reshape(3, -1).T.astype(float)
+        got, found = table.lookup(grid)
+        mismatched = int(np.count_nonzero(~found | (got != expected(grid))))
+        self.stdout.write(f"{len(grid)} cells for bounds {table.bounds}, {table.scores.nbytes / 1024:.0f} KiB")
+
+        # Rows just outside the bounds must fall back to the served model
+        outside = grid[-1] + np.eye(3)
+        fallback = table.predict(outside, lambda rows: scoring.model_predict(model, rows))
+        mismatched += int(np.count_nonzero(fallback != expected(outside)))
+
+        if mismatched:
+            raise CommandError(f"{mismatched} rows differ from the sklearn model's predict")
+        self.stdout.write(self.style.SUCCESS("Every cell matches the sklearn model's predict"))
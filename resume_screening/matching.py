@@ -0,0 +1,160 @@
+import os
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from . import embeddings, http_cache
+from .models import JobDescription, Resume
+from .skill_matcher import tokenize
+from .taxonomy import get_taxonomy
+from .vector_index import VectorStore
+
+RESUMES = "resumes"
+JOB_DESCRIPTIONS = "job_descriptions"
+
+# Most matches a single ranking request returns
+MAX_MATCHES = 1000
+
+
+def index_dir():
+    """
+    Directory holding one vector store per kind of document (resumes, job descriptions).
+    """
+    return getattr(settings, "RESUME_SCREENING_VECTOR_INDEX", os.path.join(settings.BASE_DIR, "vectors"))
+
+
+def nprobe():
+    """
+    IVF lists scanned per approximate search; more is slower but closer to exact.
+    """
+    return getattr(settings, "RESUME_SCREENING_VECTOR_NPROBE", 16)
+
+
+_stores = {}
+_lock = threading.Lock()
+
+
+def get_store(kind):
+    """
+    The process-wide VectorStore of a kind, in a subdirectory named after the embedding
+    signature so vectors from an older embedding are never compared with new ones.
+    """
+    store = _stores.get(kind)
+    if store is None:
+        with _lock:
+            store = _stores.get(kind)
+            if store is None:
+                path = os.path.join(index_dir(), embeddings.signature(), kind)
+                store = _stores[kind] = VectorStore(path, embeddings.dimension())
+    return store
+
+
+def job_description_skills(text):
+    """
+    Distinct lowercase taxonomy skills mentioned in a job description, in order.
+    """
+    return list(dict.fromkeys(skill for skill, _, _ in get_taxonomy().matcher.find_tokens(tokenize(text))))
+
+
+def profile_text(resume):
+    """
+    Stand-in text for resumes screened before embeddings existed (their full text is not
+    stored): skills, recommended roles and education.
+    """
+    return " ".join(filter(None, [resume.skills, resume.recommended_roles, resume.education]))
+
+
+def index_resumes(vectors):
+    """
+    Stores resume embeddings, given as {resume id: sparse embedding} (see embeddings.sparse).
+    """
+    vectors = {resume_id: vector for resume_id, vector in vectors.items() if vector is not None}
+    if vectors:
+        get_store(RESUMES).add(list(vectors), [embeddings.dense(vector) for vector in vectors.values()])
+
+
+def rank_resumes(job_description, k=20, exact=False):
+    """
+    Resumes closest to a job description, as (resume id, cosine similarity) pairs.
+    """
+    query = get_store(JOB_DESCRIPTIONS).get(job_description.pk)
+    if query is None:
+        query = embeddings.embed_text(job_description.description)
+    return get_store(RESUMES).search(query, k=k, exact=exact, nprobe=nprobe())
+
+
+def best_job_descriptions(resume, k=5):
+    """
+    Job descriptions closest to a resume, as (job description id, cosine similarity) pairs.
+    """
+    query = get_store(RESUMES).get(resume.pk)
+    if query is None:
+        query = embeddings.embed_text(profile_text(resume))
+    return get_store(JOB_DESCRIPTIONS).search(query, k=k, exact=True)
+
+
+def best_job_description_id(resume):
+    """
+    Id of the job description closest to a resume, or None; cached until resumes or job
+    descriptions next change.
+    """
+    key = f"resume_screening:best_jd:{resume.pk}:{resume.content_version}:{http_cache.data_version()}"
+    best = cache.get(key)
+    if best is None:
+        found = best_job_descriptions(resume, 1)
+        best = found[0][0] if found else 0
+        cache.set(key, best, http_cache.timeout())
+    return best or None
+
+
+def backfill(batch_size=1000):
+    """
+    Embeds the resumes (from profile_text) and job descriptions that have no vector yet.
+    Returns the number of (resumes, job descriptions) added.
+    """
+    counts = []
+    for kind, model, text in ((RESUMES, Resume, profile_text), (JOB_DESCRIPTIONS, JobDescription, None)):
+        store = get_store(kind)
+        indexed = set(store.ids().tolist())
+        added = 0
+        batch = []
+        for item in model.objects.order_by("pk").iterator(chunk_size=batch_size):
+            if item.pk in indexed:
+                continue
+            batch.append(item)
+            if len(batch) == batch_size:
+                store.add([i.pk for i in batch], [embeddings.embed_text(text(i) if text else i.description) for i in batch])
+                added += len(batch)
+                batch = []
+        if batch:
+            store.add([i.pk for i in batch], [embeddings.embed_text(text(i) if text else i.description) for i in batch])
+            added += len(batch)
+        counts.append(added)
+    return tuple(counts)
+
+
+def job_description_pre_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        instance.skills = ", ".join(job_description_skills(instance.description))
+
+
+def job_description_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        get_store(JOB_DESCRIPTIONS).add([instance.pk], [embeddings.embed_text(instance.description)])
+
+
+def job_description_deleted(sender, instance, **kwargs):
+    get_store(JOB_DESCRIPTIONS).remove([instance.pk])
+
+
+def resume_deleted(sender, instance, **kwargs):
+    get_store(RESUMES).remove([instance.pk])
+
+
+def connect_signals():
+    pre_save.connect(job_description_pre_save, sender=JobDescription, dispatch_uid="matching_jd_pre_save")
+    post_save.connect(job_description_saved, sender=JobDescription, dispatch_uid="matching_jd_saved")
+    post_delete.connect(job_description_deleted, sender=JobDescription, dispatch_uid="matching_jd_deleted")
+    post_delete.connect(resume_deleted, sender=Resume, dispatch_uid="matching_resume_deleted")
@@ -0,0 +1,222 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# Request methods labelled as themselves; anything else is counted as "other"
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Upper bounds (bytes) of the upload size histogram buckets
+SIZE_BUCKETS = (16_384, 65_536, 262_144, 1_048_576, 4_194_304, 16_777_216)
+
+# Upper bounds of the PDF page count histogram buckets
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50)
+
+
+def enabled():
+    """
+    Whether the request timing middleware and the /metrics endpoint are on.
+    """
+    return getattr(settings, "RESUME_SCREENING_METRICS", True)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    A monotonically increasing count, optionally split by label values.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            values = dict(self.values)
+        for key, value in sorted(values.items()):
+            yield self.name + "_total", _format_labels(self.labels, key), value
+
+
+class Histogram:
+    """
+    Observations counted into fixed buckets, optionally split by label values. An
+    observation costs a bisect and three additions under a lock; cumulative bucket counts
+    are only worked out when the metrics are rendered.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, buckets=LATENCY_BUCKETS, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.labels = tuple(labels)
+        self.values = {}  # label values -> [count per bucket (+Inf last), sum]
+        self.lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def samples(self):
+        with self.lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self.values.items()}
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield self.name + "_bucket", _format_labels(self.labels, key, [("le", _format_value(bound))]), cumulative
+            yield self.name + "_sum", _format_labels(self.labels, key), total
+            yield self.name + "_count", _format_labels(self.labels, key), cumulative
+
+
+class Gauge:
+    """
+    A value read when the metrics are rendered, from a callable returning either a number
+    or a {label value: number} dict (for a single label).
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, read, label=None):
+        self.name = name
+        self.documentation = documentation
+        self.read = read
+        self.label = label
+
+    def samples(self):
+        value = self.read()
+        if self.label is None:
+            yield self.name, "", value
+        else:
+            for key, item in sorted(value.items()):
+                yield self.name, _format_labels([self.label], [key]), item
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        with self.lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+    def render(self):
+        """
+        All metrics in the Prometheus text exposition format (version 0.0.4).
+        """
+        lines = []
+        with self.lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name, documentation, labels=()):
+    return REGISTRY.register(Counter(name, documentation, labels))
+
+
+def histogram(name, documentation, buckets=LATENCY_BUCKETS, labels=()):
+    return REGISTRY.register(Histogram(name, documentation, buckets, labels))
+
+
+def gauge(name, documentation, read, label=None):
+    return REGISTRY.register(Gauge(name, documentation, read, label))
+
+
+# Metrics of this process (each server or worker process exposes its own)
+REQUEST_SECONDS = histogram(
+    "resume_screening_request_duration_seconds", "Time to answer an HTTP request.", labels=("view", "method", "status")
+)
+STAGE_SECONDS = histogram(
+    "resume_screening_stage_duration_seconds",
+    "Time spent in each stage of screening a resume (extract, features, sentiment, embedding, roles, "
+    "predict, persist).",
+    labels=("stage",),
+)
+UPLOAD_BYTES = histogram("resume_screening_upload_size_bytes", "Size of uploaded resume PDFs.", buckets=SIZE_BUCKETS)
+PDF_PAGES = histogram("resume_screening_pdf_pages", "Pages read from each parsed PDF.", buckets=PAGE_BUCKETS)
+PARSE_FAILURES = counter(
+    "resume_screening_parse_failures", "Uploads that could not be screened, by reason.", labels=("reason",)
+)
+SCREENED = counter("resume_screening_resumes_screened", "Resumes screened and saved.")
+PARSE_CACHE_LOOKUPS = counter(
+    "resume_screening_parse_cache_lookups", "Parse cache lookups for uploaded PDFs, by result (hit or miss).",
+    labels=("result",),
+)
+RESPONSE_CACHE_LOOKUPS = counter(
+    "resume_screening_response_cache_lookups",
+    "Response cache lookups (result pages, ranking chart, dashboard data), by response and result.",
+    labels=("response", "result"),
+)
+
+
+@contextmanager
+def timed(stage, into=None):
+    """
+    Times a screening stage into STAGE_SECONDS, or adds its duration to the `into` dict
+    instead (in worker processes, whose metrics the parent records; see record_stages).
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if into is None:
+            STAGE_SECONDS.observe(elapsed, stage=stage)
+        else:
+            into[stage] = into.get(stage, 0.0) + elapsed
+
+
+def record_stages(timings):
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.observe(seconds, stage=stage)
+
+
+def render():
+    return REGISTRY.render()
@@ -0,0 +1,105 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+
+from . import metrics, offload, profiling
+
+
+class RequestMetricsMiddleware:
+    """
+    Records how long each request takes in metrics.REQUEST_SECONDS, labelled by URL name
+    (not path, which would give every resume its own series), method and status code.
+    Works in both sync and async stacks without adapting the views around it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not metrics.enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, started)
+        return response
+
+    def record(self, request, response, started):
+        match = request.resolver_match
+        metrics.REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            view=(match.url_name or match.view_name) if match else "unmatched",
+            method=request.method if request.method in metrics.METHODS else "other",
+            status=response.status_code,
+        )
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in sampling profiler (see profiling): profiles RESUME_SCREENING_PROFILE_SAMPLE_RATE
+    of requests with their peak memory, and any request running past
+    RESUME_SCREENING_PROFILE_SLOW_SECONDS from then on. Profiles of slow or heavy requests
+    to resume_screening views are written to RESUME_SCREENING_PROFILE_DIR.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not profiling.enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.profiler = profiling.get_profiler()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        capture = self.profiler.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            duration = self.profiler.end(capture)
+        if self.keeps(request, capture, duration):
+            profiling.write(capture, duration, self.details(request, response))
+        return response
+
+    async def __acall__(self, request):
+        capture = self.profiler.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            duration = self.profiler.end(capture)
+        if self.keeps(request, capture, duration):
+            await offload.run_blocking(profiling.write, capture, duration, self.details(request, response))
+        return response
+
+    def keeps(self, request, capture, duration):
+        match = request.resolver_match
+        if not match or not getattr(match.func, "__module__", "").startswith(profiling.APP_PACKAGE):
+            return False  # Admin, static files, unmatched URLs
+        return profiling.keeps(capture, duration)
+
+    def details(self, request, response):
+        upload = request.FILES.get("resume") if request.method == "POST" else None
+        return {
+            "path": request.path,
+            "method": request.method,
+            "view": request.resolver_match.url_name,
+            "status": response.status_code,
+            "resume_size": upload.size if upload else None,
+        }
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_screening', '0008_parsecache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScreeningJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(upload_to='uploads/')),
+                ('original_name', models.CharField(blank=True, max_length=255)),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('content_hash', models.CharField(blank=True, max_length=64)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('stage', models.CharField(default='queued', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('enqueued_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('resume', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='resume_screening.resume')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'enqueued_at'], name='resume_scre_status_5d010a_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_screening', '0009_screeningjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['-ranking_score', '-id'], name='resume_ranking_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['-uploaded_at', '-id'], name='resume_recent_idx'),
+        ),
+    ]
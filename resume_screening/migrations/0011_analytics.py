@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_screening', '0010_resume_leaderboard_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AnalyticsCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=20)),
+                ('value', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['dimension', '-count'], name='analytics_counter_top_idx')],
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'value'), name='analytics_counter_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumeSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_skills', to='resume_screening.resume')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_skills', to='resume_screening.skill')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('resume', 'skill'), name='resume_skill_unique')],
+            },
+        ),
+    ]
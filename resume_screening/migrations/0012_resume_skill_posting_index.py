@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_screening', '0011_analytics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeskill',
+            name='ranking_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='resumeskill',
+            index=models.Index(fields=['skill', '-ranking_score', '-resume'], name='resume_skill_posting_idx'),
+        ),
+    ]
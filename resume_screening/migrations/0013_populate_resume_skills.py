@@ -0,0 +1,72 @@
+import json
+from collections import Counter
+
+from django.db import migrations
+
+BATCH_SIZE = 2000
+
+
+def split_skills(skills):
+    names = (name.strip()[:255] for name in (skills or "").split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def score_bucket(score):
+    return None if score is None else max(0, min(int(score // 10) * 10, 90))
+
+
+def populate(apps, schema_editor):
+    """
+    Builds Skill/ResumeSkill rows and the analytics counters from the text columns of the
+    existing resumes, and turns missing_skills stored as json.dumps() strings into JSON.
+    """
+    Resume = apps.get_model("resume_screening", "Resume")
+    Skill = apps.get_model("resume_screening", "Skill")
+    ResumeSkill = apps.get_model("resume_screening", "ResumeSkill")
+    AnalyticsCounter = apps.get_model("resume_screening", "AnalyticsCounter")
+
+    ResumeSkill.objects.all().delete()
+    AnalyticsCounter.objects.all().delete()
+    ids = dict(Skill.objects.values_list("name", "id"))
+    counts = Counter()
+
+    rows = Resume.objects.order_by("pk").values_list("pk", "education", "sentiment", "ranking_score", "skills")
+    links = []
+    for pk, education, sentiment, ranking_score, skills in rows.iterator(chunk_size=BATCH_SIZE):
+        counts[("total", "")] += 1
+        counts[("education", (education or "Unknown")[:255])] += 1
+        counts[("sentiment", sentiment or "Neutral")] += 1
+        if ranking_score is not None:
+            counts[("score", str(score_bucket(ranking_score)))] += 1
+        for name in split_skills(skills):
+            counts[("skill", name)] += 1
+            if name not in ids:
+                ids[name] = Skill.objects.create(name=name).id
+            links.append(ResumeSkill(resume_id=pk, skill_id=ids[name], ranking_score=ranking_score))
+        if len(links) >= BATCH_SIZE:
+            ResumeSkill.objects.bulk_create(links, batch_size=500)
+            links = []
+    ResumeSkill.objects.bulk_create(links, batch_size=500)
+    AnalyticsCounter.objects.bulk_create(
+        [AnalyticsCounter(dimension=dimension, value=value, count=count) for (dimension, value), count in counts.items()],
+        batch_size=500,
+    )
+
+    for resume in Resume.objects.only("missing_skills").iterator(chunk_size=BATCH_SIZE):
+        if isinstance(resume.missing_skills, str):
+            try:
+                resume.missing_skills = json.loads(resume.missing_skills) if resume.missing_skills else {}
+            except ValueError:
+                resume.missing_skills = {}
+            resume.save(update_fields=["missing_skills"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_screening', '0012_resume_skill_posting_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def score_bucket(score):
+    return None if score is None else max(0, min(int(score // 10) * 10, 90))
+
+
+def remove_duplicates(apps, schema_editor):
+    """
+    Keeps the most recently uploaded resume of each (email, phone) pair, moving screening
+    jobs over to it, and takes the others out of the analytics counters.
+    """
+    Resume = apps.get_model("resume_screening", "Resume")
+    ScreeningJob = apps.get_model("resume_screening", "ScreeningJob")
+    AnalyticsCounter = apps.get_model("resume_screening", "AnalyticsCounter")
+
+    # NULLs never collide under the constraint, so only complete keys need deduplicating
+    keys = (
+        Resume.objects.exclude(email=None).exclude(phone=None).values("email", "phone").annotate(n=Count("id")).filter(n__gt=1)
+        .values_list("email", "phone")
+    )
+    counts = Counter()
+    for email, phone in keys:
+        keep, *duplicates = Resume.objects.filter(email=email, phone=phone).order_by("-uploaded_at", "-id")
+        for resume in duplicates:
+            counts[("total", "")] += 1
+            counts[("education", (resume.education or "Unknown")[:255])] += 1
+            counts[("sentiment", resume.sentiment or "Neutral")] += 1
+            if resume.ranking_score is not None:
+                counts[("score", str(score_bucket(resume.ranking_score)))] += 1
+            names = (name.strip()[:255] for name in (resume.skills or "").split(","))
+            for name in dict.fromkeys(name for name in names if name):
+                counts[("skill", name)] += 1
+        ids = [resume.pk for resume in duplicates]
+        ScreeningJob.objects.filter(resume_id__in=ids).update(resume_id=keep.pk)
+        Resume.objects.filter(pk__in=ids).delete()  # ResumeSkill links cascade
+
+    for (dimension, value), count in counts.items():
+        AnalyticsCounter.objects.filter(dimension=dimension, value=value).update(count=models.F("count") - count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_screening', '0014_jobdescription'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='resume',
+            constraint=models.UniqueConstraint(fields=('email', 'phone'), name='resume_email_phone_unique'),
+        ),
+    ]
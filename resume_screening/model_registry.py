@@ -0,0 +1,119 @@
+import json
+import os
+import pickle
+import tempfile
+import time
+
+from django.conf import settings
+
+from .forest import FlatForest
+
+CURRENT_FILE = "CURRENT"
+MODEL_FILE = "model.pkl"
+FOREST_FILE = "forest.npy"
+METADATA_FILE = "metadata.json"
+
+
+def registry_dir():
+    """
+    Directory holding one subdirectory per trained ranking model version, plus a CURRENT
+    file naming the active one.
+    """
+    return getattr(settings, "RESUME_SCREENING_MODEL_REGISTRY", os.path.join(settings.BASE_DIR, "models"))
+
+
+def version_dir(version, root=None):
+    return os.path.join(root or registry_dir(), version)
+
+
+def current_version(root=None):
+    """
+    Name of the active version, or None when nothing has been published yet.
+    """
+    try:
+        with open(os.path.join(root or registry_dir(), CURRENT_FILE)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def list_versions(root=None):
+    """
+    Published versions with their metadata, oldest first.
+    """
+    root = root or registry_dir()
+    if not os.path.isdir(root):
+        return []
+    versions = []
+    for name in sorted(os.listdir(root)):
+        metadata_path = os.path.join(root, name, METADATA_FILE)
+        if os.path.isfile(metadata_path):
+            with open(metadata_path) as f:
+                versions.append(json.load(f))
+    return versions
+
+
+def _write_atomic(path, data):
+    # Write next to the target, then rename over it: readers see the old or new file, never half of one
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def publish(model, metadata, activate=True, root=None):
+    """
+    Stores a trained model as a new version (pickle, flattened forest and metadata) and,
+    by default, makes it the active one. Returns the version name.
+    """
+    root = root or registry_dir()
+    os.makedirs(root, exist_ok=True)
+
+    # A temporary name keeps half-written versions out of list_versions()
+    staging = tempfile.mkdtemp(dir=root, prefix=".staging-")
+    base = time.strftime("%Y%m%d-%H%M%S")
+    version, suffix = base, 1
+    while os.path.exists(version_dir(version, root)):
+        suffix += 1
+        version = f"{base}-{suffix}"
+
+    with open(os.path.join(staging, MODEL_FILE), "wb") as f:
+        pickle.dump(model, f)
+    FlatForest.from_sklearn(model).save(os.path.join(staging, FOREST_FILE))
+    with open(os.path.join(staging, METADATA_FILE), "w") as f:
+        json.dump(dict(metadata, version=version), f, indent=2)
+    os.rename(staging, version_dir(version, root))
+
+    if activate:
+        activate_version(version, root)
+    return version
+
+
+def activate_version(version, root=None):
+    """
+    Points CURRENT at a published version. Running workers pick it up on their next check.
+    """
+    root = root or registry_dir()
+    if not os.path.isfile(os.path.join(version_dir(version, root), METADATA_FILE)):
+        raise ValueError(f"Unknown model version {version!r}")
+    _write_atomic(os.path.join(root, CURRENT_FILE), version.encode())
+
+
+def load_sklearn(version, root=None):
+    """
+    The original sklearn model of a version (needed for warm-start retraining).
+    """
+    with open(os.path.join(version_dir(version, root), MODEL_FILE), "rb") as f:
+        return pickle.load(f)
+
+
+def load_forest(version, root=None):
+    """
+    The flattened forest of a version, which is what scoring uses.
+    """
+    return FlatForest.load(os.path.join(version_dir(version, root), FOREST_FILE))
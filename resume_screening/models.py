@@ -17,5 +17,155 @@ class Resume(models.Model):
     # ✅ Change missing_skills to JSONField for better storage
     missing_skills = models.JSONField(default=dict, blank=True)
 
+    # ✅ Result page data, materialized on save (see skills_gap): the missing skills of each
+    # recommended role, and a hash of everything the page shows (its ETag)
+    skills_gap = models.JSONField(default=dict, blank=True)
+    content_version = models.CharField(max_length=16, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # One resume per candidate: re-uploads update it (see screening.save_resume)
+            models.UniqueConstraint(fields=["email", "phone"], name="resume_email_phone_unique"),
+        ]
+        indexes = [
+            # Leaderboard (best score first) and most-recent-upload lookups
+            models.Index(fields=["-ranking_score", "-id"], name="resume_ranking_idx"),
+            models.Index(fields=["-uploaded_at", "-id"], name="resume_recent_idx"),
+        ]
+
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        from .skills_gap import materialize
+        materialize(self)
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "skills_gap", "content_version"}
+        super().save(*args, **kwargs)
+
+
+class Skill(models.Model):
+    """
+    A distinct skill name; resumes link to their skills through ResumeSkill.
+    """
+    name = models.CharField(max_length=255, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class ResumeSkill(models.Model):
+    """
+    One (resume, skill) pair, kept in step with Resume.skills by resume_screening.analytics.
+    The resume's ranking score is copied here so each skill's posting list can be read in
+    rank order straight from an index (see resume_screening.search).
+    """
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="resume_skills")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="resume_skills")
+    ranking_score = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["resume", "skill"], name="resume_skill_unique")]
+        indexes = [
+            # Posting list of a skill, best-ranked resumes first
+            models.Index(fields=["skill", "-ranking_score", "-resume"], name="resume_skill_posting_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.resume_id}: {self.skill_id}"
+
+
+class AnalyticsCounter(models.Model):
+    """
+    Materialized number of resumes per (dimension, value), e.g. ("skill", "Python") or
+    ("score", "40") for the 40-50 score bucket. Maintained incrementally on every Resume
+    change; `manage.py rebuild_analytics` recomputes it from scratch.
+    """
+    SKILL = "skill"
+    EDUCATION = "education"
+    SENTIMENT = "sentiment"
+    SCORE = "score"
+    TOTAL = "total"
+
+    dimension = models.CharField(max_length=20)
+    value = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["dimension", "value"], name="analytics_counter_unique")]
+        indexes = [models.Index(fields=["dimension", "-count"], name="analytics_counter_top_idx")]
+
+    def __str__(self):
+        return f"{self.dimension}={self.value}: {self.count}"
+
+
+class JobDescription(models.Model):
+    """
+    A job opening that resumes are matched against (resume_screening.matching).
+    """
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    skills = models.TextField(blank=True)  # Taxonomy skills found in the description, set on save
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title
+
+
+class ParseCache(models.Model):
+    """
+    Parsed resume features keyed by a hash of the uploaded PDF bytes. Entries written by
+    an older parser or taxonomy (different `version`) are treated as misses.
+    """
+    key = models.CharField(max_length=64, unique=True)
+    version = models.CharField(max_length=64)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(db_index=True)
+    hits = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.key
+
+
+class ScreeningJob(models.Model):
+    """
+    A queued upload waiting to be (or being) screened by a background worker.
+    """
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [(QUEUED, "Queued"), (RUNNING, "Running"), (DONE, "Done"), (FAILED, "Failed")]
+
+    file = models.FileField(upload_to="uploads/")
+    original_name = models.CharField(max_length=255, blank=True)
+    size = models.PositiveIntegerField(default=0)
+    content_hash = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    stage = models.CharField(max_length=20, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    resume = models.ForeignKey(Resume, null=True, blank=True, on_delete=models.SET_NULL)
+    enqueued_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "enqueued_at"])]
+
+    def queue_wait(self):
+        """Seconds between enqueueing and the (latest) start of processing."""
+        if not self.started_at:
+            return None
+        return (self.started_at - self.enqueued_at).total_seconds()
+
+    def processing_time(self):
+        """Seconds spent processing the final attempt."""
+        if not (self.started_at and self.finished_at):
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+    def __str__(self):
+        return f"Job {self.pk} ({self.status})"
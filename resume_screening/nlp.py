@@ -0,0 +1,43 @@
+import threading
+
+from django.conf import settings
+
+# Pipeline components whose output the screening code never reads
+DEFAULT_DISABLED_COMPONENTS = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+_nlp = None
+_lock = threading.Lock()
+
+
+def nlp_mode():
+    """
+    "fast" runs spaCy only when the name heuristic fails; "full" processes every resume.
+    """
+    return getattr(settings, "RESUME_SCREENING_NLP_MODE", "fast")
+
+
+def get_nlp():
+    """
+    Returns the process-wide spaCy pipeline, loading it on first use.
+    """
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                import spacy  # Deferred so importing the app does not pay for spaCy
+
+                _nlp = spacy.load(
+                    getattr(settings, "RESUME_SCREENING_SPACY_MODEL", "en_core_web_sm"),
+                    disable=getattr(settings, "RESUME_SCREENING_SPACY_DISABLE", DEFAULT_DISABLED_COMPONENTS),
+                )
+    return _nlp
+
+
+def first_person(doc):
+    """
+    Returns the text of the first PERSON entity in a processed doc, or None.
+    """
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            return ent.text
+    return None
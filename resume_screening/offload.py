@@ -0,0 +1,63 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from django.conf import settings
+
+_io_executor = None
+_cpu_executor = None
+_lock = threading.Lock()
+
+
+def _init_cpu_worker():
+    # Needed when worker processes are spawned rather than forked
+    import django
+    django.setup()
+
+
+def io_executor():
+    """
+    Bounded thread pool for blocking I/O (file storage, sync ORM) called from async views.
+    """
+    global _io_executor
+    if _io_executor is None:
+        with _lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "RESUME_SCREENING_IO_WORKERS", 8),
+                    thread_name_prefix="screening-io",
+                )
+    return _io_executor
+
+
+def cpu_executor():
+    """
+    Bounded process pool for CPU-heavy parsing, or None to parse in the calling thread.
+    Separate processes keep a slow PDF from holding the GIL that request threads need.
+    """
+    global _cpu_executor
+    workers = getattr(settings, "RESUME_SCREENING_CPU_WORKERS", 2)
+    if _cpu_executor is None and workers > 0:
+        with _lock:
+            if _cpu_executor is None:
+                _cpu_executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_cpu_worker)
+    return _cpu_executor
+
+
+def run_cpu(func, *args):
+    """
+    Runs a picklable, DB-free function in the CPU pool and waits for its result.
+    """
+    executor = cpu_executor()
+    if executor is None:
+        return func(*args)
+    return executor.submit(func, *args).result()
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Awaits a blocking call on the bounded I/O thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(io_executor(), functools.partial(func, *args, **kwargs))
@@ -0,0 +1,106 @@
+import hashlib
+import threading
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from . import metrics
+from .embeddings import signature as embedding_signature
+from .models import ParseCache
+from .parser import PARSER_VERSION
+from .pdf_extract import get_backend
+from .taxonomy import get_taxonomy
+
+_stats = {"hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name, n=1):
+    with _stats_lock:
+        _stats[name] += n
+
+
+def content_hash(chunks):
+    """
+    SHA-256 of the uploaded bytes; accepts a bytes object or an iterable of chunks.
+    """
+    digest = hashlib.sha256()
+    if isinstance(chunks, (bytes, bytearray, memoryview)):
+        chunks = [chunks]
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def current_version():
+    """
+    Parser version, PDF backend, taxonomy version and embedding space: changing any of them
+    invalidates cached results.
+    """
+    return f"{PARSER_VERSION}:{get_backend().name}:{get_taxonomy().version}:{embedding_signature()}"
+
+
+def max_entries():
+    return getattr(settings, "RESUME_SCREENING_PARSE_CACHE_SIZE", 1000)
+
+
+def get(key):
+    """
+    Returns the cached parse payload for a content hash, or None on a miss.
+    """
+    entry = ParseCache.objects.filter(key=key).only("version", "payload").first()
+    if entry is None:
+        _count("misses")
+        return None
+    if entry.version != current_version():
+        _count("stale")
+        _count("misses")
+        entry.delete()
+        return None
+
+    ParseCache.objects.filter(pk=entry.pk).update(last_used_at=timezone.now(), hits=F("hits") + 1)
+    _count("hits")
+    return entry.payload
+
+
+def put(key, payload):
+    """
+    Stores a parse payload and evicts the least recently used entries beyond the size limit.
+    """
+    ParseCache.objects.update_or_create(
+        key=key,
+        defaults={"version": current_version(), "payload": payload, "last_used_at": timezone.now()},
+    )
+    evict()
+
+
+def evict():
+    limit = max_entries()
+    # Entries from older parser/taxonomy versions can never hit again
+    stale = ParseCache.objects.exclude(version=current_version()).delete()[0]
+    overflow = ParseCache.objects.count() - limit
+    evicted = 0
+    if overflow > 0:
+        oldest = ParseCache.objects.order_by("last_used_at").values_list("pk", flat=True)[:overflow]
+        evicted = ParseCache.objects.filter(pk__in=list(oldest)).delete()[0]
+    if stale or evicted:
+        _count("evictions", stale + evicted)
+
+
+def stats():
+    """
+    Hit/miss counters for this process plus the current number of stored entries.
+    """
+    with _stats_lock:
+        counters = dict(_stats)
+    lookups = counters["hits"] + counters["misses"]
+    counters["hit_rate"] = counters["hits"] / lookups if lookups else 0.0
+    counters["entries"] = ParseCache.objects.count()
+    counters["max_entries"] = max_entries()
+    counters["version"] = current_version()
+    return counters
+
+
+metrics.gauge("resume_screening_parse_cache_entries", "Parsed PDFs stored in the parse cache.",
+              lambda: ParseCache.objects.count())
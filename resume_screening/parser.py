@@ -1,39 +1,47 @@
+import itertools
+import logging
 import re
-import spacy
-from pdfminer.high_level import extract_text
-from textblob import TextBlob
+from .field_extractor import first_fields
+from .pdf_extract import extract_pdf, limits
+from .nlp import get_nlp, nlp_mode, first_person
+from .sentiment import get_lexicon, label
+from .skill_matcher import tokenize
+from .taxonomy import get_taxonomy
 
-# Load NLP model
-nlp = spacy.load("en_core_web_sm")
+# Bump whenever extraction output changes; cached parse results from older versions are ignored
+PARSER_VERSION = "6"
 
-PHONE_REGEX = re.compile(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{4,5}[-.\s]?\d{5}')
+PHONE_LINE_REGEX = re.compile(r"^\+?\d{10,}$")
+LINE_REGEX = re.compile(r"[^\n]+")
+
+logger = logging.getLogger(__name__)
 
 def extract_text_from_pdf(pdf_path):
     """
-    Extracts text from a PDF file.
+    Extracts text from a PDF file (path or binary file object), within the configured
+    page, character and time limits. Use pdf_extract.extract_pdf() for the typed outcome.
     """
-    try:
-        return extract_text(pdf_path)
-    except Exception as e:
-        print(f"Error extracting text from {pdf_path}: {e}")
-        return ""
+    max_pages, max_chars, time_budget = limits()
+    result = extract_pdf(pdf_path, max_pages=max_pages, max_chars=max_chars, time_budget=time_budget)
+    if not result.usable:
+        logger.warning("No text extracted from %s (%s) %s", pdf_path, result.status, result.error)
+    return result.text
 
-def extract_features(resume_text):
+def guess_name_from_lines(resume_text):
     """
-    Extracts key features from the resume, including candidate name, email, phone, education, experience, and skills.
+    Returns the first of the top lines that looks like a candidate name, or None.
     """
-    doc = nlp(resume_text)  # Process text with NLP model
-    lines = [line.strip() for line in resume_text.split("\n") if line.strip()]
-
-    candidate_name = "Unknown"
+    # Only the top 5 non-empty lines are candidates, so stop splitting once we have them
+    lines = itertools.islice(
+        (line for line in (match.group().strip() for match in LINE_REGEX.finditer(resume_text)) if line), 5
+    )
 
     #  Check the first few lines for a valid name
-    for i in range(min(5, len(lines))):  # Only check top 5 lines
-        cleaned_line = lines[i].strip()
+    for cleaned_line in lines:
 
         if (
                 cleaned_line and  # Not empty
-                not re.match(r"^\+?\d{10,}$", cleaned_line) and  # Not a phone number
+                not PHONE_LINE_REGEX.match(cleaned_line) and  # Not a phone number
                 len(cleaned_line.split()) <= 4 and  # Name is usually 1-4 words
                 not any(char in cleaned_line for char in "!@#$%^&*(){}[]<>?/|\\") and  # Avoid symbols
                 "PROFILE" not in cleaned_line.upper() and  # Avoid section headers
@@ -41,138 +49,78 @@ def extract_features(resume_text):
                 "PHONE" not in cleaned_line.upper() and
                 not cleaned_line.isdigit()  # Ensure it is not just a number
         ):
-            candidate_name = cleaned_line
-            break
+            return cleaned_line
+    return None
+
+
+def needs_nlp(resume_text):
+    """
+    Whether extract_features would run spaCy on this text (lets batch callers use nlp.pipe).
+    """
+    return nlp_mode() == "full" or guess_name_from_lines(resume_text) is None
+
+
+def extract_features(resume_text, doc=None, tokens=None):
+    """
+    Extracts key features from the resume, including candidate name, email, phone, education, experience, and skills.
+    `doc` may be an already processed spaCy doc (e.g. from nlp.pipe); otherwise spaCy only
+    runs when needed. `tokens` may be the text's skill_matcher.tokenize() output, shared
+    with analyze_sentiment().
+    """
+    if doc is None and nlp_mode() == "full":
+        doc = get_nlp()(resume_text)  # Process text with NLP model
+
+    candidate_name = guess_name_from_lines(resume_text) or "Unknown"
 
     # Fallback to NLP-based name detection if needed
     if candidate_name == "Unknown":
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                candidate_name = ent.text
-                break
-
-    # **Extract Email**
-    email_match = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", resume_text)
-    candidate_email = email_match.group() if email_match else "Not Provided"
-
-    # **Extract Phone Number**
-    phone_match = PHONE_REGEX.search(resume_text)
-    candidate_phone = phone_match.group() if phone_match else "Not Provided"
-
-    # **Extract Education**
-    education_keywords = ["Diploma", "Engineering", "Bachelors", "Masters", "PhD", "B.Sc", "BEng", "M.Sc"]
-    candidate_education = next((word for word in education_keywords if word.lower() in resume_text.lower()), "Unknown")
-
-    # **Extract Experience**
-    experience_match = re.search(r"(\d+)\s+(years|yrs|year)", resume_text, re.I)
-    candidate_experience = int(experience_match.group(1)) if experience_match else 0
-
-    # **Extract Skills** (Using NLP)
-    predefined_skills = [
-        # Information Technology (IT) & Software Development
-        "Python", "Java", "C", "C++", "C#", "Ruby", "Swift", "Kotlin", "Go", "Rust",
-        "HTML", "CSS", "JavaScript", "TypeScript", "React", "Angular", "Vue.js", "Node.js",
-        "SQL", "MySQL", "PostgreSQL", "MongoDB", "Firebase", "Redis", "Oracle",
-        "AWS", "Azure", "Google Cloud", "Docker", "Kubernetes", "Terraform", "Jenkins",
-        "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "NLP", "Computer Vision",
-        "Ethical Hacking", "Cybersecurity", "Network Security", "SIEM",
-
-        # Data Science & Business Intelligence
-        "Data Analysis", "Data Visualization", "Power BI", "Tableau", "Excel",
-        "Big Data", "Hadoop", "Apache Spark", "Google Analytics",
-        "Business Intelligence", "Market Research", "Data Mining",
-
-        # Finance & Accounting
-        "Financial Modeling", "Investment Analysis", "Risk Management",
-        "Taxation", "Auditing", "Budgeting", "Forecasting",
-        "QuickBooks", "SAP", "Tally", "Xero", "Oracle Financials",
-
-        # Office Productivity & Microsoft Tools
-        "MS Word", "MS Excel", "MS PowerPoint", "MS Outlook", "MS Teams",
-        "Google Docs", "Google Sheets", "Google Slides",
-        "Microsoft Office", "Google Workspace",
-
-        # Healthcare & Medical
-        "Medical Coding", "Patient Care", "Pharmacology", "Nursing",
-        "Electronic Medical Records (EMR)", "Medical Billing", "Health Informatics",
-        "Public Health", "Epidemiology", "Radiology",
-
-        # Sales & Marketing
-        "Digital Marketing", "SEO", "SEM", "PPC", "Social Media Marketing",
-        "Content Marketing", "Email Marketing",
-        "CRM", "Salesforce", "HubSpot", "Lead Generation", "Market Research",
-
-        # Human Resources (HR) & Recruiting
-        "Talent Acquisition", "Employee Relations", "HR Analytics",
-        "Payroll Management", "Compensation & Benefits", "Labor Laws",
-        "LinkedIn Recruiting", "Applicant Tracking System (ATS)",
-
-        # Manufacturing & Supply Chain
-        "Inventory Management", "Logistics", "Procurement", "Vendor Management",
-        "Lean Manufacturing", "Six Sigma", "Quality Assurance (QA)",
-        "SAP ERP", "Supply Chain Analytics",
-
-        # Education & Training
-        "Curriculum Development", "Instructional Design", "e-Learning",
-        "Learning Management System (LMS)", "Online Teaching", "Public Speaking",
-        "Academic Research", "Student Engagement",
-
-        # Legal & Compliance
-        "Corporate Law", "Intellectual Property (IP)", "Legal Research",
-        "Contract Drafting", "Litigation", "Compliance & Risk Management",
-        "Regulatory Affairs", "Government Relations",
-
-        # Design & Creative Fields
-        "Graphic Design", "UI/UX", "Adobe Photoshop", "Illustrator", "Figma",
-        "3D Modeling", "Motion Graphics", "Animation", "Video Editing",
-        "Interior Design", "Fashion Design", "CAD Software"
-    ]
-    extracted_skills = set()  # Use a set to remove duplicates
-
-    for token in doc:
-        if token.text.lower() in [skill.lower() for skill in predefined_skills]:
-            extracted_skills.add(token.text.lower())  # Store in lowercase to avoid case mismatches
+        if doc is None:
+            doc = get_nlp()(resume_text)
+        candidate_name = first_person(doc) or candidate_name
+
+    # **Extract Email, Phone, Education and Experience** (first matches; see field_extractor)
+    fields = first_fields(resume_text)
+
+    # **Extract Skills** (Single pass of the compiled skill matcher over the tokens)
+    if tokens is None:
+        tokens = tokenize(resume_text)
+    extracted_skills = get_taxonomy().matcher.extract_tokens(tokens)  # Canonical lowercase names, deduplicated
 
     candidate_skills = ", ".join(sorted(extracted_skills)) if extracted_skills else "None"
 
     return {
         "name": candidate_name,
-        "email": candidate_email,
-        "phone": candidate_phone,
-        "education": candidate_education,
-        "experience": candidate_experience,
+        "email": fields["email"],
+        "phone": fields["phone"],
+        "education": fields["education"],
+        "experience": fields["experience"],
         "skills": candidate_skills
     }
-def analyze_sentiment(text):
+def analyze_sentiment(text, tokens=None):
     """
     Analyzes the sentiment of the text and returns a sentiment label.
+    Scores TextBlob's lexicon over the parser's tokens (pass `tokens` to reuse them).
     """
-    blob = TextBlob(text)
-    sentiment_score = blob.sentiment.polarity  # Returns a score between -1 and 1
+    sentiment_score = get_lexicon().polarity(tokenize(text) if tokens is None else tokens)  # Between -1 and 1
+    return label(sentiment_score)
 
-    if sentiment_score > 0:
-        return "Positive"
-    elif sentiment_score == 0:
-        return "Neutral"
-    else:
-        return "Negative"
 
-
-def analyze_skills_gap(candidate_skills, job_description):
-    # Debugging: Print input
-    print("Candidate Skills:", candidate_skills)
-    print("Job Description:", job_description)
-
-    # Simulate missing skills calculation (replace this with actual logic)
-    job_required_skills = {"Web Developer": ["css", "javascript", "react", "node.js"]}
+def analyze_skills_gap(candidate_skills, job_description=None, title="Job description"):
+    """
+    Skills the candidate lacks for every taxonomy role and, when a job description text is
+    given, for that job (under `title`): the taxonomy skills it mentions that the
+    candidate does not list.
+    """
+    taxonomy = get_taxonomy()
+    candidate_bits = taxonomy.bitset(candidate_skills.split(","))
 
     missing_skills = {}
-    for role, skills in job_required_skills.items():
-        missing = [skill for skill in skills if skill.lower() not in candidate_skills.lower()]
-        missing_skills[role] = missing
+    for role in taxonomy.roles:
+        missing_skills[role] = taxonomy.missing_skills(role, candidate_bits)
 
-    # Debugging: Print output
-    print("Missing Skills Calculated:", missing_skills)
+    if job_description:
+        have = {skill.strip().lower() for skill in candidate_skills.split(",")}
+        required = dict.fromkeys(skill for skill, _, _ in taxonomy.matcher.find_tokens(tokenize(job_description)))
+        missing_skills[title] = [skill for skill in required if skill not in have]
 
     return missing_skills  # Ensure this returns a dictionary
-
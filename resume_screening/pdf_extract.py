@@ -0,0 +1,308 @@
+import functools
+import importlib.util
+import threading
+import time
+from dataclasses import dataclass
+from io import StringIO
+
+from django.conf import settings
+from pdfminer.converter import PDFConverter, TextConverter
+from pdfminer.layout import LAParams, LTChar, LTContainer
+from pdfminer.pdfdocument import PDFEncryptionError, PDFPasswordIncorrect
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage, PDFTextExtractionNotAllowed
+from pdfminer.utils import open_filename
+
+
+class ExtractionStatus:
+    OK = "ok"                  # Whole document extracted
+    TRUNCATED = "truncated"    # Stopped at the page or character limit
+    TIMEOUT = "timeout"        # Stopped when the time budget ran out
+    EMPTY = "empty"            # Parsed fine but has no text layer (e.g. a scanned image)
+    ENCRYPTED = "encrypted"    # Password protected or text extraction not allowed
+    MALFORMED = "malformed"    # Not a PDF, or too damaged to parse
+
+    # Outcomes that still produced usable text
+    USABLE = (OK, TRUNCATED, TIMEOUT)
+
+
+@dataclass
+class ExtractionResult:
+    status: str
+    text: str = ""
+    pages: int = 0
+    elapsed: float = 0.0
+    error: str = ""
+
+    @property
+    def usable(self):
+        return self.status in ExtractionStatus.USABLE and bool(self.text.strip())
+
+
+class ExtractionFailed(Exception):
+    """
+    Raised for PDFs that cannot produce any text; retrying will not help.
+    """
+
+    def __init__(self, result):
+        super().__init__(f"{result.status}: {result.error}" if result.error else result.status)
+        self.result = result
+
+    def __reduce__(self):
+        # Lets the exception cross the CPU process pool boundary intact
+        return (type(self), (self.result,))
+
+
+def limits():
+    """
+    Default (max_pages, max_chars, time_budget) from settings; None means unlimited.
+    """
+    return (
+        getattr(settings, "RESUME_SCREENING_PDF_MAX_PAGES", None),
+        getattr(settings, "RESUME_SCREENING_PDF_MAX_CHARS", None),
+        getattr(settings, "RESUME_SCREENING_PDF_TIME_BUDGET", None),
+    )
+
+
+class PdfBackend:
+    """
+    A PDF text engine. Subclasses yield the text of each page in turn, ending every page
+    with a form feed like pdfminer does, so downstream parsing sees the same shape.
+    """
+    name = ""
+
+    @classmethod
+    def available(cls):
+        return True
+
+    def iter_page_texts(self, pdf_file):
+        raise NotImplementedError
+
+    def classify_error(self, error):
+        """
+        Maps an engine exception to an ExtractionStatus.
+        """
+        if isinstance(error, (PDFPasswordIncorrect, PDFEncryptionError, PDFTextExtractionNotAllowed)):
+            return ExtractionStatus.ENCRYPTED
+        return ExtractionStatus.MALFORMED
+
+
+class PdfminerBackend(PdfBackend):
+    """
+    Pure-Python pdfminer.six (always installed). Quick mode skips layout analysis
+    (LAParams grouping of lines and text boxes) and emits characters in content-stream
+    order, which is enough for text-layer PDFs exported from word processors.
+    """
+    name = "pdfminer"
+    quick = False
+
+    def iter_page_texts(self, pdf_file):
+        with open_filename(pdf_file, "rb") as fp, StringIO() as output:
+            resources = PDFResourceManager(caching=True)
+            if self.quick:
+                device = LineTextConverter(resources, output)
+            else:
+                device = TextConverter(resources, output, laparams=LAParams())
+            interpreter = PDFPageInterpreter(resources, device)
+
+            for page in PDFPage.get_pages(fp, caching=True):
+                interpreter.process_page(page)
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+
+class LineTextConverter(PDFConverter):
+    """
+    Text device for quick mode: writes characters in content-stream order and only
+    infers line breaks and word gaps from glyph positions, with no layout analysis.
+    """
+
+    def __init__(self, rsrcmgr, outfp):
+        super().__init__(rsrcmgr, outfp, laparams=None)
+        self.previous = None
+
+    def write(self, text):
+        self.outfp.write(text)
+
+    def receive_layout(self, ltpage):
+        self.previous = None
+        self.render(ltpage)
+        self.write("\n\f")
+
+    def render(self, item):
+        if isinstance(item, LTChar):
+            previous = self.previous
+            if previous is not None:
+                if abs(item.y0 - previous.y0) > max(item.height, previous.height) / 2:
+                    self.write("\n")
+                elif item.x0 - previous.x1 > item.width * 0.3 and not previous.get_text().isspace():
+                    self.write(" ")
+            self.write(item.get_text())
+            self.previous = item
+        elif isinstance(item, LTContainer):
+            for child in item:
+                self.render(child)
+
+    # Images and figures carry no text in quick mode
+    def render_image(self, name, stream):
+        pass
+
+    def paint_path(self, gstate, stroke, fill, evenodd, path):
+        pass
+
+
+class PdfminerQuickBackend(PdfminerBackend):
+    name = "pdfminer-quick"
+    quick = True
+
+
+# PDFium is not thread-safe and pypdfium2 does not serialize calls into it, so every call
+# goes through this lock (job worker threads parse in parallel when CPU_WORKERS is 0)
+_pdfium_lock = threading.Lock()
+
+
+class Pypdfium2Backend(PdfBackend):
+    """
+    PDFium through the pypdfium2 bindings (optional dependency), typically an order of
+    magnitude faster than pdfminer. Calls into PDFium are serialized across threads; the
+    lock is released between pages, so threads extracting different PDFs interleave.
+    """
+    name = "pypdfium2"
+
+    @classmethod
+    def available(cls):
+        return importlib.util.find_spec("pypdfium2") is not None
+
+    def iter_page_texts(self, pdf_file):
+        import pypdfium2
+
+        with _pdfium_lock:
+            document = pypdfium2.PdfDocument(pdf_file)
+            pages = len(document)
+        try:
+            for index in range(pages):
+                with _pdfium_lock:
+                    page = document[index]
+                    textpage = page.get_textpage()
+                    try:
+                        text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+                yield text.replace("\r\n", "\n") + "\n\f"
+        finally:
+            with _pdfium_lock:
+                document.close()
+
+    def classify_error(self, error):
+        if "password" in str(error).lower():
+            return ExtractionStatus.ENCRYPTED
+        return ExtractionStatus.MALFORMED
+
+
+class PdftotextBackend(PdfBackend):
+    """
+    Poppler through the pdftotext bindings (optional dependency).
+    """
+    name = "pdftotext"
+
+    @classmethod
+    def available(cls):
+        return importlib.util.find_spec("pdftotext") is not None
+
+    def iter_page_texts(self, pdf_file):
+        import pdftotext
+
+        with open_filename(pdf_file, "rb") as fp:
+            document = pdftotext.PDF(fp)
+            for page_text in document:
+                yield page_text + "\f"
+
+    def classify_error(self, error):
+        if "password" in str(error).lower() or "encrypt" in str(error).lower():
+            return ExtractionStatus.ENCRYPTED
+        return ExtractionStatus.MALFORMED
+
+
+BACKENDS = {
+    "pypdfium2": Pypdfium2Backend,
+    "pdftotext": PdftotextBackend,
+    "pdfminer": PdfminerBackend,
+    "pdfminer-quick": PdfminerQuickBackend,
+}
+
+# Order tried by "auto": fastest first, pdfminer always available as the fallback
+AUTO_PREFERENCE = ["pypdfium2", "pdftotext", "pdfminer"]
+
+
+@functools.lru_cache(maxsize=None)
+def available_backends():
+    """
+    Names of the backends that can run in this environment.
+    """
+    return tuple(name for name, backend in BACKENDS.items() if backend.available())
+
+
+def get_backend(name=None):
+    """
+    Returns a backend instance by name; "auto" (the default setting) picks the fastest
+    installed engine.
+    """
+    name = name or getattr(settings, "RESUME_SCREENING_PDF_BACKEND", "auto")
+    if name == "auto":
+        installed = available_backends()
+        name = next(candidate for candidate in AUTO_PREFERENCE if candidate in installed)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend {name!r}; choose from {', '.join(BACKENDS)} or 'auto'")
+    return BACKENDS[name]()
+
+
+def iter_page_texts(pdf_file, backend=None):
+    """
+    Yields the text of each page in turn. `pdf_file` is a path or a binary file object;
+    it is read by the engine directly, never copied into memory.
+    """
+    return (backend or get_backend()).iter_page_texts(pdf_file)
+
+
+def extract_pdf(pdf_file, max_pages=None, max_chars=None, time_budget=None, backend=None):
+    """
+    Extracts text page by page, stopping early at max_pages, max_chars or after
+    time_budget seconds (checked between pages). Never raises for bad input: the outcome
+    is reported in ExtractionResult.status.
+    """
+    backend = backend or get_backend()
+    started = time.perf_counter()
+    chunks = []
+    chars = 0
+    pages = 0
+    status = ExtractionStatus.OK
+
+    try:
+        page_texts = backend.iter_page_texts(pdf_file)
+        try:
+            for page_text in page_texts:
+                pages += 1
+                if max_chars is not None and chars + len(page_text) > max_chars:
+                    chunks.append(page_text[:max_chars - chars])
+                    status = ExtractionStatus.TRUNCATED
+                    break
+                chunks.append(page_text)
+                chars += len(page_text)
+                if max_pages is not None and pages >= max_pages:
+                    status = ExtractionStatus.TRUNCATED
+                    break
+                if time_budget is not None and time.perf_counter() - started > time_budget:
+                    status = ExtractionStatus.TIMEOUT
+                    break
+        finally:
+            page_texts.close()  # Releases the file even when we stop early
+    except Exception as e:  # PDF engines raise a wide variety of errors for damaged files
+        return ExtractionResult(backend.classify_error(e), pages=pages,
+                                elapsed=time.perf_counter() - started, error=f"{type(e).__name__}: {e}")
+
+    text = "".join(chunks)
+    if status == ExtractionStatus.OK and not text.strip():
+        status = ExtractionStatus.EMPTY
+    return ExtractionResult(status, text=text, pages=pages, elapsed=time.perf_counter() - started)
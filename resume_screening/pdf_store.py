@@ -0,0 +1,34 @@
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+from . import parse_cache
+
+# Same prefix as Resume.file's upload_to
+PREFIX = "resumes"
+
+
+def name_for(content_hash):
+    """
+    Storage name of the PDF with a given SHA-256, fanned out over 256 directories.
+    """
+    return f"{PREFIX}/{content_hash[:2]}/{content_hash}.pdf"
+
+
+def store(source, content_hash=None):
+    """
+    Saves a PDF (an uploaded file or a path) under its content hash and returns the storage
+    name. Identical bytes are stored once however many times they are uploaded.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            return store(File(f), content_hash)
+
+    if content_hash is None:
+        content_hash = parse_cache.content_hash(source.chunks())
+    name = name_for(content_hash)
+    if not default_storage.exists(name):
+        saved = default_storage.save(name, source)
+        if saved != name:
+            # Another upload of the same bytes got there first; keep a single copy
+            default_storage.delete(saved)
+    return name
@@ -0,0 +1,240 @@
+import glob
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+
+from django.conf import settings
+
+# Frames from modules under this prefix mark a thread as doing work for the app
+APP_PACKAGE = "resume_screening"
+
+
+def sample_rate():
+    """
+    Fraction of requests profiled from start to finish, with peak memory tracked.
+    """
+    return getattr(settings, "RESUME_SCREENING_PROFILE_SAMPLE_RATE", 0.0)
+
+
+def slow_seconds():
+    """
+    Requests still running after this many seconds are profiled from then on; None: never.
+    """
+    return getattr(settings, "RESUME_SCREENING_PROFILE_SLOW_SECONDS", None)
+
+
+def memory_threshold():
+    """
+    Peak traced memory (bytes) above which a sampled request's profile is kept.
+    """
+    return getattr(settings, "RESUME_SCREENING_PROFILE_MEMORY_THRESHOLD", 64 * 1024 * 1024)
+
+
+def interval():
+    return getattr(settings, "RESUME_SCREENING_PROFILE_INTERVAL", 0.005)
+
+
+def profile_dir():
+    return getattr(settings, "RESUME_SCREENING_PROFILE_DIR", os.path.join(settings.BASE_DIR, "profiles"))
+
+
+def keep():
+    """
+    Number of profile files kept; older ones are deleted as new ones are written.
+    """
+    return getattr(settings, "RESUME_SCREENING_PROFILE_KEEP", 50)
+
+
+def enabled():
+    return sample_rate() > 0 or slow_seconds() is not None
+
+
+def frame_name(frame):
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def collapse(frame):
+    """
+    A stack as "outermost;...;innermost" frame names, the collapsed format flame graph
+    tools read.
+    """
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def busy_in_app(frame):
+    """
+    Whether a thread is running app code, rather than idle (e.g. a job worker waiting for
+    work) or busy with something else.
+    """
+    if frame.f_globals.get("__name__") in ("threading", "queue"):
+        return False
+    while frame is not None:
+        name = frame.f_globals.get("__name__", "")
+        if name.startswith(APP_PACKAGE) and name != __name__:
+            return True
+        frame = frame.f_back
+    return False
+
+
+class Capture:
+    """
+    Stack samples of one request: those of the thread handling it plus, because async views
+    hand work to pool threads, of every other thread running app code at the same moment
+    (rooted at the thread name; concurrent requests can show up in each other's profile).
+    """
+
+    def __init__(self, sampled):
+        self.thread_id = threading.get_ident()
+        self.sampled = sampled
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc)
+        self.stacks = Counter()
+        self.samples = 0
+        self.peak_memory = None
+
+    def due(self, now, slow):
+        return self.sampled or (slow is not None and now - self.started >= slow)
+
+
+class Profiler:
+    """
+    One sampler thread per process, started by the first request and asleep whenever no
+    request is sampled or past the slow threshold, so unprofiled requests only pay for
+    registering themselves.
+    """
+
+    def __init__(self):
+        self.captures = {}
+        self.condition = threading.Condition()
+        self.thread = None
+        self.tracing = 0  # Sampled requests in flight that need tracemalloc
+        self.started_tracing = False
+
+    def begin(self):
+        capture = Capture(sampled=random.random() < sample_rate())
+        with self.condition:
+            if capture.sampled:
+                if self.tracing == 0:
+                    self.started_tracing = not tracemalloc.is_tracing()
+                    if self.started_tracing:
+                        tracemalloc.start()
+                    tracemalloc.reset_peak()
+                self.tracing += 1
+            self.captures[id(capture)] = capture
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="screening-profiler", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        return capture
+
+    def end(self, capture):
+        """
+        Stops sampling a request; returns its duration in seconds.
+        """
+        with self.condition:
+            self.captures.pop(id(capture), None)
+            if capture.sampled:
+                # The process-wide peak since the oldest sampled request in flight began
+                capture.peak_memory = tracemalloc.get_traced_memory()[1]
+                self.tracing -= 1
+                if self.tracing == 0 and self.started_tracing:
+                    tracemalloc.stop()
+        return time.perf_counter() - capture.started
+
+    def run(self):
+        while True:
+            with self.condition:
+                slow = slow_seconds()
+                now = time.perf_counter()
+                due = [capture for capture in self.captures.values() if capture.due(now, slow)]
+                if not due:
+                    # Sleep until the oldest request would cross the slow threshold
+                    pending = [capture.started + slow - now for capture in self.captures.values()
+                               if slow is not None]
+                    self.condition.wait(min(pending) if pending else None)
+                    continue
+                self.sample(due)
+            time.sleep(interval())
+
+    def sample(self, due):
+        current = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        shared = Counter()
+        request_threads = {capture.thread_id for capture in due}
+        for thread_id, frame in frames.items():
+            if thread_id != current and thread_id not in request_threads and busy_in_app(frame):
+                shared[f"{names.get(thread_id, thread_id)};{collapse(frame)}"] += 1
+        for capture in due:
+            capture.samples += 1
+            frame = frames.get(capture.thread_id)
+            if frame is not None:
+                capture.stacks[f"{names.get(capture.thread_id, capture.thread_id)};{collapse(frame)}"] += 1
+            capture.stacks.update(shared)
+
+
+def keeps(capture, duration):
+    """
+    Whether a finished request's profile is worth writing: slow, or (if sampled) heavy.
+    """
+    if not capture.stacks:
+        return False
+    slow = slow_seconds()
+    if slow is not None and duration >= slow:
+        return True
+    return capture.peak_memory is not None and capture.peak_memory >= memory_threshold()
+
+
+def write(capture, duration, details):
+    """
+    Writes a profile: a "# " line of JSON (request details, duration, peak memory), then
+    the collapsed stacks with their sample counts. Deletes the oldest profiles beyond
+    keep(). Returns the file path.
+    """
+    os.makedirs(profile_dir(), exist_ok=True)
+    name = f"{capture.started_at:%Y%m%dT%H%M%S%f}-{os.getpid()}-{details.get('view') or 'request'}.collapsed"
+    path = os.path.join(profile_dir(), name)
+    header = dict(
+        details,
+        started_at=capture.started_at.isoformat(),
+        duration=round(duration, 6),
+        sampled=capture.sampled,
+        peak_memory=capture.peak_memory,
+        samples=capture.samples,
+        interval=interval(),
+    )
+    with open(path, "w") as f:
+        f.write("# " + json.dumps(header) + "\n")
+        for stack, count in capture.stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    paths = sorted(glob.glob(os.path.join(profile_dir(), "*.collapsed")))
+    for old in paths[:max(0, len(paths) - keep())]:
+        try:
+            os.remove(old)
+        except FileNotFoundError:
+            pass  # Removed by another process
+    return path
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = Profiler()
+    return _profiler
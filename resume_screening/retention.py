@@ -0,0 +1,127 @@
+import glob
+import gzip
+import json
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+
+from . import analytics, http_cache, leaderboard, matching
+from .models import Resume, ResumeSkill, ScreeningJob
+
+# Resume columns copied into archive records (the PDF stays in pdf_store, by name)
+ARCHIVE_FIELDS = (
+    "id", "name", "email", "phone", "education", "experience", "skills", "ranking_score",
+    "sentiment", "recommended_roles", "missing_skills", "file", "uploaded_at",
+)
+
+
+def max_resumes():
+    """
+    Size of the live set; the oldest resumes beyond it are archived. None disables the cap.
+    """
+    return getattr(settings, "RESUME_SCREENING_MAX_RESUMES", 10)
+
+
+def max_age_days():
+    """
+    Age after which a resume is archived whatever the live set size; None keeps them.
+    """
+    return getattr(settings, "RESUME_SCREENING_MAX_RESUME_AGE_DAYS", None)
+
+
+def archive_dir():
+    return getattr(settings, "RESUME_SCREENING_ARCHIVE_DIR", os.path.join(settings.BASE_DIR, "archive"))
+
+
+def batch_size():
+    return getattr(settings, "RESUME_SCREENING_PURGE_BATCH_SIZE", 1000)
+
+
+def due_count(limit, age_days, now):
+    """
+    Number of resumes to archive: enough of the oldest to bring the live set down to
+    `limit` and to cover every resume older than `age_days`.
+    """
+    due = 0
+    if limit is not None:
+        due = max(0, Resume.objects.count() - limit)
+    if age_days is not None:
+        due = max(due, Resume.objects.filter(uploaded_at__lt=now - timedelta(days=age_days)).count())
+    return due
+
+
+def write_archive(rows, now):
+    """
+    Appends resume rows to this month's archive file as one gzip member of JSON lines
+    (concatenated members read back as a single stream). Returns the file path.
+    """
+    os.makedirs(archive_dir(), exist_ok=True)
+    path = os.path.join(archive_dir(), f"resumes-{now:%Y-%m}.jsonl.gz")
+    lines = "".join(json.dumps(dict(row, archived_at=now), cls=DjangoJSONEncoder) + "\n" for row in rows)
+    with open(path, "ab") as f:
+        f.write(gzip.compress(lines.encode()))
+        f.flush()
+        os.fsync(f.fileno())
+    return path
+
+
+def read_archive(path=None):
+    """
+    Yields archived resume records as dicts, from one archive file or all of them in order.
+    A resume archived by a purge that then failed to commit can appear twice.
+    """
+    paths = [path] if path else sorted(glob.glob(os.path.join(archive_dir(), "resumes-*.jsonl.gz")))
+    for path in paths:
+        with gzip.open(path, "rt") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def evict(rows, now):
+    """
+    Archives resume rows (ARCHIVE_FIELDS dicts) and deletes them with set-based statements,
+    one DELETE per table for up to 500 resumes, instead of a delete() per row.
+
+    The DELETE sends no signals, so the counters, skill links, screening jobs, leaderboard,
+    response cache and vector index are brought up to date here.
+    """
+    ids = [row["id"] for row in rows]
+    if not ids:
+        return
+    table = connection.ops.quote_name(Resume._meta.db_table)
+    with transaction.atomic():
+        write_archive(rows, now)
+        for start in range(0, len(ids), analytics.CHUNK_SIZE):
+            chunk = ids[start:start + analytics.CHUNK_SIZE]
+            ScreeningJob.objects.filter(resume_id__in=chunk).update(resume=None)
+            ResumeSkill.objects.filter(resume_id__in=chunk).delete()
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {table} WHERE id IN ({', '.join(['%s'] * len(chunk))})", chunk)
+        analytics.resumes_changed(
+            [(row["id"], tuple(row[field] for field in analytics.TRACKED_FIELDS), None) for row in rows]
+        )
+        transaction.on_commit(leaderboard.invalidate)
+        transaction.on_commit(http_cache.bump)
+        transaction.on_commit(lambda: matching.get_store(matching.RESUMES).remove(ids))
+
+
+def purge(limit, age_days, batch_size=1000, now=None, dry_run=False):
+    """
+    Archives the oldest resumes until the live set is within `limit` and none is older than
+    `age_days` (either may be None), one transaction per batch so uploads are only held up
+    briefly. Returns the number of resumes archived (or due, with dry_run).
+    """
+    now = now or timezone.now()
+    archived = 0
+    while True:
+        with transaction.atomic():
+            due = due_count(limit, age_days, now)
+            if dry_run or not due:
+                return due if dry_run else archived
+            rows = list(Resume.objects.order_by("uploaded_at", "id").values(*ARCHIVE_FIELDS)[:min(due, batch_size)])
+            evict(rows, now)
+        archived += len(rows)
@@ -0,0 +1,82 @@
+from collections import namedtuple
+
+import numpy as np
+from scipy import sparse
+
+RoleMatch = namedtuple("RoleMatch", ["role", "matched", "required", "coverage", "missing"])
+
+
+class RoleMatrix:
+    """
+    Sparse role x skill matrix. A candidate is encoded as a 0/1 vector over the skill
+    vocabulary, so matched counts and coverage for every role come from one sparse
+    matrix-vector product instead of a Python loop over roles.
+    """
+
+    def __init__(self, roles, role_skill_ids, n_skills):
+        self.roles = list(roles)
+        self.n_skills = n_skills
+
+        lengths = np.fromiter((len(ids) for ids in role_skill_ids), dtype=np.int64, count=len(self.roles))
+        self.indptr = np.zeros(len(self.roles) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        # Column ids are kept in the taxonomy's order so missing skills come out in that order
+        self.indices = np.fromiter(
+            (skill_id for ids in role_skill_ids for skill_id in ids), dtype=np.int32, count=int(self.indptr[-1])
+        )
+        self.required = lengths.astype(np.float32)
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(self.indices), dtype=np.float32), self.indices, self.indptr),
+            shape=(len(self.roles), n_skills),
+        )
+
+    def encode(self, skill_ids):
+        """
+        Encodes a collection of skill ids as a dense 0/1 float32 vector.
+        """
+        vector = np.zeros(self.n_skills, dtype=np.float32)
+        vector[list(skill_ids)] = 1.0
+        return vector
+
+    def coverage(self, vectors):
+        """
+        Scores one candidate vector (n_skills,) or a batch (n_candidates, n_skills).
+        Returns (matched, coverage) arrays shaped (n_roles,) or (n_candidates, n_roles).
+        """
+        matched = (self.matrix @ np.asarray(vectors, dtype=np.float32).T).T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = np.where(self.required > 0, matched / self.required, 0.0)
+        return matched, coverage
+
+    def missing(self, role_index, vector):
+        """
+        Returns the skill ids required by the role that the candidate vector lacks.
+        """
+        ids = self.indices[self.indptr[role_index]:self.indptr[role_index + 1]]
+        return ids[vector[ids] == 0]
+
+    def top_roles(self, skill_ids, k=5):
+        """
+        Returns up to k RoleMatch tuples for roles sharing at least one skill with the
+        candidate, ranked by coverage, then matched count, then taxonomy order.
+        """
+        vector = self.encode(skill_ids)
+        matched, coverage = self.coverage(vector)
+
+        candidates = np.flatnonzero(matched)
+        if len(candidates) > k:
+            # Partial selection keeps this O(n_roles); ties at the cut are resolved below
+            cut = np.partition(coverage[candidates], -k)[-k]
+            candidates = candidates[coverage[candidates] >= cut]
+        order = np.lexsort((candidates, -matched[candidates], -coverage[candidates]))[:k]
+
+        return [
+            RoleMatch(
+                role=self.roles[i],
+                matched=int(matched[i]),
+                required=int(self.required[i]),
+                coverage=float(coverage[i]),
+                missing=self.missing(i, vector),
+            )
+            for i in candidates[order]
+        ]
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+class ScoreTable:
+    """
+    Every model prediction over a bounded grid of (education, experience, skills) inputs,
+    so scoring a row inside the bounds is a single array lookup. Rows outside the bounds
+    (or with fractional values) are left to the model.
+    """
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.shape = np.array(scores.shape)
+
+    @classmethod
+    def build(cls, predict, bounds):
+        """
+        `predict` scores a 2-D array of rows; `bounds` are the inclusive maxima of the
+        three inputs, each starting at 0.
+        """
+        shape = tuple(int(bound) + 1 for bound in bounds)
+        grid = np.indices(shape).reshape(len(shape), -1).T  # All cells, in C order
+        return cls(np.asarray(predict(grid.astype(float)), dtype=np.float64).reshape(shape))
+
+    @property
+    def bounds(self):
+        return tuple(int(size) - 1 for size in self.shape)
+
+    def lookup(self, rows):
+        """
+        Returns (scores, found): table scores for each row and a mask of the rows the table
+        covers (scores of the other rows are NaN).
+        """
+        X = np.asarray(rows, dtype=np.float64).reshape(-1, len(self.shape))
+        cells = X.astype(np.intp)
+        found = np.all((X == cells) & (cells >= 0) & (cells < self.shape), axis=1)
+        scores = np.full(len(X), np.nan)
+        scores[found] = self.scores[tuple(cells[found].T)]
+        return scores, found
+
+    def predict(self, rows, predict):
+        """
+        Scores rows from the table, calling `predict` once for whatever falls outside it.
+        """
+        scores, found = self.lookup(rows)
+        if not found.all():
+            missing = np.flatnonzero(~found)
+            scores[missing] = predict(np.asarray(rows, dtype=np.float64).reshape(len(scores), -1)[missing])
+        return scores
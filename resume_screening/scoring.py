@@ -0,0 +1,161 @@
+import logging
+import os
+import pickle
+import threading
+import time
+
+import pandas as pd
+from django.conf import settings
+
+from . import model_registry
+from .forest import FlatForest
+from .score_table import ScoreTable
+
+logger = logging.getLogger(__name__)
+
+# ✅ Trained ranking model (see m1_model.py)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(BASE_DIR, "resume_ranking_model.pkl")
+# ✅ Flattened copy written by `manage.py export_ranker`; preferred when present
+FOREST_PATH = os.path.join(BASE_DIR, "resume_ranking_model.npy")
+
+FEATURE_COLUMNS = ["education", "experience", "skills"]
+EDU_MAPPING = {"Diploma": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
+
+# How often (seconds) scoring checks the model registry for a newly activated version
+RELOAD_CHECK_INTERVAL = 5.0
+
+_state = (None, None, None)  # (registry version, model, score table), swapped as one
+_loaded = False
+_next_check = 0.0
+_lock = threading.RLock()
+
+
+def load_model(path=MODEL_PATH, forest_path=FOREST_PATH):
+    if forest_path and os.path.exists(forest_path):
+        return FlatForest.load(forest_path)
+    try:
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+        logger.info("Loaded ranking model %s", path)
+        return model
+    except FileNotFoundError:
+        logger.warning("Ranking model %s not found; train it first by running m1_model.py", path)
+        return None
+
+
+def table_bounds():
+    """
+    Inclusive (education, experience, skills) maxima of the score lookup table, or None
+    when the table is disabled.
+    """
+    return getattr(settings, "RESUME_SCREENING_SCORE_TABLE_BOUNDS", None)
+
+
+def model_predict(model, rows):
+    """
+    Runs the model itself over a 2-D array of rows.
+    """
+    if isinstance(model, FlatForest):
+        return model.predict(rows)
+    return model.predict(pd.DataFrame(rows, columns=FEATURE_COLUMNS))
+
+
+def build_table(model, bounds=None):
+    bounds = bounds or table_bounds()
+    if model is None or not bounds:
+        return None
+    return ScoreTable.build(lambda rows: model_predict(model, rows), bounds)
+
+
+def load_current():
+    """
+    Loads the registry's active version, or the standalone model files when nothing has
+    been published to the registry. Returns (version, model, table).
+    """
+    version = model_registry.current_version()
+    model = model_registry.load_forest(version) if version else load_model()
+    return version, model, build_table(model)
+
+
+def load_reference_model(version=None):
+    """
+    The pickled sklearn model behind a registry version (or, without one, behind the
+    standalone model files): what the flattened forest and the score table must match.
+    """
+    if version:
+        return model_registry.load_sklearn(version)
+    return load_model(forest_path=None)
+
+
+def reload_model():
+    """
+    Loads the current model and swaps it in. Requests already scoring keep the previous
+    snapshot; later ones see the new model.
+    """
+    global _state, _loaded
+    with _lock:
+        state = load_current()
+        _state, _loaded = state, True
+    return state
+
+
+def get_state():
+    """
+    Returns the (version, model, table) snapshot, loading it on first use and reloading
+    it when another version is activated (checked at most every RELOAD_CHECK_INTERVAL seconds).
+    """
+    global _next_check
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                return reload_model()
+        return _state
+
+    now = time.monotonic()
+    if now >= _next_check:
+        _next_check = now + RELOAD_CHECK_INTERVAL
+        try:
+            if model_registry.current_version() != _state[0]:
+                return reload_model()
+        except (OSError, ValueError):
+            pass  # Keep serving the last good model if the new version cannot be read
+    return _state
+
+
+def get_model():
+    """
+    Returns the ranking model, loading it once per process on first use (and building
+    the score lookup table when enabled).
+    """
+    return get_state()[1]
+
+
+def get_table():
+    return get_state()[2]
+
+
+def model_version():
+    return get_state()[0]
+
+
+def model_input(features):
+    """
+    Builds the (education, experience, skills) model row from extract_features() output.
+    """
+    education_level = EDU_MAPPING.get(features.get("education", "Bachelors"), 1)
+    experience = float(features.get("experience", 0))
+    skills_list = features["skills"].split(",") if features["skills"] else []
+    return [education_level, experience, len(skills_list)]
+
+
+def predict_scores(rows):
+    """
+    Scores many model rows with a single vectorized predict call (or table lookups).
+    """
+    _, model, table = get_state()
+    if not model or not len(rows):
+        return [0] * len(rows)
+    if table is not None:
+        return table.predict(rows, lambda missing: model_predict(model, missing)).tolist()
+    return list(model_predict(model, rows))
@@ -0,0 +1,186 @@
+import io
+
+from django.conf import settings
+from django.db import transaction
+
+from . import embeddings, metrics, offload, parse_cache, pdf_extract
+from .models import Resume
+from .parser import extract_features, analyze_sentiment
+from .scoring import model_input, predict_scores
+from .skill_matcher import tokenize
+from .taxonomy import get_taxonomy
+
+
+def recommend_job_roles(skills, experience, top_k=None):
+    if not skills:  # Ensure we handle the case where no skills are found
+        return ["No skills found. Try adding skills to your resume."], {}
+
+    taxonomy = get_taxonomy()
+    top_k = top_k or getattr(settings, "RESUME_SCREENING_TOP_ROLES", 5)
+    skill_ids = taxonomy.ids(skill for skill in skills if isinstance(skill, str))
+    recommended_roles = []
+    missing_skills = {}
+
+    if experience < 0:
+        return recommended_roles, missing_skills
+
+    # Coverage of every role in one sparse matrix product, best top_k roles first
+    for match in taxonomy.role_matrix.top_roles(skill_ids, k=top_k):
+        recommended_roles.append(match.role)
+
+        # Ensure we add missing skills even if there are matches
+        if len(match.missing):  # Only add if some skills are missing
+            missing_skills[match.role] = [taxonomy.skills[i].lower() for i in match.missing]
+
+    return recommended_roles, missing_skills
+
+
+def candidate_fields(features):
+    """
+    Turns extract_features() output into Resume field values (everything except the
+    ranking score and sentiment).
+    """
+    skills_list = [skill.strip() for skill in features["skills"].split(",")] if features["skills"] else []
+    experience = float(features.get("experience", 0))
+
+    # Recommend Job Roles and Missing Skills
+    recommended_roles, missing_skills = recommend_job_roles(skills_list, experience)
+
+    return {
+        "name": features.get("name", "Unknown").split("-")[-1].strip(),
+        "email": features.get("email", "Not Provided"),
+        "phone": features.get("phone", "Not Provided"),
+        "education": features["education"],
+        "experience": experience,
+        "skills": ", ".join(skills_list),
+        "recommended_roles": recommended_roles,
+        "missing_skills": missing_skills,
+    }
+
+
+def parse_resume(resume_text, doc=None, timings=None):
+    """
+    The expensive, deterministic part of screening: NLP feature extraction and sentiment.
+    The result is JSON-serializable so it can be cached. Stage durations are recorded in
+    the metrics, or added to the `timings` dict when given (see metrics.timed).
+    """
+    with metrics.timed("features", timings):
+        tokens = tokenize(resume_text)  # Shared by skill matching, sentiment and the embedding
+        features = extract_features(resume_text, doc=doc, tokens=tokens)
+    with metrics.timed("sentiment", timings):
+        sentiment = analyze_sentiment(resume_text, tokens=tokens)
+    with metrics.timed("embedding", timings):
+        embedding = embeddings.sparse(tokens)
+    return {"features": features, "sentiment": sentiment, "embedding": embedding}
+
+
+def screen_parsed(parsed):
+    """
+    Completes screening from parse_resume() output: roles, missing skills and ranking score.
+    """
+    features = parsed["features"]
+    with metrics.timed("roles"):
+        fields = candidate_fields(features)
+    with metrics.timed("predict"):
+        fields["ranking_score"] = predict_scores([model_input(features)])[0]
+    fields["sentiment"] = parsed["sentiment"]
+    return fields
+
+
+def screen_resume(resume_text, doc=None):
+    """
+    Runs the full screening pipeline for one resume text and returns Resume field values.
+    """
+    return screen_parsed(parse_resume(resume_text, doc=doc))
+
+
+def parse_pdf(source, key=None):
+    """
+    Extracts and parses a PDF (a file path, or the raw bytes), skipping text extraction and
+    NLP when the same bytes were parsed before by the current parser and taxonomy. `key`
+    is the content hash, if already known. Raises ExtractionFailed for unreadable PDFs.
+    """
+    if key is None:
+        if isinstance(source, bytes):
+            key = parse_cache.content_hash(source)
+        else:
+            with open(source, "rb") as f:
+                key = parse_cache.content_hash(iter(lambda: f.read(64 * 1024), b""))
+    parsed = parse_cache.get(key)
+    if parsed is not None:
+        metrics.PARSE_CACHE_LOOKUPS.inc(result="hit")
+        return parsed
+
+    metrics.PARSE_CACHE_LOOKUPS.inc(result="miss")
+    try:
+        parsed = offload.run_cpu(parse_pdf_source, source)
+    except pdf_extract.ExtractionFailed as e:
+        metrics.PDF_PAGES.observe(e.result.pages)
+        raise
+    # ✅ Stage timings come back with the result (the parse may have run in a worker
+    # process) and are recorded here rather than cached
+    metrics.record_stages(parsed.pop("timings"))
+    metrics.PDF_PAGES.observe(parsed["extraction"]["pages"])
+    parse_cache.put(key, parsed)
+    return parsed
+
+
+def parse_pdf_source(source):
+    """
+    Text extraction plus parse_resume() for a PDF path or bytes. Touches no database, so
+    it can run in a worker process. Files are streamed page by page, not loaded whole.
+    """
+    timings = {}
+    pdf_file = io.BytesIO(source) if isinstance(source, bytes) else source
+    max_pages, max_chars, time_budget = pdf_extract.limits()
+    with metrics.timed("extract", timings):
+        result = pdf_extract.extract_pdf(
+            pdf_file, max_pages=max_pages, max_chars=max_chars, time_budget=time_budget
+        )
+    if not result.usable:
+        raise pdf_extract.ExtractionFailed(result)
+
+    parsed = parse_resume(result.text, timings=timings)
+    parsed["extraction"] = {"status": result.status, "pages": result.pages}
+    parsed["timings"] = timings
+    return parsed
+
+
+def screen_pdf(pdf_bytes):
+    """
+    Screens an uploaded PDF (see parse_pdf) and returns Resume field values.
+    """
+    return screen_parsed(parse_pdf(pdf_bytes))
+
+
+def save_resume(fields):
+    """
+    Stores screening results, updating the existing Resume with the same email and phone
+    instead of creating a duplicate. Runs in one transaction, and the unique (email, phone)
+    constraint settles concurrent uploads of the same candidate. Old resumes are archived
+    by `manage.py purge_resumes` (see retention), not here.
+    """
+    # ✅ Fields refreshed when the candidate uploads again
+    updates = {
+        "ranking_score": fields["ranking_score"],
+        "sentiment": fields["sentiment"],
+        "recommended_roles": ", ".join(fields["recommended_roles"]),
+        "missing_skills": fields["missing_skills"],  # Stored as JSON by the JSONField itself
+    }
+    if fields.get("file"):
+        updates["file"] = fields["file"]  # Content-addressed name from pdf_store
+    with transaction.atomic():
+        # ✅ Update in place, or create; a racing insert of the same key is retried as an update
+        resume, _ = Resume.objects.update_or_create(
+            email=fields["email"],
+            phone=fields["phone"],
+            defaults=updates,
+            create_defaults=dict(
+                updates,
+                name=fields["name"],
+                education=fields["education"],
+                experience=fields["experience"],
+                skills=fields["skills"],
+            ),
+        )
+    return resume
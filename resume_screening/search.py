@@ -0,0 +1,107 @@
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
+
+from .models import AnalyticsCounter, Resume, ResumeSkill, Skill
+
+FIELDS = ("id", "name", "ranking_score", "education", "experience", "skills", "sentiment", "uploaded_at")
+
+
+def max_page_size():
+    return getattr(settings, "RESUME_SCREENING_SEARCH_MAX_PAGE_SIZE", 100)
+
+
+def parse_skills(value):
+    """
+    Splits a "python, sql" style query parameter into distinct lowercase skill names.
+    """
+    names = (name.strip().lower() for name in (value or "").split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def resolve(names):
+    """
+    Maps lowercase skill names to the ids of every Skill spelled that way (any case).
+    Unknown names map to an empty list.
+    """
+    ids = {name: [] for name in names}
+    if names:
+        for skill_id, name in Skill.objects.annotate(lower=Lower("name")).filter(lower__in=names).values_list(
+            "id", "lower"
+        ):
+            ids[name].append(skill_id)
+    return ids
+
+
+def posting_sizes(ids):
+    """
+    Resume count of each required skill, from the analytics counters (no posting list scan).
+    """
+    names = dict(Skill.objects.filter(id__in=[i for group in ids.values() for i in group]).values_list("id", "name"))
+    counts = dict(
+        AnalyticsCounter.objects.filter(dimension=AnalyticsCounter.SKILL, value__in=set(names.values()))
+        .values_list("value", "count")
+    )
+    return {name: sum(counts.get(names[i], 0) for i in group) for name, group in ids.items()}
+
+
+def matching_ids(required, excluded=()):
+    """
+    Resume ids having every skill in `required` and none in `excluded`, best ranked first,
+    as a lazy queryset.
+
+    The posting list of the rarest required skill is walked in rank order straight off the
+    (skill, -ranking_score, -resume) index; every other list is probed per candidate
+    through the unique (resume, skill) index. A page therefore costs about offset + limit
+    probes instead of materializing and sorting every match.
+    """
+    wanted = resolve(required)
+    if any(not group for group in wanted.values()):
+        return ResumeSkill.objects.none().values_list("resume_id", flat=True)
+    unwanted = [i for group in resolve(excluded).values() for i in group]
+
+    if wanted:
+        sizes = posting_sizes(wanted)
+        driver = min(wanted, key=lambda name: sizes[name])
+        driver_ids = wanted.pop(driver)
+        candidates = ResumeSkill.objects.filter(skill_id__in=driver_ids)
+        if len(driver_ids) > 1:
+            candidates = candidates.distinct()  # A resume can list several spellings ("Python", "python")
+        outer = OuterRef("resume_id")
+        order = ("-ranking_score", "-resume_id")
+        column = "resume_id"
+    else:
+        # Only exclusions: walk the resume ranking index instead
+        candidates = Resume.objects.all()
+        outer = OuterRef("pk")
+        order = ("-ranking_score", "-id")
+        column = "id"
+
+    for group in wanted.values():
+        candidates = candidates.filter(Exists(ResumeSkill.objects.filter(resume_id=outer, skill_id__in=group)))
+    if unwanted:
+        candidates = candidates.filter(~Exists(ResumeSkill.objects.filter(resume_id=outer, skill_id__in=unwanted)))
+    return candidates.order_by(*order).values_list(column, flat=True)
+
+
+def search(required, excluded=(), page=1, per_page=20):
+    """
+    One page of resumes matching a skill query. Raises django.core.paginator.InvalidPage
+    for a page number that is not a positive integer or is past the end.
+    """
+    per_page = max(1, min(int(per_page), max_page_size()))
+    paginator = Paginator(matching_ids(required, excluded), per_page)
+    current = paginator.page(page)
+
+    ids = list(current.object_list)
+    rows = {row["id"]: row for row in Resume.objects.filter(id__in=ids).values(*FIELDS)}
+    results = [rows[resume_id] for resume_id in ids if resume_id in rows]
+    return {
+        "results": results,
+        "total": paginator.count,
+        "page": current.number,
+        "per_page": per_page,
+        "num_pages": paginator.num_pages,
+        "has_next": current.has_next(),
+    }
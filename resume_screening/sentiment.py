@@ -0,0 +1,157 @@
+import importlib.util
+import os
+import threading
+from xml.etree import ElementTree
+
+from django.conf import settings
+
+# Words that flip the next assessment. TextBlob also lists "n't", but its tokenizer splits
+# that into "n", "'" and "t", so contractions never negate anything there either
+NEGATIONS = frozenset(["no", "not", "never"])
+
+
+def default_lexicon_path():
+    """
+    TextBlob's English sentiment lexicon, located without importing TextBlob (and NLTK).
+    """
+    spec = importlib.util.find_spec("textblob")
+    return os.path.join(spec.submodule_search_locations[0], "en", "en-sentiment.xml")
+
+
+class SentimentLexicon:
+    """
+    Word -> (polarity, intensity, is_modifier) table built once from TextBlob's lexicon.
+    Scores the tokens the parser already produced (skill_matcher.tokenize) with the same
+    rules as TextBlob's pattern analyzer: adverbs intensify the next known word, negations
+    turn it into a weak opposite, and polarity is the mean over assessed words.
+    """
+
+    def __init__(self, words):
+        self.words = words
+
+    @classmethod
+    def from_xml(cls, path):
+        senses = {}
+        for entry in ElementTree.parse(path).getroot().iter("word"):
+            form = entry.get("form")
+            if form:
+                senses.setdefault(form.lower(), {}).setdefault(entry.get("pos"), []).append(
+                    (float(entry.get("polarity", 0.0)), float(entry.get("intensity", 1.0)))
+                )
+
+        words = {}
+        adjectives = {}
+        for form, by_pos in senses.items():
+            # Average the senses per part of speech, then across parts of speech, as TextBlob does
+            averaged = {pos: tuple(sum(values) / len(values) for values in zip(*scores))
+                        for pos, scores in by_pos.items()}
+            polarity, intensity = (sum(values) / len(values) for values in zip(*averaged.values()))
+            words[form] = (polarity, intensity, "RB" in averaged)
+            if "JJ" in averaged:
+                adjectives[form] = averaged["JJ"]
+
+        # TextBlob also scores "terribly" like "terrible" (and "happily" like "happy"),
+        # replacing whatever the lexicon says about the adverb itself
+        for form, (polarity, intensity) in adjectives.items():
+            stem = form[:-1] + "i" if form.endswith("y") else form
+            stem = stem[:-2] if stem.endswith("le") else stem
+            words[stem + "ly"] = (polarity, intensity, True)
+        return cls(words)
+
+    def polarity(self, tokens):
+        """
+        Mean polarity in [-1, 1] of the known words in a token list (0.0 if there are none).
+        """
+        words = self.words
+        assessments = []  # [polarity, intensity, negated]
+        modifier = None   # Previous known word, if it can intensify the next one
+        negation = None
+        for token in textblob_words(tokens):
+            entry = words.get(token)
+            if entry is not None:
+                polarity, intensity, is_modifier = entry
+                if modifier is None:
+                    assessments.append([polarity, intensity, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(polarity * last[1], 1.0))
+                    last[1] = intensity
+                if negation is not None:
+                    assessments[-1][1] = 1.0 / assessments[-1][1]
+                    assessments[-1][2] = True
+                modifier = token if is_modifier else None
+                negation = token if token in NEGATIONS else None
+            else:
+                if token in NEGATIONS:
+                    negation = token
+                elif negation and len(token) > 1:
+                    negation = None  # Negation carries over small words only ("not a good")
+                if negation is not None and modifier is not None and modifier.endswith("ly"):
+                    assessments[-1][2] = True  # "really not good"
+                    negation = None
+                elif modifier and len(token) > 2:
+                    modifier = None
+        if not assessments:
+            return 0.0
+        return sum(polarity * -0.5 if negated else polarity for polarity, _, negated in assessments) / len(assessments)
+
+    def polarities(self, token_lists):
+        """
+        Batch form of polarity() for bulk ingestion.
+        """
+        return [self.polarity(tokens) for tokens in token_lists]
+
+
+def textblob_words(tokens):
+    """
+    The parser's tokens as TextBlob's tokenizer splits the same text. Both drop the
+    apostrophe of a contraction, but TextBlob cuts "n't" off first, so "don't" is "do", "n"
+    and "t" rather than "don" and "t"; its modifier rules depend on those word lengths.
+    """
+    previous = None
+    for token in tokens:
+        if previous is not None:
+            if token == "t" and len(previous) > 1 and previous.endswith("n"):
+                yield previous[:-1]
+                yield "n"
+            else:
+                yield previous
+        previous = token
+    if previous is not None:
+        yield previous
+
+
+def label(polarity):
+    """
+    The three-way label stored in Resume.sentiment.
+    """
+    if polarity > 0:
+        return "Positive"
+    elif polarity == 0:
+        return "Neutral"
+    return "Negative"
+
+
+_lexicon = None
+_lock = threading.Lock()
+
+
+def get_lexicon():
+    """
+    Returns the process-wide lexicon, loading it on first use.
+    """
+    global _lexicon
+    if _lexicon is None:
+        with _lock:
+            if _lexicon is None:
+                _lexicon = SentimentLexicon.from_xml(
+                    getattr(settings, "RESUME_SCREENING_SENTIMENT_LEXICON", None) or default_lexicon_path()
+                )
+    return _lexicon
+
+
+def sentiment_labels(token_lists):
+    """
+    Labels a batch of tokenized resumes.
+    """
+    return [label(polarity) for polarity in get_lexicon().polarities(token_lists)]
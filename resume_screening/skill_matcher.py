@@ -0,0 +1,85 @@
+import re
+
+# Tokens are runs of letters/digits that may contain inner dots ("node.js", "b.sc") and
+# may end in "++" or "#" ("c++", "c#"). A few punctuation characters that appear inside
+# skill names ("UI/UX", "Compensation & Benefits", "e-Learning") are kept as their own
+# tokens so phrases containing them can still be matched.
+TOKEN_REGEX = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)*(?:\+\+|#)?|[&/()\-]")
+
+_END = object()  # Trie key marking the end of a phrase
+
+
+def tokenize(text):
+    """
+    Splits text into normalized (lowercase) skill tokens.
+    """
+    return TOKEN_REGEX.findall(text.lower())
+
+
+class SkillMatcher:
+    """
+    Token trie over a skill vocabulary. Built once, then matches every skill phrase
+    (including multi-word phrases and aliases) in a single left-to-right pass over the text.
+    """
+
+    def __init__(self, skills, aliases=None):
+        self.root = {}
+        self.max_phrase_length = 0
+        self.canonical = {}
+
+        for skill in skills:
+            self.add(skill, skill)
+        for alias, skill in (aliases or {}).items():
+            self.add(alias, skill)
+
+    def add(self, phrase, skill):
+        """
+        Registers a phrase that should be reported as the given canonical skill.
+        """
+        tokens = tokenize(phrase)
+        if not tokens:
+            return
+
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_END] = skill.lower()
+
+        self.canonical[skill.lower()] = skill
+        self.max_phrase_length = max(self.max_phrase_length, len(tokens))
+
+    def find_tokens(self, tokens):
+        """
+        Yields (skill, start, end) token spans for every skill phrase found in the tokens.
+        Overlapping phrases are all reported ("MS Excel" yields both "ms excel" and "excel").
+        """
+        root = self.root
+        for start, token in enumerate(tokens):
+            node = root.get(token)
+            end = start
+            while node is not None:
+                end += 1
+                skill = node.get(_END)
+                if skill is not None:
+                    yield skill, start, end
+                if end >= len(tokens):
+                    break
+                node = node.get(tokens[end])
+
+    def find_all(self, text):
+        """
+        Yields (skill, start, end) token spans for every skill phrase found in the text.
+        """
+        return self.find_tokens(tokenize(text))
+
+    def extract(self, text):
+        """
+        Returns the set of canonical (lowercase) skills mentioned in the text.
+        """
+        return self.extract_tokens(tokenize(text))
+
+    def extract_tokens(self, tokens):
+        """
+        Same as extract() for text that was already tokenized.
+        """
+        return {skill for skill, _, _ in self.find_tokens(tokens)}
@@ -0,0 +1,55 @@
+import hashlib
+import json
+
+from .taxonomy import get_taxonomy
+
+# Bump when the rules below change: every stored content_version then differs
+GAP_VERSION = 1
+
+# Resume fields the result page shows; content_version changes whenever one of them does
+CONTENT_FIELDS = (
+    "name", "email", "phone", "education", "experience", "skills", "ranking_score", "sentiment", "recommended_roles",
+)
+
+
+def candidate_skills(skills):
+    return {skill.strip().lower() for skill in (skills or "").split(",")}
+
+
+def role_gaps(skills, recommended_roles, stored_missing_skills):
+    """
+    Missing skills of each recommended role: those recorded at screening merged with the
+    role's taxonomy requirements, minus the skills the candidate lists.
+    """
+    taxonomy = get_taxonomy()
+    have = candidate_skills(skills)
+    candidate_bits = taxonomy.bitset(have)
+    stored_missing_skills = stored_missing_skills or {}
+    gaps = {}
+    for role in (recommended_roles.split(", ") if recommended_roles else []):
+        if role not in stored_missing_skills and role not in taxonomy.role_skills:
+            continue  # e.g. the "No skills found" placeholder
+        merged = list(stored_missing_skills.get(role, [])) + taxonomy.missing_skills(role, candidate_bits)
+        gaps[role] = [skill for skill in dict.fromkeys(merged) if skill.strip().lower() not in have]
+    return gaps
+
+
+def job_description_gap(skills, job_description):
+    """
+    The taxonomy skills a job description asks for (JobDescription.skills) that the
+    candidate does not list.
+    """
+    have = candidate_skills(skills)
+    wanted = (skill.strip() for skill in job_description.skills.split(","))
+    return [skill for skill in dict.fromkeys(wanted) if skill and skill.lower() not in have]
+
+
+def materialize(resume):
+    """
+    Sets resume.skills_gap from its other fields, and content_version to a hash of
+    everything its result page shows (plus the gap rules and taxonomy it was built with).
+    """
+    resume.skills_gap = role_gaps(resume.skills, resume.recommended_roles, resume.missing_skills)
+    content = [GAP_VERSION, get_taxonomy().version, [getattr(resume, field) for field in CONTENT_FIELDS],
+               resume.skills_gap]
+    resume.content_version = hashlib.sha256(json.dumps(content, default=str).encode()).hexdigest()[:16]
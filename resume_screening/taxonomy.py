@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+
+from .role_matrix import RoleMatrix
+from .skill_matcher import SkillMatcher
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TAXONOMY_PATH = os.path.join(BASE_DIR, "data", "taxonomy.json")
+
+# How often (seconds) get_taxonomy() checks whether the taxonomy file was edited
+RELOAD_CHECK_INTERVAL = 5.0
+
+
+class Taxonomy:
+    """
+    Immutable snapshot of the skill taxonomy with precomputed lookup indexes.
+
+    Skills are identified by their lowercase canonical name; every skill also has a dense
+    integer id so a set of skills can be stored as an int bitset (bit i == skill id i).
+
+    Only the "skills" list (names and aliases) is extracted from resumes and job
+    descriptions. Role requirements missing from it ("Statistics", "Agile") still get ids,
+    so gap analysis can report them, but are never matched in text: generic words like
+    "design" would otherwise be found inside every "Graphic Design". Matching ignores case,
+    so aliases must be unambiguous in lowercase too (no "ML" or "TS").
+    """
+
+    def __init__(self, data, version=""):
+        self.version = version
+
+        self.skills = []            # id -> canonical display name
+        self.skill_ids = {}         # lowercase canonical name -> id
+        self.skill_categories = {}  # lowercase canonical name -> category
+        self.aliases = {}           # alias -> canonical display name
+
+        for entry in data.get("skills", []):
+            self._add_skill(entry["name"], entry.get("category", ""))
+            for alias in entry.get("aliases", []):
+                self.aliases[alias] = entry["name"]
+        extractable = list(self.skills)
+
+        self.roles = []             # role names, in file order
+        self.role_skills = {}       # role -> tuple of lowercase required skills
+        self.role_bits = {}         # role -> bitset of required skill ids
+        self.skill_roles = {}       # lowercase skill -> tuple of roles requiring it
+
+        for entry in data.get("roles", []):
+            role = entry["name"]
+            required = []
+            for skill in entry.get("required_skills", []):
+                skill = self.aliases.get(skill, skill)
+                if skill.lower() not in self.skill_ids:
+                    self._add_skill(skill, "")  # Role-only: has an id, but is not matched in text
+                required.append(skill.lower())
+
+            self.roles.append(role)
+            self.role_skills[role] = tuple(required)
+            self.role_bits[role] = self.bitset(required)
+            for skill in required:
+                self.skill_roles[skill] = self.skill_roles.get(skill, ()) + (role,)
+
+        self.matcher = SkillMatcher(extractable, self.aliases)
+        self.role_matrix = RoleMatrix(
+            self.roles,
+            [[self.skill_ids[skill] for skill in self.role_skills[role]] for role in self.roles],
+            len(self.skills),
+        )
+
+    def _add_skill(self, name, category):
+        key = name.lower()
+        if key in self.skill_ids:
+            return
+        self.skill_ids[key] = len(self.skills)
+        self.skills.append(name)
+        self.skill_categories[key] = category
+
+    def ids(self, skills):
+        """
+        Returns the ids of the known skills among the given names, deduplicated.
+        """
+        skill_ids = self.skill_ids
+        return {skill_ids[key] for key in (skill.strip().lower() for skill in skills) if key in skill_ids}
+
+    def bitset(self, skills):
+        """
+        Encodes an iterable of skill names as an int bitset. Unknown skills are ignored.
+        """
+        bits = 0
+        skill_ids = self.skill_ids
+        for skill in skills:
+            skill_id = skill_ids.get(skill.strip().lower())
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def skill_names(self, bits):
+        """
+        Decodes a bitset back to lowercase skill names, in skill-id order.
+        """
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.skills[low.bit_length() - 1].lower())
+            bits ^= low
+        return names
+
+    def missing_skills(self, role, candidate_bits):
+        """
+        Returns the role's required skills (lowercase, in taxonomy order) that the candidate lacks.
+        """
+        missing = self.role_bits.get(role, 0) & ~candidate_bits
+        return [skill for skill in self.role_skills.get(role, ()) if missing >> self.skill_ids[skill] & 1]
+
+    def roles_for_skills(self, skills):
+        """
+        Returns the roles (in taxonomy order) that require at least one of the given skills.
+        """
+        matched = set()
+        for skill in skills:
+            matched.update(self.skill_roles.get(skill.strip().lower(), ()))
+        return [role for role in self.roles if role in matched]
+
+
+def taxonomy_path():
+    return getattr(settings, "RESUME_SCREENING_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+
+
+def load_taxonomy(path=None):
+    """
+    Reads and indexes a taxonomy file. The version is a hash of the file contents.
+    """
+    with open(path or taxonomy_path(), "rb") as f:
+        raw = f.read()
+    return Taxonomy(json.loads(raw), version=hashlib.sha1(raw).hexdigest()[:12])
+
+
+_taxonomy = None
+_taxonomy_mtime = None
+_next_check = 0.0
+_lock = threading.Lock()
+
+
+def reload_taxonomy(path=None):
+    """
+    Builds a fresh taxonomy and swaps it in. Readers holding the previous snapshot keep
+    using it; new calls to get_taxonomy() see the new one.
+    """
+    global _taxonomy, _taxonomy_mtime
+    path = path or taxonomy_path()
+    with _lock:
+        mtime = os.path.getmtime(path)
+        taxonomy = load_taxonomy(path)
+        _taxonomy, _taxonomy_mtime = taxonomy, mtime
+    return taxonomy
+
+
+def get_taxonomy():
+    """
+    Returns the current taxonomy, loading it on first use and reloading it when the file
+    has been edited (checked at most every RELOAD_CHECK_INTERVAL seconds).
+    """
+    global _next_check
+    taxonomy = _taxonomy
+    if taxonomy is None:
+        return reload_taxonomy()
+
+    now = time.monotonic()
+    if now >= _next_check:
+        _next_check = now + RELOAD_CHECK_INTERVAL
+        try:
+            if os.path.getmtime(taxonomy_path()) != _taxonomy_mtime:
+                return reload_taxonomy()
+        except (OSError, ValueError):
+            pass  # Keep serving the last good taxonomy if the file is mid-edit or missing
+    return taxonomy
@@ -1,3 +1,1664 @@
-from django.test import TestCase
+import io
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import redirect_stdout
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection, connections, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from sklearn.ensemble import RandomForestRegressor
+
+from benchmarks.bench_sentiment import AGREEMENT_THRESHOLD
+from benchmarks.common import synthetic_pdf
+
+from . import (
+    analytics, field_extractor, jobs, leaderboard, matching, metrics, model_registry, nlp, parse_cache, pdf_extract,
+    pdf_store, profiling, retention, scoring, search, sentiment, taxonomy,
+)
+from .management.commands import screen_resumes
+from .models import AnalyticsCounter, JobDescription, ParseCache, Resume, ResumeSkill, ScreeningJob, Skill
+from .forest import FlatForest
+from .parser import analyze_sentiment, extract_text_from_pdf
+from .screening import recommend_job_roles, save_resume, screen_resume
+from .skill_matcher import SkillMatcher, tokenize
+from .vector_index import VectorStore
+
+
+# Sample resume PDFs shipped with the project
+RESUMES_DIR = Path(__file__).resolve().parent.parent / "resumes"
+
+
+def sample_texts():
+    from pdfminer.high_level import extract_text
+
+    return [extract_text(path) for path in sorted(RESUMES_DIR.glob("*.pdf"))]
+
+
+def candidate(number, score=50.0):
+    return {
+        "name": f"Candidate {number}",
+        "email": f"candidate{number}@example.com",
+        "phone": f"555-{number:04d}",
+        "education": "Bachelor",
+        "experience": 3.0,
+        "skills": "python, sql" if number % 2 else "java, sql",
+        "ranking_score": score,
+        "sentiment": "Positive",
+        "recommended_roles": ["Data Scientist"],
+        "missing_skills": {"Data Scientist": ["statistics"]},
+    }
+
+
+class ConcurrentUploadTests(TransactionTestCase):
+    """
+    Parallel uploads (one database connection per thread, as with the upload workers)
+    must not duplicate a candidate, and purges running alongside them must leave the live
+    set at its size with every evicted resume archived.
+    """
+
+    def setUp(self):
+        vectors = tempfile.TemporaryDirectory()
+        self.addCleanup(vectors.cleanup)
+        archive = tempfile.TemporaryDirectory()
+        self.addCleanup(archive.cleanup)
+        settings = override_settings(RESUME_SCREENING_VECTOR_INDEX=vectors.name, RESUME_SCREENING_ARCHIVE_DIR=archive.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        matching._stores.clear()
+        self.addCleanup(matching._stores.clear)
+
+    def upload_in_parallel(self, uploads):
+        barrier = threading.Barrier(len(uploads))
+        errors = []
+
+        def upload(fields):
+            try:
+                barrier.wait()
+                save_resume(fields)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=upload, args=(fields,)) for fields in uploads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def assertDerivedDataConsistent(self):
+        rows = list(Resume.objects.values_list("pk", *analytics.TRACKED_FIELDS))
+        expected = Counter()
+        for _, *row in rows:
+            expected.update(analytics.contribution(row))
+        stored = Counter({
+            (dimension, value): count
+            for dimension, value, count in AnalyticsCounter.objects.filter(count__gt=0).values_list(
+                "dimension", "value", "count"
+            )
+        })
+        self.assertEqual(stored, expected)
+        self.assertEqual(
+            ResumeSkill.objects.count(), sum(len(analytics.split_skills(row[4])) for row in rows)
+        )
+        self.assertFalse(ResumeSkill.objects.exclude(resume_id__in=[row[0] for row in rows]).exists())
+
+    def test_same_candidate_uploaded_in_parallel_is_stored_once(self):
+        self.upload_in_parallel([candidate(1, score=float(i)) for i in range(8)])
+        self.assertEqual(Resume.objects.filter(email="candidate1@example.com").count(), 1)
+        self.assertDerivedDataConsistent()
+
+    def test_purge_during_parallel_uploads_archives_down_to_the_live_set(self):
+        purged = []
+        purger = threading.Thread(target=lambda: (purged.append(retention.purge(5, None)), connections.close_all()))
+        purger.start()
+        self.upload_in_parallel([candidate(i) for i in range(16)])
+        purger.join()
+        purged.append(retention.purge(5, None))
+
+        self.assertEqual(Resume.objects.count(), 5)
+        self.assertEqual(sum(purged), 11)
+        archived = [record["email"] for record in retention.read_archive()]
+        self.assertEqual(len(archived), 11)
+        self.assertFalse(Resume.objects.filter(email__in=archived).exists())
+        self.assertDerivedDataConsistent()
+
+    def test_purge_archives_the_oldest_and_expired_resumes(self):
+        for i in range(6):
+            save_resume(candidate(i))
+        Resume.objects.filter(email="candidate5@example.com").update(uploaded_at=timezone.now() - timedelta(days=40))
+
+        self.assertEqual(retention.purge(4, 30, dry_run=True), 2)
+        self.assertEqual(retention.purge(4, 30, batch_size=1), 2)
+        self.assertEqual(
+            sorted(Resume.objects.values_list("email", flat=True)),
+            [f"candidate{i}@example.com" for i in range(1, 5)],
+        )
+        records = list(retention.read_archive())
+        self.assertEqual([record["email"] for record in records], ["candidate5@example.com", "candidate0@example.com"])
+        self.assertEqual(records[1]["missing_skills"], {"Data Scientist": ["statistics"]})
+        self.assertDerivedDataConsistent()
+
+
+class UploadPageTests(TransactionTestCase):
+    """
+    The async upload view renders a template that reads request.user (session and user
+    queries), which must not run on the event loop.
+    """
+
+    def test_signed_in_user_gets_the_upload_page(self):
+        self.client.force_login(User.objects.create_user("recruiter", password="secret"))
+        response = self.client.get("/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Sign Out")
+
+    def test_anonymous_user_gets_the_upload_page(self):
+        self.assertContains(self.client.get("/"), "Sign In")
+
+
+class ScreeningJobTests(TransactionTestCase):
+    """
+    Queued uploads are claimed by exactly one worker, retried up to the attempt limit,
+    recovered when their worker dies, and reported through /jobs/<id>/.
+    """
+
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        vectors = tempfile.TemporaryDirectory()
+        self.addCleanup(vectors.cleanup)
+        settings = override_settings(
+            MEDIA_ROOT=media.name, RESUME_SCREENING_VECTOR_INDEX=vectors.name,
+            RESUME_SCREENING_JOB_WORKERS=0, RESUME_SCREENING_JOB_MAX_ATTEMPTS=3, RESUME_SCREENING_JOB_TIMEOUT=300,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        matching._stores.clear()
+        self.addCleanup(matching._stores.clear)
+
+    def enqueue(self, name="Alice_Johnson.pdf"):
+        return jobs.enqueue(SimpleUploadedFile(name, (RESUMES_DIR / name).read_bytes()))
+
+    def job(self, age=0, **fields):
+        job = ScreeningJob.objects.create(file=f"uploads/{ScreeningJob.objects.count()}.pdf", **fields)
+        ScreeningJob.objects.filter(pk=job.pk).update(enqueued_at=timezone.now() - timedelta(seconds=age))
+        return job
+
+    def test_failing_job_is_retried_up_to_the_limit_then_failed(self):
+        job = self.enqueue()
+        with mock.patch.object(jobs, "screen_parsed", side_effect=RuntimeError("scoring broke")) as screen:
+            self.assertEqual(jobs.run_pending(), 3)
+        self.assertEqual(screen.call_count, 3)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.stage, job.attempts), (ScreeningJob.FAILED, ScreeningJob.FAILED, 3))
+        self.assertEqual(job.error, "RuntimeError: scoring broke")
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(job.resume_id)
+        self.assertFalse(Resume.objects.exists())
+
+    def test_job_that_fails_before_the_limit_succeeds_on_retry(self):
+        job = self.enqueue()
+        failures = [RuntimeError("database is locked")] * 2
+        real_screen = jobs.screen_parsed
+
+        def flaky_screen(parsed):
+            if failures:
+                raise failures.pop()
+            return real_screen(parsed)
+
+        with mock.patch.object(jobs, "screen_parsed", side_effect=flaky_screen):
+            self.assertEqual(jobs.run_pending(limit=2), 2)
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts, job.finished_at), (ScreeningJob.QUEUED, 2, None))
+            self.assertEqual(jobs.run_pending(), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (ScreeningJob.DONE, 3))
+        self.assertEqual(job.error, "")
+        self.assertEqual(job.resume.email, Resume.objects.get().email)
+
+    def test_stale_running_jobs_are_requeued_or_failed(self):
+        long_ago = timezone.now() - timedelta(seconds=400)
+        abandoned = self.job(status=ScreeningJob.RUNNING, stage="scoring", started_at=long_ago, attempts=1)
+        exhausted = self.job(status=ScreeningJob.RUNNING, stage="parsing", started_at=long_ago, attempts=3)
+        running = self.job(status=ScreeningJob.RUNNING, stage="parsing", started_at=timezone.now(), attempts=1)
+        queued = self.job(age=400)
+
+        self.assertEqual(jobs.requeue_stale(), 1)
+        for job in (abandoned, exhausted, running, queued):
+            job.refresh_from_db()
+        self.assertEqual((abandoned.status, abandoned.stage), (ScreeningJob.QUEUED, ScreeningJob.QUEUED))
+        self.assertEqual(abandoned.attempts, 1)
+        self.assertEqual((exhausted.status, exhausted.error), (ScreeningJob.FAILED, "Timed out"))
+        self.assertIsNotNone(exhausted.finished_at)
+        self.assertEqual(running.status, ScreeningJob.RUNNING)
+        self.assertEqual(queued.status, ScreeningJob.QUEUED)
+
+        self.assertEqual(jobs.claim_next().pk, queued.pk)  # Oldest first, then the recovered job
+        claimed = jobs.claim_next()
+        self.assertEqual((claimed.pk, claimed.attempts), (abandoned.pk, 2))
+        self.assertIsNone(jobs.claim_next())
+
+    def test_job_claimed_by_another_worker_is_skipped(self):
+        first, second = self.job(age=20), self.job(age=10)
+        now = timezone.now
+        raced = []
+
+        def another_worker_claims_first():
+            # Runs between this worker's SELECT and its conditional UPDATE
+            if not raced:
+                raced.append(ScreeningJob.objects.filter(pk=first.pk).update(status=ScreeningJob.RUNNING))
+            return now()
+
+        with mock.patch("django.utils.timezone.now", side_effect=another_worker_claims_first):
+            claimed = jobs.claim_next()
+        self.assertEqual(claimed.pk, second.pk)
+        first.refresh_from_db()
+        self.assertEqual((first.attempts, first.started_at), (0, None))  # Left to the worker that won it
+
+    def test_parallel_workers_claim_each_job_once(self):
+        queued = {self.job(age=i).pk for i in range(12)}
+        barrier = threading.Barrier(6)
+        claimed, errors = [], []
+
+        def worker():
+            try:
+                barrier.wait()
+                while (job := jobs.claim_next()) is not None:
+                    claimed.append(job.pk)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(claimed), sorted(queued))
+        self.assertEqual(set(ScreeningJob.objects.values_list("status", "attempts")), {(ScreeningJob.RUNNING, 1)})
+
+    def test_unreadable_pdfs_fail_once_and_count_their_reason(self):
+        pdfs = {
+            "encrypted": encrypted_pdf(),
+            "malformed": b"Alice Johnson, Python developer",
+            "empty": synthetic_pdf(1, first_page=[" "]),
+        }
+        for reason, pdf in pdfs.items():
+            with self.subTest(reason):
+                failures = metrics.PARSE_FAILURES.values.get((reason,), 0)
+                job = jobs.enqueue(SimpleUploadedFile(f"{reason}.pdf", pdf))
+                self.assertEqual(jobs.run_pending(), 1)  # Not retried
+                job.refresh_from_db()
+                self.assertEqual((job.status, job.attempts), (ScreeningJob.FAILED, 1))
+                self.assertTrue(job.error.startswith(f"Could not read PDF ({reason}"), job.error)
+                self.assertEqual(metrics.PARSE_FAILURES.values.get((reason,), 0), failures + 1)
+        self.assertFalse(Resume.objects.exists())
+
+    def test_long_pdf_is_screened_from_its_first_pages(self):
+        max_pages = pdf_extract.limits()[0]
+        failures = sum(metrics.PARSE_FAILURES.values.values())
+        pdf = synthetic_pdf(max_pages + 20, first_page=["Dana Long", "dana.long@example.com", "Skills: Python, SQL"])
+        job = jobs.enqueue(SimpleUploadedFile("long.pdf", pdf))
+        self.assertEqual(jobs.run_pending(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ScreeningJob.DONE)
+        self.assertEqual(job.resume.email, "dana.long@example.com")
+        extraction = ParseCache.objects.get(key=job.content_hash).payload["extraction"]
+        self.assertEqual(extraction, {"status": pdf_extract.ExtractionStatus.TRUNCATED, "pages": max_pages})
+        self.assertEqual(sum(metrics.PARSE_FAILURES.values.values()), failures)
+
+    def test_status_endpoint_reports_progress_and_result(self):
+        response = self.client.post("/", {"resume": SimpleUploadedFile(
+            "Alice_Johnson.pdf", (RESUMES_DIR / "Alice_Johnson.pdf").read_bytes()
+        )}, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["job_id"]
+        status_url = response.json()["status_url"]
+        self.assertEqual(status_url, f"/jobs/{job_id}/")
+
+        queued = self.client.get(status_url).json()
+        self.assertEqual(queued, {
+            "id": job_id, "status": "queued", "stage": "queued", "attempts": 0, "error": "",
+            "resume_id": None, "result_url": None, "queue_wait": None, "processing_time": None,
+        })
+
+        self.assertEqual(jobs.run_pending(), 1)
+        done = self.client.get(status_url).json()
+        resume = Resume.objects.get()
+        self.assertEqual((done["status"], done["stage"], done["attempts"]), ("done", "done", 1))
+        self.assertEqual(done["resume_id"], resume.id)
+        self.assertEqual(done["result_url"], f"/result/{resume.id}/")
+        self.assertGreaterEqual(done["queue_wait"], 0)
+        self.assertGreaterEqual(done["processing_time"], 0)
+        self.assertEqual(self.client.get(f"/jobs/{job_id + 1}/").status_code, 404)
+
+
+class ScreenResumesCommandTests(TransactionTestCase):
+    """
+    screen_resumes stores the same rows the upload path would, and a re-run skips every
+    file its checkpoint records as screened unless the file changed since.
+    """
+    SAMPLES = ["Alice_Johnson.pdf", "Bob_Williams.pdf", "Charlie_Brown.pdf", "David_Smith.pdf", "rakesh.pdf"]
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = Path(folder.name)
+        for name in self.SAMPLES:
+            (self.folder / name).write_bytes((RESUMES_DIR / name).read_bytes())
+        directories = {}
+        for name in ("media", "vectors", "registry"):
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            directories[name] = directory.name
+        # The blank pipeline stands in for en_core_web_sm, and "full" sends every resume through nlp.pipe
+        settings = override_settings(
+            MEDIA_ROOT=directories["media"], RESUME_SCREENING_VECTOR_INDEX=directories["vectors"],
+            RESUME_SCREENING_MODEL_REGISTRY=directories["registry"],
+            RESUME_SCREENING_NLP_MODE="full", RESUME_SCREENING_SPACY_MODEL="blank:en",
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        nlp._nlp = None
+        self.addCleanup(setattr, nlp, "_nlp", None)
+        matching._stores.clear()
+        self.addCleanup(matching._stores.clear)
+        leaderboard._board = None
+        self.addCleanup(setattr, leaderboard, "_board", None)
+        self.addCleanup(setattr, scoring, "_loaded", False)
+
+        rng = np.random.default_rng(0)
+        rows = np.column_stack([rng.integers(0, 4, 200), rng.integers(0, 15, 200), rng.integers(0, 15, 200)])
+        model = RandomForestRegressor(n_estimators=5, random_state=0).fit(
+            pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS), 10 * rows[:, 0] + 2 * rows[:, 1] + rows[:, 2]
+        )
+        model_registry.publish(model, {"source": "tests"})
+        scoring.reload_model()
+
+    def screen(self, *args):
+        out = StringIO()
+        call_command("screen_resumes", str(self.folder), "--workers", "2", "--chunk-size", "2", *args, stdout=out)
+        return out.getvalue()
+
+    def checkpoint(self):
+        return json.loads((self.folder / ".screen_resumes.json").read_text())
+
+    def test_rows_match_the_upload_pipeline(self):
+        nlp_pipe = mock.Mock(wraps=nlp.get_nlp().pipe)
+        with mock.patch.object(screen_resumes, "ProcessPoolExecutor", wraps=screen_resumes.ProcessPoolExecutor) as pool, \
+                mock.patch.object(screen_resumes, "predict_scores", wraps=scoring.predict_scores) as predict, \
+                mock.patch.object(Resume.objects, "bulk_create", wraps=Resume.objects.bulk_create) as bulk_create, \
+                mock.patch.object(screen_resumes, "extract_features", wraps=screen_resumes.extract_features) as features, \
+                mock.patch.object(nlp.get_nlp(), "pipe", nlp_pipe):
+            out = self.screen("--batch-size", "2")
+
+        self.assertIn("5 PDFs found, 0 already screened, 5 to go", out)
+        self.assertIn("5 resumes created, 0 updated", out)
+        pool.assert_called_once_with(max_workers=2)
+        # Chunks of 2, 2 and 1: one pipe, one predict and one upsert each
+        self.assertEqual([len(list(call.args[0])) for call in predict.call_args_list], [2, 2, 1])
+        self.assertEqual(nlp_pipe.call_count, 3)
+        self.assertEqual({call.kwargs["batch_size"] for call in nlp_pipe.call_args_list}, {2})
+        for call in features.call_args_list:
+            self.assertEqual(call.kwargs["doc"].text, call.args[0])  # Each piped doc goes with its own resume
+        self.assertEqual(bulk_create.call_count, 3)
+        self.assertTrue(all(call.kwargs["update_conflicts"] for call in bulk_create.call_args_list))
+
+        self.assertEqual(Resume.objects.count(), len(self.SAMPLES))
+        for name in self.SAMPLES:
+            expected = screen_resume(extract_text_from_pdf(str(self.folder / name)))
+            resume = Resume.objects.get(email=expected["email"], phone=expected["phone"])
+            with self.subTest(name=name):
+                for field in ("name", "education", "experience", "skills", "sentiment", "missing_skills"):
+                    self.assertEqual(getattr(resume, field), expected[field], field)
+                self.assertEqual(resume.recommended_roles, ", ".join(expected["recommended_roles"]))
+                self.assertAlmostEqual(resume.ranking_score, expected["ranking_score"])
+                self.assertTrue(resume.file.storage.exists(resume.file.name))
+
+        self.assertEqual(set(self.checkpoint()), {str(self.folder / name) for name in self.SAMPLES})
+        best = Resume.objects.order_by("-ranking_score", "id").first()
+        self.assertEqual(leaderboard.top(1)[0]["id"], best.pk)
+
+    def test_rerun_skips_the_files_already_screened(self):
+        screened = []
+        screen_chunk = screen_resumes.Command.screen_chunk
+
+        def killed_during_second_chunk(command, paths, *args):
+            screened.append(paths)
+            if len(screened) == 2:
+                raise KeyboardInterrupt
+            return screen_chunk(command, paths, *args)
+
+        with mock.patch.object(screen_resumes.Command, "screen_chunk", autospec=True,
+                               side_effect=killed_during_second_chunk):
+            with self.assertRaises(KeyboardInterrupt):
+                self.screen()
+        self.assertEqual(set(self.checkpoint()), set(screened[0]))
+        self.assertEqual(Resume.objects.count(), 2)
+
+        out = self.screen()
+        self.assertIn("5 PDFs found, 2 already screened, 3 to go", out)
+        self.assertIn("3 resumes created, 0 updated", out)
+        self.assertEqual(len(self.checkpoint()), 5)
+
+        self.assertIn("5 PDFs found, 5 already screened, 0 to go", self.screen())
+        self.assertEqual(Resume.objects.count(), 5)
+
+        # A changed file is screened again; the upsert only refreshes its scores
+        alice = Resume.objects.get(email="alice@example.com")
+        Resume.objects.filter(pk=alice.pk).update(name="Alice J.", ranking_score=-1)
+        path = self.folder / "Alice_Johnson.pdf"
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 60))
+        out = self.screen()
+        self.assertIn("5 PDFs found, 4 already screened, 1 to go", out)
+        self.assertIn("0 resumes created, 1 updated", out)
+        alice.refresh_from_db()
+        self.assertEqual(alice.name, "Alice J.")
+        self.assertAlmostEqual(alice.ranking_score, screen_resume(extract_text_from_pdf(str(path)))["ranking_score"])
+
+        out = self.screen("--restart")
+        self.assertIn("5 PDFs found, 0 already screened, 5 to go", out)
+        self.assertIn("0 resumes created, 5 updated", out)
+        self.assertEqual(Resume.objects.count(), 5)
+
+
+class LeaderboardTests(TransactionTestCase):
+    """
+    The in-memory leaderboard, updated from save/delete signals, must agree with
+    order_by("-ranking_score", "-id") without reloading more often than it has to.
+    """
+
+    def setUp(self):
+        vectors = tempfile.TemporaryDirectory()
+        self.addCleanup(vectors.cleanup)
+        settings = override_settings(RESUME_SCREENING_LEADERBOARD_SIZE=2, RESUME_SCREENING_VECTOR_INDEX=vectors.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        matching._stores.clear()
+        self.addCleanup(matching._stores.clear)
+        cache.clear()
+        leaderboard._board = None
+        self.addCleanup(setattr, leaderboard, "_board", None)
+        self.board = leaderboard.get_board()  # Size 2, so up to 4 entries
+
+    def add(self, *scores, name=None):
+        resumes = [
+            Resume.objects.create(name=name or f"Candidate {score}", email=f"{score}@example.com", ranking_score=score)
+            for score in scores
+        ]
+        return resumes[0] if len(resumes) == 1 else resumes
+
+    def ranked_ids(self):
+        return list(Resume.objects.order_by("-ranking_score", "-id").values_list("id", flat=True))
+
+    def assertBoardMatchesDatabase(self):
+        """
+        Checks the board as it stands, without letting snapshot() reload it first.
+        """
+        self.assertFalse(self.board.stale)
+        self.assertEqual(self.board.generation, cache.get(leaderboard.GENERATION_KEY))
+        ranked = self.ranked_ids()
+        board = [entry["id"] for entry in self.board.entries]
+        self.assertEqual(board, ranked[:len(board)])
+        self.assertEqual(self.board.keys, sorted(self.board.keys))
+        if self.board.complete:
+            self.assertEqual(board, ranked)
+        latest = Resume.objects.order_by("-uploaded_at", "-id").values_list("id", flat=True).first()
+        self.assertEqual(self.board.latest and self.board.latest["id"], latest)
+        self.assertEqual([entry["id"] for entry in leaderboard.top(2)], ranked[:2])
+
+    def test_score_changes_move_entries_and_drops_below_the_board_reload_when_short(self):
+        resumes = self.add(10, 20, 30, 40, 50, 60)
+        leaderboard.top(2)
+        self.assertFalse(self.board.complete)
+
+        resumes[1].ranking_score = 55  # From below the board onto it
+        resumes[1].save()
+        self.assertBoardMatchesDatabase()
+
+        for resume in (resumes[5], resumes[1]):  # Off the board, leaving 2 known-best entries
+            resume.ranking_score = 5
+            resume.save()
+            self.assertBoardMatchesDatabase()
+
+        resumes[4].ranking_score = 1  # One left: the next best rows are unknown
+        resumes[4].save()
+        self.assertTrue(self.board.stale)
+        self.assertEqual([entry["id"] for entry in leaderboard.top(2)], self.ranked_ids()[:2])
+        self.assertBoardMatchesDatabase()
+
+    def test_deleting_the_latest_upload_reloads(self):
+        resumes = self.add(30, 10, 20)
+        leaderboard.top(2)
+        self.assertTrue(self.board.complete)
+
+        resumes[0].delete()  # Best ranked, but not the latest
+        self.assertBoardMatchesDatabase()
+
+        resumes[2].delete()
+        self.assertTrue(self.board.stale)
+        self.assertEqual(leaderboard.latest()["id"], resumes[1].id)
+        self.assertBoardMatchesDatabase()
+
+        resumes[1].delete()
+        self.assertIsNone(leaderboard.latest())
+        self.assertEqual(leaderboard.top(2), [])
+
+    def test_board_trims_to_twice_its_size_and_stops_being_complete(self):
+        self.add(30, 10, 20)
+        leaderboard.top(2)
+        self.assertTrue(self.board.complete)
+
+        self.add(40)
+        self.assertTrue(self.board.complete)
+        self.assertBoardMatchesDatabase()
+
+        self.add(50)  # A fifth entry: the worst is dropped
+        self.assertFalse(self.board.complete)
+        self.assertEqual(len(self.board.entries), 4)
+        self.assertBoardMatchesDatabase()
+
+        self.add(5)  # Below an incomplete board: not tracked
+        self.assertEqual(len(self.board.entries), 4)
+        self.assertBoardMatchesDatabase()
+
+        tie = self.add(40, name="Same score")  # Equal scores rank the newer id first
+        self.assertEqual(self.board.entries[1]["id"], tie.id)
+        self.assertBoardMatchesDatabase()
+
+    def test_excluded_names_fall_back_to_the_database(self):
+        self.add(60, 50, 40, name="Unknown")
+        self.add(30, 20, 10)
+        leaderboard.top(2)
+
+        with self.assertNumQueries(0):
+            self.assertEqual([entry["ranking_score"] for entry in leaderboard.top(2, {"Candidate 20"})], [60, 50])
+        with self.assertNumQueries(1):  # Excluding "Unknown" leaves 1 of the 4 board entries
+            top = leaderboard.top(2, {"Unknown"})
+        expected = Resume.objects.exclude(name="Unknown").order_by("-ranking_score", "-id")[:2]
+        self.assertEqual([entry["id"] for entry in top], [resume.id for resume in expected])
+
+    def test_complete_board_answers_without_reloading(self):
+        resumes = self.add(10, 20)
+        leaderboard.top(2)
+        resumes[0].delete()  # Fewer than `size` entries, but the board holds every resume
+        self.assertTrue(self.board.complete)
+        self.assertFalse(self.board.stale)
+        with self.assertNumQueries(0):
+            self.assertEqual([entry["id"] for entry in leaderboard.top(2)], [resumes[1].id])
+
+    def test_rolled_back_changes_leave_the_board_alone(self):
+        resumes = self.add(10, 20, 30)
+        leaderboard.top(2)
+        for change in (lambda: self.add(99), lambda: resumes[0].delete(),
+                       lambda: Resume.objects.filter(pk=resumes[1].pk).get().save()):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                change()
+                raise RuntimeError("Screening failed")
+            self.assertBoardMatchesDatabase()
+        self.assertEqual(Resume.objects.count(), 3)
+        self.assertEqual([entry["ranking_score"] for entry in leaderboard.top(2)], [30, 20])
+
+        with transaction.atomic():
+            resumes[1].ranking_score = 50
+            resumes[1].save()
+            self.assertEqual(leaderboard.top(1)[0]["ranking_score"], 30)  # Not committed yet
+        self.assertBoardMatchesDatabase()
+        self.assertEqual(leaderboard.top(1)[0]["id"], resumes[1].id)
+
+    def test_changes_from_other_processes_force_a_reload(self):
+        resumes = self.add(10, 20, 30)
+        leaderboard.top(2)
+
+        # Another process updates a score and bumps the shared generation
+        Resume.objects.filter(pk=resumes[0].pk).update(ranking_score=99)
+        cache.incr(leaderboard.GENERATION_KEY)
+        self.assertEqual(leaderboard.top(1)[0]["id"], resumes[0].id)
+        self.assertBoardMatchesDatabase()
+
+        # Its bump lands between our last read and our own save: a jump of 2
+        Resume.objects.filter(pk=resumes[1].pk).update(ranking_score=100)
+        cache.incr(leaderboard.GENERATION_KEY)
+        resumes[2].ranking_score = 1
+        resumes[2].save()
+        self.assertTrue(self.board.stale)
+        self.assertEqual(leaderboard.top(1)[0]["id"], resumes[1].id)
+        self.assertBoardMatchesDatabase()
+
+        # Changes that send no signals
+        Resume.objects.filter(pk=resumes[2].pk).update(ranking_score=200)
+        leaderboard.invalidate()
+        self.assertTrue(self.board.stale)
+        self.assertEqual(leaderboard.top(1)[0]["id"], resumes[2].id)
+        self.assertBoardMatchesDatabase()
+
+
+class AnalyticsTests(TestCase):
+    """
+    Counters and skill links maintained from Resume signals must equal what rebuild()
+    computes from scratch after any mix of creates, updates and deletes.
+    """
+
+    def setUp(self):
+        vectors = tempfile.TemporaryDirectory()
+        self.addCleanup(vectors.cleanup)
+        settings = override_settings(RESUME_SCREENING_VECTOR_INDEX=vectors.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        matching._stores.clear()
+        self.addCleanup(matching._stores.clear)
+
+    def state(self):
+        counters = set(AnalyticsCounter.objects.filter(count__gt=0).values_list("dimension", "value", "count"))
+        links = set(ResumeSkill.objects.values_list("resume_id", "skill__name", "ranking_score"))
+        return analytics.summary(top_skills=100), counters, links
+
+    def assertMatchesRebuild(self):
+        incremental = self.state()
+        analytics.rebuild()
+        self.assertEqual(incremental, self.state())
+
+    def create(self, number, **fields):
+        defaults = {"education": "Bachelor", "sentiment": "Positive", "ranking_score": 50.0, "skills": "Python, SQL"}
+        return Resume.objects.create(name=f"Candidate {number}", email=f"{number}@example.com", **dict(defaults, **fields))
+
+    def change_resumes(self):
+        first = self.create(1)
+        second = self.create(2, education=None, ranking_score=None, skills="Java, java , SQL, SQL")
+        third = self.create(3, sentiment="Negative", ranking_score=99.5, skills="")
+        self.create(4, ranking_score=0.0, skills="Python")
+        self.assertMatchesRebuild()
+
+        first.skills = "Python, Docker"
+        first.ranking_score = 75.0
+        first.save()
+        self.assertMatchesRebuild()
+
+        # Only the score is written: the in-memory skills change must not be counted
+        second.ranking_score = 42.0
+        second.skills = "Go"
+        second.save(update_fields=["ranking_score"])
+        self.assertEqual(Resume.objects.get(pk=second.pk).skills, "Java, java , SQL, SQL")
+        self.assertMatchesRebuild()
+
+        third.skills = "Rust, SQL"
+        third.sentiment = "Neutral"
+        third.save(update_fields=["skills"])
+        self.assertMatchesRebuild()
+
+        first.name = "Renamed"  # No tracked field
+        first.save(update_fields=["name"])
+        self.assertMatchesRebuild()
+
+        first.delete()
+        self.assertMatchesRebuild()
+
+        Resume.objects.filter(ranking_score__lt=50).delete()
+        self.assertEqual(Resume.objects.count(), 1)
+        self.assertMatchesRebuild()
+        self.assertEqual(analytics.summary()["total"], 1)
+
+    def test_incremental_counters_match_rebuild(self):
+        self.change_resumes()
+
+    def test_incremental_counters_match_rebuild_without_upserts(self):
+        with mock.patch.object(connection.features, "supports_update_conflicts_with_target", False):
+            self.change_resumes()
+
+
+class SearchTests(TestCase):
+    """
+    Skill search through /search/: posting list intersection and exclusion over skills
+    stored in any case, in rank order, one result per resume, paginated.
+    """
+
+    def setUp(self):
+        self.resumes = {}
+        for number, (skills, score) in enumerate([
+            ("Python, SQL", 90.0),
+            ("python, Java", 80.0),
+            ("Python, python, SQL", 70.0),  # Two spellings of the same skill: two links
+            ("SQL, Java", 60.0),
+            ("Docker", 50.0),
+            ("PYTHON", 40.0),
+        ], start=1):
+            self.resumes[number] = Resume.objects.create(
+                name=f"Candidate {number}", email=f"{number}@example.com", skills=skills, ranking_score=score
+            )
+
+    def get(self, **params):
+        return self.client.get("/search/", params)
+
+    def assertFinds(self, numbers, **params):
+        response = self.get(**params)
+        self.assertEqual(response.status_code, 200)
+        page = response.json()
+        self.assertEqual([row["id"] for row in page["results"]], [self.resumes[number].id for number in numbers])
+        return page
+
+    def test_resolve_is_case_insensitive(self):
+        ids = search.resolve(["python", "rust"])
+        spellings = Skill.objects.filter(name__in=["Python", "python", "PYTHON"]).values_list("id", flat=True)
+        self.assertEqual(sorted(ids["python"]), sorted(spellings))
+        self.assertEqual(ids["rust"], [])
+
+    def test_required_skills_are_intersected(self):
+        self.assertFinds([1, 3], skills="python, sql")
+        self.assertFinds([1, 3], skills="SQL,PyThOn")
+        self.assertFinds([2], skills="python,java")
+        self.assertFinds([], skills="python,rust")
+
+    def test_resumes_with_several_spellings_are_listed_once(self):
+        page = self.assertFinds([1, 2, 3, 6], skills="python")
+        self.assertEqual(page["total"], 4)
+        self.assertEqual(list(search.matching_ids(["python"])), [self.resumes[n].id for n in (1, 2, 3, 6)])
+
+    def test_excluded_skills(self):
+        self.assertFinds([1, 3, 6], skills="python", exclude="JAVA")
+        self.assertFinds([4, 5], exclude="python")  # Exclusions only: every other resume
+        self.assertFinds([5], exclude="python, sql")
+        self.assertFinds([1, 2, 3, 4, 5, 6], exclude="rust")
+
+    def test_pagination(self):
+        page = self.assertFinds([3, 6], skills="python", per_page=2, page=2)
+        self.assertEqual((page["total"], page["num_pages"], page["has_next"]), (4, 2, False))
+        page = self.assertFinds([1], skills="python", per_page=1)
+        self.assertTrue(page["has_next"])
+
+        with override_settings(RESUME_SCREENING_SEARCH_MAX_PAGE_SIZE=3):
+            self.assertEqual(self.assertFinds([1, 2, 3], skills="python", per_page=50)["per_page"], 3)
+
+        self.assertEqual(self.get(skills="python", page=3, per_page=2).status_code, 404)
+        self.assertEqual(self.get(skills="python", page="two").status_code, 400)
+        self.assertEqual(self.get(skills="python", per_page="all").status_code, 400)
+        self.assertEqual(self.get(skills=" , ").status_code, 400)
+
+
+def unit_vectors(count, dim, seed=0, clusters=None):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dim)).astype(np.float32)
+    if clusters:
+        centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+        vectors = 4 * centers[rng.integers(0, clusters, count)] + vectors
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class VectorStoreTests(SimpleTestCase):
+    """
+    Searches must only ever see the current vector of each id, whether it was superseded,
+    removed or re-added, before and after compaction, with or without the IVF index.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+        self.store = VectorStore(self.path, 16)
+
+    def ids(self, results):
+        return [item_id for item_id, _ in results]
+
+    def exact_top(self, vectors, query, k):
+        """
+        Expected ids: vectors maps each live id to its current vector.
+        """
+        ids = sorted(vectors)
+        scores = np.array([vectors[item_id] for item_id in ids]) @ query
+        return [ids[i] for i in np.argsort(-scores, kind="stable")[:k]]
+
+    def test_removed_and_re_added_ids(self):
+        vectors = unit_vectors(6, 16)
+        self.store.add(range(1, 6), vectors[:5])
+        other = VectorStore(self.path, 16)  # Another process's view of the same files
+        self.assertEqual(len(other), 5)
+
+        self.store.remove([3])
+        for store in (self.store, other):
+            self.assertIsNone(store.get(3))
+            self.assertEqual(sorted(store.ids()), [1, 2, 4, 5])
+            self.assertNotIn(3, self.ids(store.search(vectors[2], k=10)))
+
+        self.store.add([3], vectors[5:])
+        self.store.add([1], -vectors[:1])  # Superseded: the old vector must not match
+        for store in (self.store, other):
+            np.testing.assert_array_equal(store.get(3), vectors[5])
+            self.assertEqual(store.search(vectors[5], k=1)[0][0], 3)
+            self.assertNotIn(1, self.ids(store.search(vectors[0], k=3)))
+            self.assertEqual(len(store), 5)
+        self.assertEqual(self.ids(self.store.search(vectors[5], k=10, exclude={3})),
+                         self.exact_top({1: -vectors[0], 2: vectors[1], 4: vectors[3], 5: vectors[4]}, vectors[5], 4))
+
+    def test_search_after_compact(self):
+        vectors = unit_vectors(40, 16, seed=1)
+        self.store.add(range(30), vectors[:30])
+        self.store.remove(range(0, 30, 3))
+        self.store.add(range(0, 30, 6), vectors[30:35])
+        other = VectorStore(self.path, 16)
+        queries = unit_vectors(5, 16, seed=2)
+        before = [self.store.search(query, k=8) for query in queries]
+
+        self.assertEqual(self.store.compact(), 25)
+        self.assertEqual(len(self.store.refresh()[0]), 25)
+        for store in (self.store, other):  # `other` mapped the old file and must notice the new one
+            self.assertEqual([store.search(query, k=8) for query in queries], before)
+            self.assertIsNone(store.get(3))
+            np.testing.assert_array_equal(store.get(6), vectors[31])
+
+        self.store.add([3], vectors[35:36])  # Appends after a compaction are found too
+        self.assertEqual(other.search(vectors[35], k=1)[0][0], 3)
+
+    def test_ivf_agrees_with_exact_search(self):
+        vectors = unit_vectors(400, 16, seed=3, clusters=8)
+        current = dict(enumerate(vectors[:300]))
+        self.store.add(range(300), vectors[:300])
+        self.store.remove(range(0, 300, 10))
+        for item_id in range(0, 300, 10):
+            del current[item_id]
+        n_lists = self.store.build_ivf(n_lists=8)
+        self.assertIsNotNone(self.store.refresh()[3])
+
+        # Changes after the build are seen by IVF searches: new rows, superseded vectors,
+        # and removal of each query's best matches (still listed in the index)
+        queries = unit_vectors(20, 16, seed=4, clusters=8)
+        self.store.add(range(300, 350), vectors[300:350])
+        current.update(zip(range(300, 350), vectors[300:350]))
+        self.store.add(range(101, 151), vectors[350:400])
+        current.update(zip(range(101, 151), vectors[350:400]))
+        removed = {item_id for query in queries for item_id in self.exact_top(current, query, 2)}
+        self.store.remove(sorted(removed))
+        for item_id in removed:
+            del current[item_id]
+
+        found = 0
+        for query in queries:
+            expected = self.exact_top(current, query, 10)
+            self.assertEqual(self.ids(self.store.search(query, k=10, exact=True)), expected)
+            self.assertEqual(self.ids(self.store.search(query, k=10, nprobe=n_lists)), expected)
+            found += len(set(self.ids(self.store.search(query, k=10, nprobe=2))) & set(expected))
+        self.assertGreaterEqual(found / (10 * len(queries)), 0.8)
+
+        self.store.compact()
+        self.assertIsNone(self.store.refresh()[3])
+        self.assertEqual(self.ids(self.store.search(queries[0], k=10)), self.exact_top(current, queries[0], 10))
+
+
+class FlatForestTests(SimpleTestCase):
+    """
+    The flattened forest must score exactly like the sklearn RandomForestRegressor it was
+    built from, one row at a time and in the batches screen_resumes sends.
+    """
+
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+        rows = self.random_rows(500)
+        scores = 10 * rows[:, 0] + 2 * rows[:, 1] + rows[:, 2] + self.rng.normal(size=500)
+        self.model = RandomForestRegressor(n_estimators=20, random_state=0).fit(
+            pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS), scores
+        )
+
+    def random_rows(self, count):
+        # Education levels, fractional years of experience and skill counts, a little beyond the training range
+        return np.column_stack([
+            self.rng.integers(0, 5, count), self.rng.uniform(0, 40, count).round(1), self.rng.integers(0, 30, count),
+        ])
+
+    def sklearn_predict(self, rows):
+        return self.model.predict(pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS))
+
+    def test_predict_matches_sklearn_on_random_inputs(self):
+        forest = FlatForest.from_sklearn(self.model)
+        rows = self.random_rows(2000)
+        thresholds = self.model.estimators_[0].tree_.threshold
+        rows[:10, 1] = thresholds[thresholds > 0][:10]  # Exactly on a split
+        self.assertTrue(np.allclose(forest.predict(rows), self.sklearn_predict(rows)))
+        for row in rows[:50]:
+            self.assertTrue(np.allclose(forest.predict([row]), self.sklearn_predict([row])))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "forest.npy")
+            forest.save(path)
+            self.assertTrue(np.allclose(FlatForest.load(path).predict(rows), self.sklearn_predict(rows)))
+
+    def test_batched_scoring_matches_sklearn(self):
+        registry = tempfile.TemporaryDirectory()
+        self.addCleanup(registry.cleanup)
+        settings = override_settings(RESUME_SCREENING_MODEL_REGISTRY=registry.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(setattr, scoring, "_loaded", False)
+        model_registry.publish(self.model, {"source": "tests"})
+        rows = self.random_rows(300).tolist()
+        expected = self.sklearn_predict(rows)
+
+        # Straight through the forest, then through the lookup table with rows beyond its bounds
+        for bounds in (None, (3, 20, 15)):
+            with self.subTest(bounds=bounds), override_settings(RESUME_SCREENING_SCORE_TABLE_BOUNDS=bounds):
+                scoring.reload_model()
+                self.assertIsInstance(scoring.get_model(), FlatForest)
+                self.assertEqual(scoring.get_table() is None, bounds is None)
+                self.assertTrue(np.allclose(scoring.predict_scores(rows), expected))
+
+
+class ScoreTableTests(SimpleTestCase):
+    """
+    verify_score_table compares the table in use with the pickled sklearn model, not with
+    the flattened forest the table was built from.
+    """
+
+    def setUp(self):
+        registry = tempfile.TemporaryDirectory()
+        self.addCleanup(registry.cleanup)
+        settings = override_settings(RESUME_SCREENING_MODEL_REGISTRY=registry.name,
+                                     RESUME_SCREENING_SCORE_TABLE_BOUNDS=(3, 10, 10))
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(setattr, scoring, "_loaded", False)
+
+        self.version = model_registry.publish(self.train(random_state=0), {"source": "tests"})
+        scoring.reload_model()
+
+    def train(self, random_state):
+        rng = np.random.default_rng(0)
+        rows = np.column_stack([rng.integers(0, 4, 200), rng.integers(0, 15, 200), rng.integers(0, 15, 200)])
+        scores = 10 * rows[:, 0] + 2 * rows[:, 1] + rows[:, 2] + rng.normal(size=200)
+        return RandomForestRegressor(n_estimators=5, random_state=random_state).fit(
+            pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS), scores
+        )
+
+    def verify(self, *args):
+        out = StringIO()
+        call_command("verify_score_table", *args, stdout=out)
+        return out.getvalue()
+
+    def test_table_matches_the_sklearn_model(self):
+        self.assertNotIsInstance(scoring.get_model(), RandomForestRegressor)
+        self.assertIn("Every cell matches", self.verify())
+        self.assertIn("(3, 5, 5)", self.verify("--bounds", "3", "5", "5"))
+
+    def test_a_forest_that_disagrees_with_its_pickle_is_reported(self):
+        forest = FlatForest.from_sklearn(self.train(random_state=1))
+        forest.save(str(Path(model_registry.version_dir(self.version)) / model_registry.FOREST_FILE))
+        scoring.reload_model()  # Table built from the other forest
+        with self.assertRaisesMessage(CommandError, "differ from the sklearn model's predict"):
+            self.verify()
+
+    def test_a_wrong_cell_is_reported(self):
+        scoring.get_table().scores[1, 2, 3] += 0.5
+        with self.assertRaisesMessage(CommandError, "1 rows differ"):
+            self.verify()
+
+
+class ResultPageTests(TestCase):
+    """
+    Result pages are revalidated by ETag alone: the job description they compare against
+    can change to an older one without any timestamp moving.
+    """
+
+    def setUp(self):
+        vectors = tempfile.TemporaryDirectory()
+        self.addCleanup(vectors.cleanup)
+        settings = override_settings(RESUME_SCREENING_VECTOR_INDEX=vectors.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        matching._stores.clear()
+        self.addCleanup(matching._stores.clear)
+        cache.clear()
+        self.older = JobDescription.objects.create(title="Data Engineer", description="Python, SQL and Spark.")
+        self.newer = JobDescription.objects.create(title="Web Developer", description="JavaScript, HTML and CSS.")
+        self.resume = Resume.objects.create(name="Candidate 1", email="1@example.com", skills="Python, SQL",
+                                            ranking_score=70.0)
+
+    def get(self, jd, **headers):
+        return self.client.get(f"/result/{self.resume.pk}/", {"jd": jd.pk}, headers=headers)
+
+    def test_switching_to_an_older_job_description_is_not_a_304(self):
+        first = self.get(self.newer)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn("Last-Modified", first.headers)
+        self.assertEqual(self.get(self.newer, if_none_match=first["ETag"]).status_code, 304)
+
+        later = "Fri, 01 Jan 2100 00:00:00 GMT"
+        switched = self.get(self.older, if_none_match=first["ETag"], if_modified_since=later)
+        self.assertEqual(switched.status_code, 200)
+        self.assertContains(switched, "Data Engineer")
+        self.assertEqual(self.get(self.older, if_modified_since=later).status_code, 200)
+
+
+class ModelLoadingTests(SimpleTestCase):
+    def test_loading_is_logged_not_printed(self):
+        with tempfile.TemporaryDirectory() as directory, redirect_stdout(StringIO()) as out:
+            path = str(Path(directory) / "model.pkl")
+            with self.assertLogs("resume_screening.scoring", "WARNING") as logs:
+                self.assertIsNone(scoring.load_model(path, forest_path=None))
+            self.assertIn("not found", logs.output[0])
+
+            Path(path).write_bytes(pickle.dumps({"stand-in": "model"}))
+            with self.assertLogs("resume_screening.scoring", "INFO") as logs:
+                self.assertEqual(scoring.load_model(path, forest_path=None), {"stand-in": "model"})
+            self.assertIn(path, logs.output[0])
+        self.assertEqual(out.getvalue(), "")
+
+
+class ModelRegistryTests(SimpleTestCase):
+    """
+    train_ranker publishes versions to the registry, and running processes switch to a
+    newly activated version on their next check, without a restart.
+    """
+    dataset = str(Path(__file__).resolve().parent.parent / "resume_ranking_dataset.csv")
+
+    def setUp(self):
+        registry = tempfile.TemporaryDirectory()
+        self.addCleanup(registry.cleanup)
+        self.registry = registry.name
+        settings = override_settings(RESUME_SCREENING_MODEL_REGISTRY=self.registry)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(setattr, scoring, "_loaded", False)
+        self.addCleanup(setattr, scoring, "_next_check", 0.0)
+
+    def train(self, *args):
+        out = StringIO()
+        call_command("train_ranker", "--dataset", self.dataset, "--n-estimators", "5", "--n-jobs", "1",
+                     *args, stdout=out)
+        return out.getvalue()
+
+    def versions(self):
+        return [metadata["version"] for metadata in model_registry.list_versions()]
+
+    def test_training_publishes_and_activates_a_new_version(self):
+        self.assertIn("(active)", self.train())
+        first, = self.versions()
+        self.assertEqual(model_registry.current_version(), first)
+        self.assertEqual(sorted(os.listdir(self.registry)), [first, model_registry.CURRENT_FILE])
+        self.assertEqual(
+            sorted(os.listdir(model_registry.version_dir(first))),
+            [model_registry.FOREST_FILE, model_registry.METADATA_FILE, model_registry.MODEL_FILE],
+        )
+        metadata, = model_registry.list_versions()
+        self.assertEqual((metadata["n_estimators"], metadata["rows"]), (5, {"train": 800, "test": 200}))
+
+        self.train("--no-activate", "--random-state", "1")
+        self.train("--warm-start", "3")
+        first, second, third = self.versions()
+        self.assertEqual(model_registry.current_version(), third)
+        metadata = model_registry.list_versions()[2]
+        self.assertEqual((metadata["parent"], metadata["n_estimators"]), (first, 8))
+
+        call_command("train_ranker", "--activate", second, stdout=StringIO())
+        self.assertEqual(model_registry.current_version(), second)
+        self.assertIn(f"* {second}", self.train("--list"))
+        with self.assertRaisesMessage(CommandError, "Unknown model version"):
+            call_command("train_ranker", "--activate", "20200101-000000")
+        self.assertEqual(model_registry.current_version(), second)
+        self.assertFalse([name for name in os.listdir(self.registry) if name.startswith(".")])
+
+    def test_current_is_replaced_atomically(self):
+        self.train()
+        self.train("--no-activate")
+        first, second = self.versions()
+
+        with mock.patch.object(model_registry.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                model_registry.activate_version(second)
+        self.assertEqual(model_registry.current_version(), first)
+        self.assertFalse([name for name in os.listdir(self.registry) if name.startswith(".")])
+
+        # Readers never see a missing or half-written CURRENT while versions are switched
+        seen = set()
+        switching = threading.Event()
+
+        def read():
+            while not switching.is_set():
+                seen.add(model_registry.current_version())
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for _ in range(200):
+            model_registry.activate_version(second)
+            model_registry.activate_version(first)
+        switching.set()
+        reader.join()
+        self.assertEqual(seen, {first, second})
+
+    def test_scoring_switches_to_a_newly_activated_version(self):
+        rows = [[1, 5.0, 4], [3, 12.0, 9], [0, 0.0, 0]]
+        self.train()
+        first, = self.versions()
+
+        with mock.patch.object(scoring, "RELOAD_CHECK_INTERVAL", 1.0):
+            scoring.reload_model()
+            first_scores = scoring.predict_scores(rows)  # Also schedules the next registry check
+            self.train("--random-state", "1", "--n-estimators", "9")
+            second = self.versions()[1]
+            self.assertEqual(scoring.model_version(), first)  # Not checked again yet
+            self.assertEqual(scoring.predict_scores(rows), first_scores)
+
+            time.sleep(1.1)
+            self.assertEqual(scoring.model_version(), second)
+            expected = model_registry.load_sklearn(second).predict(pd.DataFrame(rows, columns=scoring.FEATURE_COLUMNS))
+            self.assertTrue(np.allclose(scoring.predict_scores(rows), expected))
+            self.assertNotEqual(scoring.predict_scores(rows), first_scores)
+
+            # A version that cannot be loaded leaves the last good model in place
+            self.train("--no-activate")
+            broken = self.versions()[2]
+            Path(model_registry.version_dir(broken), model_registry.FOREST_FILE).write_bytes(b"not a forest")
+            model_registry.activate_version(broken)
+            time.sleep(1.1)
+            self.assertEqual(scoring.model_version(), second)
+            self.assertTrue(np.allclose(scoring.predict_scores(rows), expected))
+
+
+def baseline_fields(resume_text):
+    # The searches extract_features made originally
+    email_match = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", resume_text)
+    phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{4,5}[-.\s]?\d{5}', resume_text)
+    education_keywords = ["Diploma", "Engineering", "Bachelors", "Masters", "PhD", "B.Sc", "BEng", "M.Sc"]
+    experience_match = re.search(r"(\d+)\s+(years|yrs|year)", resume_text, re.I)
+    return {
+        "email": email_match.group() if email_match else "Not Provided",
+        "phone": phone_match.group() if phone_match else "Not Provided",
+        "education": next((word for word in education_keywords if word.lower() in resume_text.lower()), "Unknown"),
+        "experience": int(experience_match.group(1)) if experience_match else 0,
+    }
+
+
+class FieldExtractionTests(SimpleTestCase):
+    """
+    first_fields (behind extract_features) must report what the original searches did.
+    """
+
+    def test_sample_resumes_match_the_original_searches(self):
+        texts = sample_texts()
+        self.assertTrue(texts)
+        for text in texts:
+            self.assertEqual(field_extractor.first_fields(text), baseline_fields(text))
+
+    def test_edge_cases_match_the_original_searches(self):
+        texts = [
+            "Jane Doe\nEmail: jane.doe@example.co.uk\nPhone: +91 98765 43210\nM.Sc in Physics, 7 YEARS of work",
+            "Contact 9876543210@mail.com or 555-0100\nSoftware engineering intern, 2 yrs",  # Phone inside an email
+            "Diplomat and PhD candidate\n3 year fellowship\n12 years later",  # Substring and first mention
+            "bsc mechanical beng\n",
+            "No contact details at all.",
+            "",
+        ]
+        for text in texts:
+            self.assertEqual(field_extractor.first_fields(text), baseline_fields(text))
+
+        self.assertEqual(field_extractor.first_fields(texts[0]), {
+            "email": "jane.doe@example.co.uk", "phone": "+91 98765 43210", "education": "M.Sc", "experience": 7,
+        })
+        self.assertEqual(field_extractor.first_fields(texts[2])["education"], "Diploma")
+        self.assertEqual(field_extractor.first_fields(texts[2])["experience"], 3)
+
+
+def baseline_skills(resume_text, skills):
+    """
+    Copy of the original per-token skill loop (spaCy's tokenizer; a blank pipeline splits
+    text exactly like en_core_web_sm).
+    """
+    import spacy
+
+    predefined_skills = [skill.lower() for skill in skills]
+    return {token.text.lower() for token in spacy.blank("en")(resume_text) if token.text.lower() in predefined_skills}
+
+
+class SkillMatcherTests(SimpleTestCase):
+    """
+    The taxonomy's compiled matcher finds symbol-heavy names and aliases as whole tokens.
+    """
+
+    def extract(self, text):
+        return taxonomy.get_taxonomy().matcher.extract(text)
+
+    def test_symbols_and_aliases(self):
+        found = self.extract("Languages: C++, C#; runtimes Node.js (NodeJS). Also CPP and CSharp, JS, K8s, React.js.")
+        self.assertEqual(found, {"c++", "c#", "node.js", "javascript", "kubernetes", "react"})
+        self.assertEqual(self.extract("Wrote C and C++ daily"), {"c", "c++"})
+        self.assertEqual(self.extract("Ran Postgres on GCP; built a UX/UI kit"), {"postgresql", "google cloud", "ui/ux"})
+        self.assertEqual(self.extract("Compensation and Benefits, e-Learning"), {"compensation & benefits", "e-learning"})
+
+    def test_skills_only_match_whole_tokens(self):
+        for text in [
+            "JavaScript and TypeScript developer",  # Not Java
+            "Excellent communication, going forward",  # Not Excel or Go
+            "Reactive programming in Scala",  # Not React or C
+            "node developer, rusty on SQLite",  # Not Node.js, Rust or SQL
+            "c.sharp, objective-c.net",  # Dotted names are single tokens
+        ]:
+            self.assertEqual(self.extract(text) & {"java", "excel", "go", "react", "c", "node.js", "rust", "sql",
+                                                   "c++", "c#"}, set(), text)
+        self.assertEqual(self.extract("Java, JavaScript"), {"java", "javascript"})
+
+    def test_overlapping_phrases_are_all_reported(self):
+        matcher = SkillMatcher(["MS Excel", "Excel", "Machine Learning", "Learning"], {"Microsoft Excel": "MS Excel"})
+        self.assertEqual(
+            list(matcher.find_all("Microsoft Excel and machine learning")),
+            [("ms excel", 0, 2), ("excel", 1, 2), ("machine learning", 3, 5), ("learning", 4, 5)],
+        )
+        self.assertEqual(matcher.canonical["ms excel"], "MS Excel")
+
+    def test_sample_resumes_find_every_skill_the_token_loop_did(self):
+        skills = list(taxonomy.get_taxonomy().matcher.canonical.values())
+        for text in sample_texts():
+            self.assertLessEqual(baseline_skills(text, skills), self.extract(text))
+
+
+def baseline_recommend_job_roles(skills, experience):
+    """
+    Copy of the original recommend_job_roles: every role sharing a skill, in dict order.
+    """
+    job_roles = {
+        "Software Engineer": ["Python", "Java", "C++", "Software Development"],
+        "Data Scientist": ["Python", "Data Analysis", "Machine Learning", "Statistics"],
+        "Web Developer": ["HTML", "CSS", "JavaScript", "React", "Node.js"],
+        "Data Analyst": ["Excel", "SQL", "Data Visualization", "Python"],
+        "Product Manager": ["Agile", "Project Management", "Team Leadership"],
+        "UX Designer": ["Design", "UX/UI", "Prototyping", "Figma"]
+    }
+
+    if not skills:  # Ensure we handle the case where no skills are found
+        return ["No skills found. Try adding skills to your resume."], {}
+
+    skills = [skill.lower() for skill in skills if isinstance(skill, str)]
+    recommended_roles = []
+    missing_skills = {}
+
+    for role, required_skills in job_roles.items():
+        required_skills_lower = [skill.lower() for skill in required_skills]
+        matched_skills = [skill for skill in skills if skill in required_skills_lower]
+        if matched_skills and experience >= 0:
+            recommended_roles.append(role)
+            missing = [skill for skill in required_skills_lower if skill not in skills]
+            if missing:
+                missing_skills[role] = missing
+
+    return recommended_roles, missing_skills
+
+
+class RoleRecommendationTests(SimpleTestCase):
+    """
+    The role matrix recommends the baseline's roles, best coverage first, cut to the top k.
+    """
+    # The taxonomy's canonical name for the baseline's "UX/UI", which never matched an extracted skill
+    renamed = {"ux/ui": "ui/ux"}
+
+    def skill_sets(self):
+        current = taxonomy.get_taxonomy()
+        skill_sets = [sorted(current.matcher.extract(text)) for text in sample_texts()]
+        skill_sets += [
+            ["Python"], ["python", "SQL", "Excel"], ["React", "Node.js", "Python", "Agile"], ["Figma", "Design"],
+            ["Python", "Java", "C++", "Software Development", "Statistics"], ["Cooking"],
+            # Complete for two roles: the one with more required skills ranks first
+            ["Python", "Java", "C++", "Software Development", "HTML", "CSS", "JavaScript", "React", "Node.js"],
+        ]
+        pool = sorted({skill for role in current.roles for skill in current.role_skills[role]} - {"ui/ux"})
+        rng = np.random.default_rng(3)
+        skill_sets += [list(rng.choice(pool, size=rng.integers(1, 8), replace=False)) for _ in range(200)]
+        return skill_sets
+
+    def baseline_ranking(self, skills):
+        """
+        The baseline's roles ranked by coverage, then matched count, then catalogue order.
+        """
+        roles, missing = baseline_recommend_job_roles(skills, 2)
+        current = taxonomy.get_taxonomy()
+
+        def rank(role):
+            required = len(current.role_skills[role])
+            matched = required - len(missing.get(role, []))
+            return -matched / required, -matched, current.roles.index(role)
+
+        missing = {role: [self.renamed.get(skill, skill) for skill in names] for role, names in missing.items()}
+        return sorted(roles, key=rank), missing
+
+    def test_all_roles_match_the_baseline(self):
+        n_roles = len(taxonomy.get_taxonomy().roles)
+        for skills in self.skill_sets():
+            roles, missing = recommend_job_roles(skills, 2, top_k=n_roles)
+            expected_roles, expected_missing = self.baseline_ranking(skills)
+            self.assertEqual(roles, expected_roles, skills)
+            self.assertEqual(missing, expected_missing, skills)
+
+    def test_top_k_keeps_the_best_covered_roles(self):
+        for skills in self.skill_sets():
+            expected_roles, expected_missing = self.baseline_ranking(skills)
+            for k in (1, 2, 3):
+                roles, missing = recommend_job_roles(skills, 2, top_k=k)
+                self.assertEqual(roles, expected_roles[:k], skills)
+                self.assertEqual(missing, {role: expected_missing[role] for role in roles if role in expected_missing})
+
+    def test_no_skills(self):
+        self.assertEqual(recommend_job_roles([], 2), baseline_recommend_job_roles([], 2))
+        self.assertEqual(recommend_job_roles(["Python"], -1), ([], {}))
+
+
+class SentimentTests(SimpleTestCase):
+    """
+    The lexicon scorer must label resumes the way TextBlob(text).sentiment does, working
+    from the parser's tokens rather than TextBlob's own tokenizer.
+    """
+    contractions = [
+        "I don't enjoy late deployments.",
+        "It isn't a good fit.",
+        "Can't say the results were poor.",
+        "The team wasn't happy with the old tool.",
+        "We won't tolerate sloppy work.",
+        "Really don't like bad code",
+        "I haven't failed a project",
+        "don't really love it",
+        "She's really good at SQL.",
+        "They'll be great, and you've done excellent work.",
+    ]
+
+    def textblob_polarity(self, text):
+        from textblob import TextBlob
+
+        return TextBlob(text).sentiment.polarity
+
+    def test_contractions_are_scored_like_textblob(self):
+        lexicon = sentiment.get_lexicon()
+        for text in self.contractions:
+            self.assertAlmostEqual(lexicon.polarity(tokenize(text)), self.textblob_polarity(text), msg=text)
+
+    def test_labels_agree_with_textblob(self):
+        texts = sample_texts()
+        lines = [line for text in texts for line in text.split("\n") if len(line.split()) > 3]
+        corpus = texts + lines + self.contractions
+        expected = [sentiment.label(self.textblob_polarity(text)) for text in corpus]
+        labels = sentiment.sentiment_labels([tokenize(text) for text in corpus])
+        self.assertEqual(labels, [analyze_sentiment(text) for text in corpus])
+        agreement = sum(a == b for a, b in zip(labels, expected)) / len(corpus)
+        self.assertGreaterEqual(agreement, AGREEMENT_THRESHOLD)
+
+
+def encrypted_pdf():
+    """
+    A text PDF behind a user password (standard security handler), which no backend can open.
+    """
+    return synthetic_pdf(1).replace(b"/Root 1 0 R >>", (
+        b"/Root 1 0 R /Encrypt << /Filter /Standard /V 1 /R 2 /Length 40 /P -4 /O <%s> /U <%s> >> "
+        b"/ID [<%s> <%s>] >>" % (b"ab" * 32, b"cd" * 32, b"01" * 16, b"01" * 16)
+    ))
+
+
+class SlowBackend(pdf_extract.PdfBackend):
+    """
+    200 pages that each take 10 ms, to exercise the time budget. Keeps hold of its page
+    generator, so only an explicit close() releases it.
+    """
+    name = "slow"
+
+    def __init__(self):
+        self.closed = False
+        self.pages = None
+
+    def iter_page_texts(self, pdf_file):
+        self.pages = self.slow_pages()
+        return self.pages
+
+    def slow_pages(self):
+        try:
+            for _ in range(200):
+                time.sleep(0.01)
+                yield "Python developer\n\f"
+        finally:
+            self.closed = True
+
+
+class PdfExtractTests(SimpleTestCase):
+    def extract(self, path, backend):
+        return pdf_extract.extract_pdf(str(path), backend=pdf_extract.get_backend(backend))
+
+    def test_selected_backend_agrees_with_pdfminer(self):
+        backend = pdf_extract.get_backend()
+        for path in sorted(RESUMES_DIR.glob("[A-Z]*_*.pdf")):
+            ours, reference = self.extract(path, backend.name), self.extract(path, "pdfminer")
+            self.assertEqual(ours.status, pdf_extract.ExtractionStatus.OK)
+            self.assertEqual(ours.pages, reference.pages)
+            # Engines differ only in blank lines between text lines
+            self.assertEqual(ours.text.split(), reference.text.split(), f"{backend.name} on {path.name}")
+
+    def test_limits_stop_extraction_early(self):
+        pdf = synthetic_pdf(5)
+        for name in pdf_extract.available_backends():
+            with self.subTest(name):
+                backend = pdf_extract.get_backend(name)
+                whole = pdf_extract.extract_pdf(io.BytesIO(pdf), backend=backend)
+                self.assertEqual((whole.status, whole.pages), (pdf_extract.ExtractionStatus.OK, 5))
+
+                result = pdf_extract.extract_pdf(io.BytesIO(pdf), max_pages=2, backend=backend)
+                self.assertEqual((result.status, result.pages), (pdf_extract.ExtractionStatus.TRUNCATED, 2))
+                self.assertIn("Page 2 line 44", result.text)
+                self.assertNotIn("Page 3", result.text)
+
+                result = pdf_extract.extract_pdf(io.BytesIO(pdf), max_chars=100, backend=backend)
+                self.assertEqual((result.status, result.pages), (pdf_extract.ExtractionStatus.TRUNCATED, 1))
+                self.assertEqual(result.text, whole.text[:100])
+
+                result = pdf_extract.extract_pdf(io.BytesIO(pdf), time_budget=0, backend=backend)
+                self.assertEqual((result.status, result.pages), (pdf_extract.ExtractionStatus.TIMEOUT, 1))
+                self.assertTrue(result.usable)
+
+    def test_time_budget_stops_a_slow_document(self):
+        backend = SlowBackend()
+        result = pdf_extract.extract_pdf("endless.pdf", time_budget=0.05, backend=backend)
+        self.assertEqual(result.status, pdf_extract.ExtractionStatus.TIMEOUT)
+        self.assertGreaterEqual(result.pages, 5)
+        self.assertLess(result.pages, 50)
+        self.assertTrue(backend.closed)  # The engine is released, not left half-way through the file
+
+    def test_unreadable_pdfs_are_reported_by_type(self):
+        Status = pdf_extract.ExtractionStatus
+        pdfs = {
+            "encrypted": (encrypted_pdf(), Status.ENCRYPTED),
+            "not a pdf": (b"Alice Johnson, Python developer", Status.MALFORMED),
+            "cut short": (synthetic_pdf(3)[:1000], Status.MALFORMED),
+            "scanned": (synthetic_pdf(2, lines_per_page=0, first_page=[" "]), Status.EMPTY),
+        }
+        for name in pdf_extract.available_backends():
+            for label, (pdf, status) in pdfs.items():
+                with self.subTest(backend=name, pdf=label):
+                    result = pdf_extract.extract_pdf(io.BytesIO(pdf), backend=pdf_extract.get_backend(name))
+                    self.assertEqual(result.status, status)
+                    self.assertFalse(result.usable)
+                    if status != Status.EMPTY:
+                        self.assertTrue(result.error)
+
+    def test_backends_can_extract_from_several_threads(self):
+        paths = sorted(RESUMES_DIR.glob("*.pdf")) * 4
+        for name in pdf_extract.available_backends():
+            expected = {path: self.extract(path, name).text for path in paths}
+            results = {}
+            barrier = threading.Barrier(8)
+
+            def extract(chunk, name=name):
+                barrier.wait()
+                for path in chunk:
+                    results[path] = self.extract(path, name).text
+
+            threads = [threading.Thread(target=extract, args=(paths[i::8],)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(results, expected, name)
+
+
+class TaxonomyTests(SimpleTestCase):
+    def test_role_only_requirements_are_not_extracted(self):
+        current = taxonomy.get_taxonomy()
+        text = "Graphic Design portfolio; agile team, statistics and prototyping. ML, DL, TS and Vue on the side."
+        self.assertEqual(current.matcher.extract(text), {"graphic design"})
+        # Still known to gap analysis and the role index
+        self.assertEqual(current.missing_skills("UX Designer", current.bitset(["Figma", "UI/UX"])), ["design", "prototyping"])
+        self.assertIn("Data Scientist", current.roles_for_skills(["Statistics"]))
+
+    def test_edited_file_is_swapped_in(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "taxonomy.json"
+        data = {"skills": [{"name": "Python"}], "roles": [{"name": "Developer", "required_skills": ["Python"]}]}
+        path.write_text(json.dumps(data))
+        self.addCleanup(taxonomy.reload_taxonomy)  # Back to the real file once the setting is restored
+        settings = override_settings(RESUME_SCREENING_TAXONOMY_PATH=str(path))
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        first = taxonomy.reload_taxonomy()
+        taxonomy._next_check = time.monotonic() + 60
+        self.assertEqual(first.matcher.extract("Python and Rust"), {"python"})
+
+        data["skills"].append({"name": "Rust", "aliases": ["rustlang"]})
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns + 1_000_000_000))
+        self.assertIs(taxonomy.get_taxonomy(), first)  # Not checked again until the interval passes
+        taxonomy._next_check = 0.0
+        second = taxonomy.get_taxonomy()
+
+        self.assertIsNot(second, first)
+        self.assertNotEqual(second.version, first.version)
+        self.assertEqual(second.matcher.extract("Python and RustLang"), {"python", "rust"})
+        self.assertEqual(first.matcher.extract("Python and Rust"), {"python"})  # Old snapshot untouched
+        taxonomy._next_check = 0.0
+        self.assertIs(taxonomy.get_taxonomy(), second)  # Unchanged file: no reload
+
+
+class PdfStoreTests(TestCase):
+    def test_identical_uploads_are_stored_once(self):
+        with tempfile.TemporaryDirectory() as media, override_settings(MEDIA_ROOT=media):
+            names = {pdf_store.store(SimpleUploadedFile(f"copy{i}.pdf", b"%PDF-1.4 same bytes")) for i in range(3)}
+            self.assertEqual(len(names), 1)
+            self.assertEqual(len(list(Path(media).rglob("*.pdf"))), 1)
+            self.assertNotEqual(pdf_store.store(SimpleUploadedFile("other.pdf", b"%PDF-1.4 other")), names.pop())
+
+
+class ParseCacheTests(TestCase):
+    def setUp(self):
+        start = timezone.now()
+        clock = (start + timedelta(seconds=tick) for tick in range(1000))  # Distinct last_used_at values
+        patcher = mock.patch("django.utils.timezone.now", side_effect=lambda: next(clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def keys(self):
+        return set(ParseCache.objects.values_list("key", flat=True))
+
+    def test_changing_any_part_of_the_version_is_a_miss(self):
+        backend = mock.NonCallableMock()
+        backend.name = "another-backend"
+        changes = {
+            "parser": mock.patch.object(parse_cache, "PARSER_VERSION", "next"),
+            "backend": mock.patch.object(parse_cache, "get_backend", return_value=backend),
+            "taxonomy": mock.patch.object(parse_cache, "get_taxonomy",
+                                          return_value=mock.NonCallableMock(version="edited")),
+            "embeddings": mock.patch.object(parse_cache, "embedding_signature", return_value="other-model:384"),
+        }
+        for part, change in changes.items():
+            with self.subTest(part):
+                parse_cache.put("resume", {"skills": [part]})
+                self.assertEqual(parse_cache.get("resume"), {"skills": [part]})
+                before = parse_cache.stats()
+                with change:
+                    self.assertIsNone(parse_cache.get("resume"))
+                after = parse_cache.stats()
+                self.assertEqual(after["stale"] - before["stale"], 1)
+                self.assertEqual(after["misses"] - before["misses"], 1)
+                self.assertEqual(self.keys(), set())  # Dropped rather than kept around
+
+    def test_least_recently_used_entries_are_evicted_at_the_limit(self):
+        with override_settings(RESUME_SCREENING_PARSE_CACHE_SIZE=3):
+            evictions = parse_cache.stats()["evictions"]
+            for key in "abc":
+                parse_cache.put(key, {"key": key})
+            self.assertEqual(self.keys(), {"a", "b", "c"})
+            self.assertEqual(parse_cache.get("a"), {"key": "a"})  # Now the most recently used
+
+            parse_cache.put("d", {"key": "d"})
+            self.assertEqual(self.keys(), {"a", "c", "d"})
+            parse_cache.put("e", {"key": "e"})
+            self.assertEqual(self.keys(), {"a", "d", "e"})
+            parse_cache.put("a", {"key": "a2"})  # Rewriting an entry doesn't evict anything
+            self.assertEqual(self.keys(), {"a", "d", "e"})
+            self.assertEqual(parse_cache.stats()["evictions"] - evictions, 2)
+
+
+class MetricsTests(TestCase):
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = metrics.Histogram("test_seconds", "Test.", buckets=(0.1, 1.0), labels=("stage",))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value, stage="extract")
+        lines = list(histogram.samples())
+        self.assertEqual([value for _, _, value in lines], [1, 3, 4, 6.05, 4])
+        self.assertEqual(lines[2][1], '{stage="extract",le="+Inf"}')
+
+    def test_requests_are_timed_and_exposed(self):
+        self.client.get("/jobs/stats/")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        self.assertIn('resume_screening_request_duration_seconds_count{view="job_queue_stats",method="GET",status="200"}',
+                      body)
+        self.assertIn('resume_screening_jobs{status="queued"} 0', body)
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class ProfilingTests(TestCase):
+    def test_slow_requests_leave_a_bounded_number_of_profiles(self):
+        with tempfile.TemporaryDirectory() as profiles, override_settings(
+            RESUME_SCREENING_PROFILE_SLOW_SECONDS=0.05, RESUME_SCREENING_PROFILE_INTERVAL=0.001,
+            RESUME_SCREENING_PROFILE_DIR=profiles, RESUME_SCREENING_PROFILE_KEEP=2,
+        ):
+            profiler = profiling.Profiler()
+            fast = profiler.begin()
+            self.assertFalse(profiling.keeps(fast, profiler.end(fast)))
+
+            for _ in range(3):
+                capture = profiler.begin()
+                busy(0.2)
+                duration = profiler.end(capture)
+                self.assertTrue(profiling.keeps(capture, duration))
+                path = profiling.write(capture, duration, {"path": "/", "view": "upload_resume", "resume_size": 1234})
+
+            self.assertEqual(len(list(Path(profiles).glob("*.collapsed"))), 2)
+            header, *stacks = Path(path).read_text().splitlines()
+            self.assertEqual(json.loads(header[2:])["resume_size"], 1234)
+            self.assertTrue(any("resume_screening.tests:busy" in stack for stack in stacks))
+
+    def test_sampled_requests_track_peak_memory(self):
+        with override_settings(RESUME_SCREENING_PROFILE_SAMPLE_RATE=1.0, RESUME_SCREENING_PROFILE_INTERVAL=0.001,
+                               RESUME_SCREENING_PROFILE_MEMORY_THRESHOLD=1024 * 1024):
+            profiler = profiling.Profiler()
+            capture = profiler.begin()
+            block = bytearray(4 * 1024 * 1024)
+            busy(0.05)
+            del block
+            duration = profiler.end(capture)
+            self.assertGreaterEqual(capture.peak_memory, 4 * 1024 * 1024)
+            self.assertTrue(profiling.keeps(capture, duration))
@@ -5,11 +5,21 @@ from django.shortcuts import render
 urlpatterns = [
     path("", views.upload_resume, name="upload_resume"),
     path("result/<int:resume_id>/", views.resume_result, name="resume_result"),
+    path("result/job/<int:job_id>/", views.job_result, name="job_result"),
+    path("jobs/stats/", views.job_queue_stats, name="job_queue_stats"),
+    path("jobs/<int:job_id>/", views.job_status, name="job_status"),
     path("login/", views.user_login, name="user_login"),
     path("signup/", views.user_signup, name="user_signup"),
     path("logout/", views.user_logout, name="user_logout"),
     path("ranking_chart/", views.ranking_chart, name="ranking_chart"),
     path("ranking/", views.ranking_chart, name="ranking_page"),
+    path("cache/stats/", views.parse_cache_stats, name="parse_cache_stats"),
+    path("metrics", views.metrics_endpoint, name="metrics"),
+    path("search/", views.search_resumes, name="search_resumes"),
+    path("job-descriptions/", views.job_descriptions, name="job_descriptions"),
+    path("job-descriptions/<int:job_description_id>/candidates/", views.job_description_candidates,
+         name="job_description_candidates"),
+    path("result/<int:resume_id>/job-descriptions/", views.resume_job_descriptions, name="resume_job_descriptions"),
 
     # ✅ Analytics API Route
     path("analytics_dashboard/", views.analytics_dashboard, name="analytics_dashboard"),
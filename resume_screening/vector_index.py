@@ -0,0 +1,242 @@
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+# Bump when the on-disk layout below changes
+VECTOR_FORMAT = 1
+
+META_FILE = "meta.json"
+RECORDS_FILE = "records.bin"
+IVF_FILE = "ivf.npz"
+
+# Rows scored per matrix product when assigning rows to IVF lists
+ASSIGN_CHUNK = 65536
+
+
+class VectorStore:
+    """
+    Float32 vectors keyed by integer id (a resume or job description id), in one
+    append-only file of fixed-size (id, vector) records that is memory-mapped for search.
+
+    Adding a vector for an id that already has one supersedes it and removing an id
+    appends a NaN tombstone, so every change is a single append that other processes pick
+    up on their next search. compact() rewrites the file without dead records.
+
+    Searches are brute force (one matrix-vector product over every record) unless an IVF
+    index has been built with build_ivf(): then only the rows in the `nprobe` lists whose
+    centroids are closest to the query, plus rows added since the build, are scored.
+    """
+
+    def __init__(self, path, dim):
+        self.path = path
+        self.dim = dim
+        self.dtype = np.dtype([("id", "<i8"), ("vector", "<f4", (dim,))])
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.records = np.zeros(0, dtype=self.dtype)
+        self.inode = None
+        self.position = np.full(0, -1, dtype=np.int64)  # id -> row of its latest record, -1 if none
+        self.dead = np.zeros(0, dtype=bool)              # row -> is a tombstone
+        self.live = np.zeros(0, dtype=bool)              # row -> latest record of an id, not a tombstone
+        self.ivf = None
+        self.ivf_mtime = None
+
+    @property
+    def records_path(self):
+        return os.path.join(self.path, RECORDS_FILE)
+
+    @property
+    def ivf_path(self):
+        return os.path.join(self.path, IVF_FILE)
+
+    def _ensure_dir(self):
+        os.makedirs(self.path, exist_ok=True)
+        meta_path = os.path.join(self.path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta != {"format": VECTOR_FORMAT, "dim": self.dim}:
+                raise ValueError(
+                    f"{self.path} holds {meta.get('dim')}-d vectors (format {meta.get('format')}); "
+                    f"delete it and run `manage.py build_vector_index --backfill` to re-embed"
+                )
+        else:
+            with open(meta_path, "w") as f:
+                json.dump({"format": VECTOR_FORMAT, "dim": self.dim}, f)
+
+    def add(self, ids, vectors):
+        """
+        Appends (id, vector) records; vectors should be unit length for cosine scores.
+        """
+        records = np.zeros(len(ids), dtype=self.dtype)
+        records["id"] = ids
+        records["vector"] = vectors
+        with self.lock:
+            self._ensure_dir()
+            # One write per batch; readers ignore a partially written trailing record
+            with open(self.records_path, "ab") as f:
+                f.write(records.tobytes())
+
+    def remove(self, ids):
+        self.add(ids, np.full((len(ids), self.dim), np.nan, dtype=np.float32))
+
+    def refresh(self):
+        """
+        Maps the records appended since the last call, by this or another process, and
+        returns a consistent (records, live, position, ivf) snapshot.
+        """
+        with self.lock:
+            try:
+                stat = os.stat(self.records_path)
+            except FileNotFoundError:
+                self._reset()
+                return self.records, self.live, self.position, self.ivf
+            if stat.st_ino != self.inode:
+                self._reset()  # Compacted (replaced) by another process
+                self.inode = stat.st_ino
+            size = stat.st_size // self.dtype.itemsize
+            start = len(self.records)
+            if size > start:
+                records = np.memmap(self.records_path, dtype=self.dtype, mode="r", shape=(size,))
+                new = records[start:]
+                ids = np.asarray(new["id"])
+                if ids.max() >= len(self.position):
+                    grown = np.full(max(int(ids.max()) + 1, 2 * len(self.position)), -1, dtype=np.int64)
+                    grown[:len(self.position)] = self.position
+                    self.position = grown
+                np.maximum.at(self.position, ids, np.arange(start, size))
+                self.dead = np.concatenate([self.dead, np.isnan(new["vector"][:, 0])])
+                live = np.zeros(size, dtype=bool)
+                latest = self.position[self.position >= 0]
+                live[latest] = ~self.dead[latest]
+                self.records, self.live = records, live
+            self._refresh_ivf()
+            return self.records, self.live, self.position, self.ivf
+
+    def _refresh_ivf(self):
+        try:
+            mtime = os.stat(self.ivf_path).st_mtime_ns
+        except FileNotFoundError:
+            self.ivf, self.ivf_mtime = None, None
+            return
+        if mtime != self.ivf_mtime:
+            with np.load(self.ivf_path) as data:
+                ivf = {name: data[name] for name in data.files}
+            # An index built before a compaction refers to rows that no longer exist
+            self.ivf = ivf if int(ivf["rows"]) <= len(self.records) and int(ivf["inode"]) == self.inode else None
+            self.ivf_mtime = mtime
+
+    def __len__(self):
+        _, live, _, _ = self.refresh()
+        return int(live.sum())
+
+    def ids(self):
+        records, live, _, _ = self.refresh()
+        return np.asarray(records["id"][live])
+
+    def get(self, item_id):
+        """
+        The current vector of an id, or None.
+        """
+        records, live, position, _ = self.refresh()
+        row = position[item_id] if 0 <= item_id < len(position) else -1
+        if row < 0 or not live[row]:
+            return None
+        return np.array(records["vector"][row])
+
+    def search(self, query, k=10, exact=False, nprobe=16, exclude=()):
+        """
+        The k ids whose vectors have the highest dot product with the query, as
+        (id, score) pairs, best first. Uses the IVF index when there is one, unless exact.
+        """
+        records, live, _, ivf = self.refresh()
+        if not len(records) or k <= 0:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+
+        if ivf is None or exact:
+            scores = records["vector"] @ query
+            scores[~live] = -np.inf  # Also hides tombstones, whose NaN scores would sort first
+            rows = None
+        else:
+            probes = np.argsort(ivf["centroids"] @ query)[::-1][:nprobe]
+            offsets = ivf["offsets"]
+            rows = np.concatenate(
+                [ivf["order"][offsets[p]:offsets[p + 1]] for p in probes]
+                + [np.arange(int(ivf["rows"]), len(records))]
+            )
+            rows = rows[live[rows]]
+            scores = records["vector"][rows] @ query
+
+        if exclude:
+            ids = records["id"] if rows is None else records["id"][rows]
+            scores[np.isin(ids, list(exclude))] = -np.inf
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        best = best[np.isfinite(scores[best])]
+        found = best if rows is None else rows[best]
+        return [(int(records["id"][row]), float(scores[i])) for row, i in zip(found, best)]
+
+    def compact(self):
+        """
+        Rewrites the records file with only the current vector of each id. Any IVF index
+        is dropped (its row numbers no longer apply); returns the number of records kept.
+        """
+        records, live, _, _ = self.refresh()
+        if not os.path.exists(self.records_path):
+            return 0
+        live_records = np.array(records[live])
+        with self.lock:
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(live_records.tobytes())
+                # Keep whatever was appended while the live records were being copied
+                with open(self.records_path, "rb") as current:
+                    current.seek(len(records) * self.dtype.itemsize)
+                    f.write(current.read())
+            os.replace(tmp, self.records_path)
+            if os.path.exists(self.ivf_path):
+                os.unlink(self.ivf_path)
+        self.refresh()
+        return len(live_records)
+
+    def build_ivf(self, n_lists=None, sample_size=100_000, random_state=0):
+        """
+        Clusters the current vectors (k-means on a sample) and stores, per cluster, the rows
+        closest to its centroid, for approximate search. Returns the number of lists.
+        """
+        from sklearn.cluster import MiniBatchKMeans
+
+        records, live, _, _ = self.refresh()
+        rows = np.flatnonzero(live)
+        if not len(rows):
+            raise ValueError("No vectors to index")
+        n_lists = min(n_lists or max(1, int(np.sqrt(len(rows)))), len(rows))
+
+        rng = np.random.default_rng(random_state)
+        sample = np.sort(rng.choice(rows, size=min(sample_size, len(rows)), replace=False))
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, n_init=1, batch_size=4096, random_state=random_state)
+        centroids = kmeans.fit(records["vector"][sample]).cluster_centers_.astype(np.float32)
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+
+        assignment = np.empty(len(rows), dtype=np.int64)
+        for start in range(0, len(rows), ASSIGN_CHUNK):
+            chunk = rows[start:start + ASSIGN_CHUNK]
+            assignment[start:start + ASSIGN_CHUNK] = np.argmax(records["vector"][chunk] @ centroids.T, axis=1)
+        by_list = np.argsort(assignment, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=n_lists))])
+
+        with self.lock:
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".tmp-", suffix=".npz")
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, centroids=centroids, order=rows[by_list], offsets=offsets,
+                         rows=np.int64(len(records)), inode=np.int64(os.stat(self.records_path).st_ino))
+            os.replace(tmp, self.ivf_path)
+        self.refresh()
+        return n_lists
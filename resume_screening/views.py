@@ -1,248 +1,273 @@
-import os
-import pickle
-import io
 import json
-import pandas as pd
-from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.conf import settings
+from django.core.cache import cache
+from django.shortcuts import render, redirect, get_object_or_404
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.http import Http404, HttpResponse, JsonResponse
+from django.core.paginator import InvalidPage, PageNotAnInteger
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
-from .models import Resume
-from .parser import extract_text_from_pdf, extract_features, analyze_sentiment,analyze_skills_gap
-from collections import Counter
-
-# ✅ Load trained ML model
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-model_path = os.path.join(BASE_DIR, "resume_ranking_model.pkl")
-
-try:
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
-    print("✅ Model Loaded Successfully!")
-except FileNotFoundError:
-    print("❌ Model file not found. Train the model first by running m1_model.py.")
-    model = None
-
-def analytics_dashboard(request):
-    resumes = Resume.objects.all().order_by("-ranking_score")[:10]  # Get top 10 ranked resumes
-
-    # Extract data for charts
-    all_skills = []
-    ranking_scores = []
-    candidate_names = []
-    education_levels = []
-    sentiments = {"Positive": 0, "Neutral": 0, "Negative": 0}
-
-    for resume in resumes:
-        ranking_scores.append(resume.ranking_score)
-        candidate_names.append(resume.name)
-        education_levels.append(resume.education)
-        all_skills.extend(resume.skills.split(", "))
-        sentiments[resume.sentiment] += 1
-
-    # Count most common skills
-    skill_counts = Counter(all_skills).most_common(10)
-    skills, skill_freqs = zip(*skill_counts) if skill_counts else ([], [])
-
-    # Count education levels
-    education_counts = Counter(education_levels)
+from .models import JobDescription, Resume, ScreeningJob
+from . import analytics, http_cache, jobs, leaderboard, matching, metrics, offload, parse_cache, search, skills_gap
 
-    return JsonResponse({
-        "skills": list(skills),
-        "skill_freqs": list(skill_freqs),
-        "ranking_scores": ranking_scores,
-        "candidate_names": candidate_names,
-        "education_levels": list(education_counts.keys()),
-        "education_counts": list(education_counts.values()),
-        "sentiments": sentiments,
-    })
+async def analytics_dashboard(request):
+    # ✅ Served from the response cache until resumes change; polls of an unchanged pool get a 304
+    return await http_cache.json_response(request, "analytics_dashboard", analytics_dashboard_data)
 
 
-def upload_resume(request):
-    if request.method == "POST" and request.FILES.get("resume"):
-        resume_file = request.FILES["resume"]
-        pdf_bytes = resume_file.read()
-        resume_text = extract_text_from_pdf(io.BytesIO(pdf_bytes))
+async def analytics_dashboard_data():
+    resumes = await offload.run_blocking(leaderboard.top, 10)  # Top 10 ranked resumes, from the cached leaderboard
+    # ✅ Skill, education, sentiment and score figures cover the whole pool, read from the
+    # incrementally maintained counters instead of re-splitting skills on every request
+    pool = await offload.run_blocking(analytics.summary, 10)
 
-        features = extract_features(resume_text)
+    skills, skill_freqs = zip(*pool["skills"]) if pool["skills"] else ([], [])
 
-        # Extracted Features
-        candidate_name = features.get("name", "Unknown").split("-")[-1].strip()
-        candidate_email = features.get("email", "Not Provided")
-        candidate_phone = features.get("phone", "Not Provided")
-        candidate_experience = float(features.get("experience", 0))
+    return {
+        "skills": list(skills),
+        "skill_freqs": list(skill_freqs),
+        "ranking_scores": [resume["ranking_score"] for resume in resumes],
+        "candidate_names": [resume["name"] for resume in resumes],
+        "education_levels": list(pool["education"].keys()),
+        "education_counts": list(pool["education"].values()),
+        "sentiments": pool["sentiments"],
+        "score_buckets": [f"{low}-{low + analytics.SCORE_BUCKET_WIDTH}" for low in pool["scores"]],
+        "score_counts": list(pool["scores"].values()),
+        "total_resumes": pool["total"],
+    }
 
-        edu_mapping = {"Diploma": 0, "Bachelors": 1, "Masters": 2, "PhD": 3}
-        education_level = edu_mapping.get(features.get("education", "Bachelors"), 1)
 
-        skills_list = features["skills"].split(",") if features["skills"] else []
-        skills_count = len(skills_list)
+async def upload_resume(request):
+    if request.method == "POST" and request.FILES.get("resume"):
+        # ✅ Refuse oversized files before storing or parsing anything
+        max_size = getattr(settings, "RESUME_SCREENING_MAX_UPLOAD_SIZE", None)
+        if max_size and request.FILES["resume"].size > max_size:
+            error = f"Resume is too large (limit {max_size // (1024 * 1024)} MB)."
+            if "application/json" in request.headers.get("Accept", ""):
+                return JsonResponse({"error": error}, status=413)
+            messages.error(request, error)
+            return await offload.run_blocking(render, request, "resume_screening/upload.html", status=413)
+
+        # ✅ Persist the upload and hand it to the background workers (hashing and file
+        # storage are blocking, so they run on the bounded I/O pool)
+        job = await offload.run_blocking(jobs.enqueue, request.FILES["resume"])
+
+        if "application/json" in request.headers.get("Accept", ""):
+            return JsonResponse(
+                {"job_id": job.id, "status_url": reverse("job_status", args=[job.id])}, status=202
+            )
+        return redirect("job_result", job_id=job.id)
 
-        # Recommend Job Roles and Missing Skills
-        recommended_roles, missing_skills = recommend_job_roles(skills_list, candidate_experience)
+    # ✅ The page shows the signed-in state, and request.user loads the session and user
+    # with the sync ORM, so render off the event loop
+    return await offload.run_blocking(render, request, "resume_screening/upload.html")
 
-        # Prepare Input for Model
-        input_data = pd.DataFrame([[education_level, candidate_experience, skills_count]],
-                                  columns=["education", "experience", "skills"])
 
-        ranking_score = model.predict(input_data)[0] if model else 0
+def job_status(request, job_id):
+    job = get_object_or_404(ScreeningJob, id=job_id)
+    return JsonResponse(jobs.job_status(job))
 
-        sentiment = analyze_sentiment(resume_text)
 
-        # ✅ Check if the resume already exists
-        existing_resume = Resume.objects.filter(email=candidate_email, phone=candidate_phone).first()
+def job_queue_stats(request):
+    return JsonResponse(jobs.queue_stats())
 
-        if existing_resume:
-            # ✅ If resume exists, update it instead of creating a duplicate
-            existing_resume.ranking_score = ranking_score
-            existing_resume.sentiment = sentiment
-            existing_resume.recommended_roles = ", ".join(recommended_roles)
-            existing_resume.missing_skills = json.dumps(missing_skills)
-            existing_resume.save()
-            return redirect("resume_result", resume_id=existing_resume.id)
-        else:
-            # ✅ If a new resume, check the limit of stored resumes
-            max_resumes = 10
-            if Resume.objects.count() >= max_resumes:
-                oldest_resume = Resume.objects.order_by("uploaded_at").first()
-                if oldest_resume:
-                    oldest_resume.delete()
-
-            # ✅ Save the new resume
-            resume = Resume(
-                name=candidate_name,
-                email=candidate_email,
-                phone=candidate_phone,
-                education=features["education"],
-                experience=candidate_experience,
-                skills=", ".join(skills_list),
-                ranking_score=ranking_score,
-                sentiment=sentiment,
-                recommended_roles=", ".join(recommended_roles),
-                missing_skills=json.dumps(missing_skills)  # Store missing skills as JSON
-            )
-            resume.save()
 
-        return redirect("resume_result", resume_id=resume.id)
+def job_result(request, job_id):
+    job = get_object_or_404(ScreeningJob, id=job_id)
+    if job.status == ScreeningJob.DONE and job.resume_id:
+        return redirect("resume_result", resume_id=job.resume_id)
 
-    return render(request, "resume_screening/upload.html")
+    # ✅ Still queued/running (or failed): the result page polls the job status endpoint
+    return render(request, "resume_screening/result.html", {"job": job})
 
 
 
-def resume_result(request, resume_id):
+async def resume_result(request, resume_id):
     try:
-        resume = Resume.objects.get(id=resume_id)
+        resume = await Resume.objects.aget(id=resume_id)
     except Resume.DoesNotExist:
         messages.error(request, "Resume not found!")
         return redirect("upload_resume")
 
-    recommended_roles = resume.recommended_roles.split(", ") if resume.recommended_roles else []
-    sentiment = resume.sentiment
-
-    # ✅ Load missing skills from the database
-    stored_missing_skills = json.loads(resume.missing_skills) if resume.missing_skills else {}
+    if not resume.content_version:
+        # ✅ Stored before the skills gap was materialized on save (or bulk-inserted): do it once now
+        await offload.run_blocking(resume.save, update_fields=["skills_gap", "content_version"])
+
+    # ✅ Compare against the requested job description (?jd=<id>) or else the opening whose
+    # description is closest to this resume
+    job_description = None
+    if request.GET.get("jd", "").isdigit():
+        job_description = await JobDescription.objects.filter(id=int(request.GET["jd"])).afirst()
+    else:
+        best = await offload.run_blocking(matching.best_job_description_id, resume)
+        if best:
+            job_description = await JobDescription.objects.filter(id=best).afirst()
+
+    # ✅ The page only depends on the resume's content version and the job description
+    jd_content = [job_description.pk, job_description.title, job_description.skills] if job_description else None
+    etag = http_cache.etag(resume.content_version, jd_content)
+
+    def respond():
+        key = f"resume_screening:result:{resume.pk}:{etag}"
+        page = cache.get(key)
+        metrics.RESPONSE_CACHE_LOOKUPS.inc(response="resume_result", result="miss" if page is None else "hit")
+        if page is None:
+            # ✅ Missing skills of the recommended roles (materialized) plus the job description's
+            missing_skills = dict(resume.skills_gap)
+            if job_description:
+                missing_skills[job_description.title] = skills_gap.job_description_gap(resume.skills, job_description)
+            page = render_to_string("resume_screening/result.html", {
+                "resume": resume,
+                "recommended_roles": resume.recommended_roles.split(", ") if resume.recommended_roles else [],
+                "sentiment": resume.sentiment,
+                "missing_skills": missing_skills,
+            })
+            cache.set(key, page, http_cache.timeout())
+        return HttpResponse(page)
+
+    # ✅ ETag only: switching to another (older or edited) job description changes the page
+    # without moving any timestamp, so a Last-Modified date could answer 304 with a stale page
+    return http_cache.conditional(request, etag, None, respond)
+
+
+async def ranking_chart(request):
+    # ✅ Served from the response cache until resumes change; polls of an unchanged pool get a 304
+    return await http_cache.json_response(request, "ranking_chart", ranking_chart_data)
+
+
+async def ranking_chart_data():
+    # ✅ Get the top 10 resumes by ranking_score, excluding unwanted names (cached leaderboard)
+    top_resumes = await offload.run_blocking(leaderboard.top, 10, {"Unknown", "Candidate", "Not Provided", ""})
 
-    # ✅ Debug: Print missing skills from DB
-    print("Missing Skills from DB:", stored_missing_skills)
+    # ✅ Get the latest uploaded resume
+    latest_resume = await offload.run_blocking(leaderboard.latest)
 
-    # ✅ Analyze skills gap
-    job_description = "Job description here"
-    new_missing_skills = analyze_skills_gap(resume.skills, job_description)
+    # ✅ Ensure latest resume is included, in its ranked position (top_resumes is already sorted)
+    if latest_resume and all(resume["id"] != latest_resume["id"] for resume in top_resumes):
+        top_resumes = top_resumes + [latest_resume]
+        top_resumes.sort(key=leaderboard.rank_key)
 
-    # ✅ Debug: Print missing skills after analysis
-    print("Missing Skills after analyze_skills_gap:", new_missing_skills)
+    # ✅ Keep only the top 10 resumes
+    top_resumes = top_resumes[:10]
 
-    # ✅ Merge missing skills
-    merged_missing_skills = stored_missing_skills.copy()
-    for role, skills in new_missing_skills.items():
-        if role in merged_missing_skills:
-            merged_missing_skills[role] = list(set(merged_missing_skills[role] + skills))  # Remove duplicates
-        else:
-            merged_missing_skills[role] = skills
+    # ✅ Ensure all candidates have proper names
+    candidates = [
+        resume["name"].strip() if resume["name"] and resume["name"].strip() else f"Candidate {i + 1}"
+        for i, resume in enumerate(top_resumes)
+    ]
 
-    # ✅ Remove skills that the candidate already has
-    candidate_skills = set(map(str.strip, resume.skills.split(",")))  # Convert to set for easy checking
-    for role in merged_missing_skills:
-        merged_missing_skills[role] = [skill for skill in merged_missing_skills[role] if skill.strip().lower() not in candidate_skills]
+    scores = [resume["ranking_score"] for resume in top_resumes]
 
-    # ✅ Only keep missing skills for recommended roles
-    filtered_missing_skills = {
-        role: skills for role, skills in merged_missing_skills.items() if role in recommended_roles
-    }
+    return {"candidates": candidates, "scores": scores}
 
-    # ✅ Debug: Print final missing skills
-    print("Final Missing Skills Sent to Template:", filtered_missing_skills)
 
-    return render(request, "resume_screening/result.html", {
-        "resume": resume,
-        "recommended_roles": recommended_roles,
-        "sentiment": sentiment,
-        "missing_skills": filtered_missing_skills  # ✅ Pass only relevant missing skills
-    })
+def parse_cache_stats(request):
+    return JsonResponse(parse_cache.stats())
 
-def ranking_chart(request):
-    # ✅ Get the top 9 resumes by ranking_score, excluding unwanted names
-    top_resumes = list(
-        Resume.objects.exclude(name__in=["Unknown", "Candidate", "Not Provided", ""])
-        .order_by("-ranking_score")[:10]
-    )
 
-    # ✅ Get the latest uploaded resume
-    latest_resume = Resume.objects.latest("uploaded_at")
+def metrics_endpoint(request):
+    # ✅ Prometheus text format, for scraping; the figures are those of this server process
+    if not metrics.enabled():
+        raise Http404("Metrics are disabled")
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
 
-    # ✅ Ensure latest resume is included
-    if latest_resume not in top_resumes:
-        top_resumes.append(latest_resume)
 
-    # ✅ Keep only the top 10 resumes
-    top_resumes = sorted(top_resumes, key=lambda r: r.ranking_score, reverse=True)[:10]
+def job_description_json(job_description):
+    return {
+        "id": job_description.id,
+        "title": job_description.title,
+        "skills": job_description.skills.split(", ") if job_description.skills else [],
+        "created_at": job_description.created_at,
+    }
 
-    # ✅ Ensure all candidates have proper names
-    candidates = [
-        resume.name.strip() if resume.name and resume.name.strip() else f"Candidate {i + 1}"
-        for i, resume in enumerate(top_resumes)
-    ]
 
-    scores = [resume.ranking_score for resume in top_resumes]
+def match_count(request, default):
+    """The ?k= number of matches to return, or None if it is not a positive integer."""
+    k = request.GET.get("k", default)
+    if not str(k).isdigit() or int(k) < 1:
+        return None
+    return min(int(k), matching.MAX_MATCHES)
 
-    return JsonResponse({"candidates": candidates, "scores": scores})
 
+def job_descriptions(request):
+    # ✅ POST (form fields or JSON) creates a job description; GET lists them
+    if request.method == "POST":
+        if request.content_type == "application/json":
+            try:
+                data = json.loads(request.body)
+            except ValueError:
+                return JsonResponse({"error": "Invalid JSON."}, status=400)
+        else:
+            data = request.POST
+        title = str(data.get("title") or "").strip()
+        description = str(data.get("description") or "").strip()
+        if not (title and description):
+            return JsonResponse({"error": "title and description are required."}, status=400)
+        job_description = JobDescription.objects.create(title=title[:255], description=description)
+        return JsonResponse(job_description_json(job_description), status=201)
 
-def recommend_job_roles(skills, experience):
-    job_roles = {
-        "Software Engineer": ["Python", "Java", "C++", "Software Development"],
-        "Data Scientist": ["Python", "Data Analysis", "Machine Learning", "Statistics"],
-        "Web Developer": ["HTML", "CSS", "JavaScript", "React", "Node.js"],
-        "Data Analyst": ["Excel", "SQL", "Data Visualization", "Python"],
-        "Product Manager": ["Agile", "Project Management", "Team Leadership"],
-        "UX Designer": ["Design", "UX/UI", "Prototyping", "Figma"]
-    }
+    return JsonResponse({
+        "job_descriptions": [job_description_json(jd) for jd in JobDescription.objects.order_by("-created_at")]
+    })
 
-    if not skills:  # Ensure we handle the case where no skills are found
-        return ["No skills found. Try adding skills to your resume."], {}
 
-    skills = [skill.lower() for skill in skills if isinstance(skill, str)]
-    recommended_roles = []
-    missing_skills = {}
+def job_description_candidates(request, job_description_id):
+    # ✅ All resumes ranked by similarity to the job description (?k= best, ?exact=1 skips the IVF index)
+    job_description = get_object_or_404(JobDescription, id=job_description_id)
+    k = match_count(request, 20)
+    if k is None:
+        return JsonResponse({"error": "k must be a positive integer."}, status=400)
 
-    for role, required_skills in job_roles.items():
-        required_skills_lower = [skill.lower() for skill in required_skills]
+    matches = matching.rank_resumes(job_description, k=k, exact=request.GET.get("exact") in ("1", "true"))
+    rows = Resume.objects.filter(id__in=[resume_id for resume_id, _ in matches]).in_bulk()
+    return JsonResponse({
+        "job_description": job_description_json(job_description),
+        "candidates": [
+            {"id": resume_id, "name": rows[resume_id].name, "ranking_score": rows[resume_id].ranking_score,
+             "skills": rows[resume_id].skills, "similarity": round(similarity, 4)}
+            for resume_id, similarity in matches if resume_id in rows
+        ],
+    })
 
-        # Find matched skills
-        matched_skills = [skill for skill in skills if skill in required_skills_lower]
 
-        if matched_skills and experience >= 0:
-            recommended_roles.append(role)
+def resume_job_descriptions(request, resume_id):
+    # ✅ Job descriptions that best fit one resume
+    resume = get_object_or_404(Resume, id=resume_id)
+    k = match_count(request, 5)
+    if k is None:
+        return JsonResponse({"error": "k must be a positive integer."}, status=400)
 
-            # Ensure we add missing skills even if there are matches
-            missing = [skill for skill in required_skills_lower if skill not in skills]
+    matches = matching.best_job_descriptions(resume, k=k)
+    rows = JobDescription.objects.in_bulk([jd_id for jd_id, _ in matches])
+    return JsonResponse({
+        "resume_id": resume.id,
+        "job_descriptions": [
+            dict(job_description_json(rows[jd_id]), similarity=round(similarity, 4))
+            for jd_id, similarity in matches if jd_id in rows
+        ],
+    })
 
-            if missing:  # Only add if some skills are missing
-                missing_skills[role] = missing
 
-    return recommended_roles, missing_skills
+def search_resumes(request):
+    # ✅ e.g. /search/?skills=python,sql&exclude=java&page=2, best-ranked candidates first
+    required = search.parse_skills(request.GET.get("skills"))
+    excluded = search.parse_skills(request.GET.get("exclude"))
+    if not (required or excluded):
+        return JsonResponse({"error": "Pass skills and/or exclude."}, status=400)
+    try:
+        per_page = int(request.GET.get("per_page", 20))
+    except ValueError:
+        return JsonResponse({"error": "per_page must be an integer."}, status=400)
 
+    try:
+        page = search.search(required, excluded, page=request.GET.get("page", 1), per_page=per_page)
+    except PageNotAnInteger as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    except InvalidPage as e:
+        return JsonResponse({"error": str(e)}, status=404)
+    return JsonResponse(page)
 
 
 # ✅ User Authentication (Login, Signup, Logout)
@@ -43,6 +43,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'resume_screening.middleware.RequestMetricsMiddleware',
+    'resume_screening.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -80,6 +82,14 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Upload workers write concurrently: take the write lock when a transaction
+            # starts instead of failing with "database is locked" when it upgrades
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
+        # On disk, so tests can share the database between threads
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
@@ -122,10 +132,106 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'resume_screening/static'),
 ]
+
+# Uploaded resumes
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-
-
+# Resume screening
+# Number of best-covered job roles recommended for each resume
+RESUME_SCREENING_TOP_ROLES = 5
+
+# spaCy is loaded lazily on first use. "fast" only runs NER when the name heuristic on the
+# first lines fails; "full" runs the pipeline over every resume.
+RESUME_SCREENING_NLP_MODE = "fast"
+RESUME_SCREENING_SPACY_MODEL = "en_core_web_sm"
+RESUME_SCREENING_SPACY_DISABLE = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+# Parsed-resume cache keyed by a hash of the uploaded bytes (least recently used evicted)
+RESUME_SCREENING_PARSE_CACHE_SIZE = 1000
+
+# Background screening queue. Uploads are stored and screened by worker threads started in
+# each web process (set RESUME_SCREENING_JOB_WORKERS = 0 to use `manage.py run_screening_worker`).
+RESUME_SCREENING_JOB_WORKERS = 2
+RESUME_SCREENING_JOB_MAX_ATTEMPTS = 3
+RESUME_SCREENING_JOB_TIMEOUT = 300  # seconds before a running job is considered abandoned
+
+# Bounded executors: threads for blocking I/O called from async views, processes for
+# CPU-heavy PDF parsing (0 parses in the calling worker thread instead)
+RESUME_SCREENING_IO_WORKERS = 8
+RESUME_SCREENING_CPU_WORKERS = 2
+
+# PDF extraction limits: contact details and skills are almost always on the first pages.
+# Uploads above the size limit are rejected; extraction stops at whichever limit is hit first.
+RESUME_SCREENING_MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+RESUME_SCREENING_PDF_MAX_PAGES = 5
+RESUME_SCREENING_PDF_MAX_CHARS = 50_000
+RESUME_SCREENING_PDF_TIME_BUDGET = 10.0  # seconds, checked between pages
+# "auto" uses the fastest installed engine (pypdfium2, then pdftotext, then pdfminer);
+# "pdfminer-quick" is pdfminer without layout analysis
+RESUME_SCREENING_PDF_BACKEND = "auto"
+
+# Precomputed ranking scores for every (education level, years of experience, skills count)
+# up to these inclusive bounds, built when the model loads; None scores every row with the model
+RESUME_SCREENING_SCORE_TABLE_BOUNDS = (3, 40, 60)
+
+# Trained ranking model versions (`manage.py train_ranker`); workers switch to a newly
+# activated version within a few seconds
+RESUME_SCREENING_MODEL_REGISTRY = BASE_DIR / "models"
+
+# Best-ranked resumes kept in memory for the ranking chart and dashboard (updated on save/delete)
+RESUME_SCREENING_LEADERBOARD_SIZE = 100
+
+# Largest page the skill search endpoint (/search/?skills=...) returns
+RESUME_SCREENING_SEARCH_MAX_PAGE_SIZE = 100
+
+# Resume and job description embeddings (hashed bag of words + skills, no network), stored
+# as memory-mapped float32 vectors for job matching
+RESUME_SCREENING_VECTOR_INDEX = BASE_DIR / "vectors"
+RESUME_SCREENING_EMBEDDING_DIM = 512
+# IVF lists scanned per approximate search, once `manage.py build_vector_index --ivf` has run
+RESUME_SCREENING_VECTOR_NPROBE = 16
+
+# Retention: `manage.py purge_resumes` (cron, or --every) moves the oldest resumes beyond the
+# live set size, and any older than the age limit (None: no limit), to gzipped JSON-lines
+# files in the archive directory, a batch per transaction
+RESUME_SCREENING_MAX_RESUMES = 10
+RESUME_SCREENING_MAX_RESUME_AGE_DAYS = None
+RESUME_SCREENING_ARCHIVE_DIR = BASE_DIR / "archive"
+RESUME_SCREENING_PURGE_BATCH_SIZE = 1000
+
+# Leaderboard generation and cached responses. Local memory is per process: with several
+# server processes, or for management commands (screen_resumes, purge_resumes) to invalidate
+# the server's cached responses immediately, use a shared backend such as
+# django.core.cache.backends.filebased.FileBasedCache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    }
+}
+# Seconds result pages, the ranking chart and the dashboard data stay cached (they are also
+# dropped as soon as resumes or job descriptions change in this process)
+RESUME_SCREENING_RESPONSE_CACHE_TIMEOUT = 300
+
+# Request timing middleware and the Prometheus /metrics endpoint (request latency per view,
+# screening stage latency, upload sizes, parse failures, cache hits, queue depth). Each
+# server process reports its own figures
+RESUME_SCREENING_METRICS = True
+
+# Sampling profiler for resume_screening requests, off unless a sample rate or slow threshold
+# is set: RESUME_SCREENING_PROFILE_SAMPLE_RATE of requests are profiled throughout with
+# tracemalloc peak memory, and requests still running after RESUME_SCREENING_PROFILE_SLOW_SECONDS
+# from then on. Slow requests, and sampled ones peaking above the memory threshold (bytes),
+# leave collapsed-stack files (flamegraph.pl, speedscope) in the profile directory, of which
+# the newest RESUME_SCREENING_PROFILE_KEEP are kept
+RESUME_SCREENING_PROFILE_SAMPLE_RATE = 0.0
+RESUME_SCREENING_PROFILE_SLOW_SECONDS = None
+RESUME_SCREENING_PROFILE_MEMORY_THRESHOLD = 64 * 1024 * 1024
+RESUME_SCREENING_PROFILE_INTERVAL = 0.005
+RESUME_SCREENING_PROFILE_DIR = BASE_DIR / "profiles"
+RESUME_SCREENING_PROFILE_KEEP = 50